@@ -1,37 +1,86 @@
 # backend/database/connection.py
 import os
+import asyncio
+import threading
+from contextlib import contextmanager, asynccontextmanager
 from dotenv import load_dotenv
 import psycopg
-from psycopg_pool import ConnectionPool
+from psycopg_pool import ConnectionPool, AsyncConnectionPool
 
 load_dotenv()
 
+# pool sizing, per process
+POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
 # Create a connection pool for better performance
 _pool = None
+_async_pool = None
+_pool_lock = threading.Lock()
+_async_pool_lock = asyncio.Lock()
+# optional callback run on every new pooled connection (see configure_connections)
+_configure = None
+
+
+def _conninfo():
+    return (
+        f"host={os.getenv('DB_HOST', 'localhost')} "
+        f"port={os.getenv('DB_PORT', '5432')} "
+        f"dbname={os.getenv('DB_NAME', 'gsoc')} "
+        f"user={os.getenv('DB_USER', 'postgres')} "
+        f"password={os.getenv('DB_PASS', '')}"
+    )
+
 
 def get_pool():
     """Get or create the connection pool."""
     global _pool
     if _pool is None:
-        _pool = ConnectionPool(
-            conninfo=f"host={os.getenv('DB_HOST', 'localhost')} "
-                     f"port={os.getenv('DB_PORT', '5432')} "
-                     f"dbname={os.getenv('DB_NAME', 'gsoc')} "
-                     f"user={os.getenv('DB_USER', 'postgres')} "
-                     f"password={os.getenv('DB_PASS', '')}",
-            min_size=2,
-            max_size=10,
-            timeout=30,
-            open=False  # Don't open pool immediately
-        )
-        _pool.open()  # Open when first requested
+        with _pool_lock:
+            if _pool is None:
+                pool = ConnectionPool(
+                    conninfo=_conninfo(),
+                    min_size=POOL_MIN_SIZE,
+                    max_size=POOL_MAX_SIZE,
+                    timeout=POOL_TIMEOUT,
+                    configure=_configure,
+                    open=False  # Don't open pool immediately
+                )
+                pool.open()  # Open when first requested
+                _pool = pool
     return _pool
 
+
+def configure_connections(fn):
+    """
+    Register fn(conn), called on each connection the pool opens (e.g. to
+    set a cursor_factory that counts queries in benchmarks). Must be
+    called before the pool is created.
+    """
+    global _configure
+    _configure = fn
+
+
+@contextmanager
+def pooled_conn():
+    """
+    Borrow a connection from the pool.
+    Commits when the block exits cleanly, rolls back on error, and always
+    returns the connection to the pool:
+
+        with pooled_conn() as conn:
+            with conn.cursor() as cur:
+                ...
+    """
+    with get_pool().connection() as conn:
+        yield conn
+
+
 def get_conn():
     """
-    Returns a connection from the pool.
-    For backward compatibility, returns a regular connection.
-    Consider using get_pool().connection() for better performance.
+    Opens a dedicated, unpooled connection (caller must close it).
+    Only for one-off scripts; services should use pooled_conn().
     """
     return psycopg.connect(
         host=os.getenv("DB_HOST", "localhost"),
@@ -42,9 +91,45 @@ def get_conn():
         autocommit=False
     )
 
+
 def close_pool():
     """Close the connection pool. Call this on application shutdown."""
     global _pool
-    if _pool is not None:
-        _pool.close()
-        _pool = None
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+async def get_async_pool():
+    """Get or create the async connection pool (for async def routes)."""
+    global _async_pool
+    if _async_pool is None:
+        async with _async_pool_lock:
+            if _async_pool is None:
+                pool = AsyncConnectionPool(
+                    conninfo=_conninfo(),
+                    min_size=POOL_MIN_SIZE,
+                    max_size=POOL_MAX_SIZE,
+                    timeout=POOL_TIMEOUT,
+                    open=False
+                )
+                await pool.open()
+                _async_pool = pool
+    return _async_pool
+
+
+@asynccontextmanager
+async def async_pooled_conn():
+    """Async counterpart of pooled_conn()."""
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        yield conn
+
+
+async def close_async_pool():
+    """Close the async connection pool. Call this on application shutdown."""
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
@@ -1,32 +1,80 @@
-CREATE TABLE orgs (
+CREATE TABLE IF NOT EXISTS orgs (
     org_slug TEXT PRIMARY KEY,       -- unique slug from website
     org_id TEXT,                     -- GSoC numeric ID
     name TEXT,
     category TEXT,
     tagline TEXT,
-    image_url TEXT,
-    bg_color TEXT,
-    topics JSONB,
-    tech_tags JSONB,
-    years_participated JSONB,
-    description TEXT
+    description TEXT,
+    description_html TEXT,
+    technologies TEXT[],             -- gsocorganizations.dev list
+    tech_tags TEXT[],                -- Google archive tags
+    topics TEXT[],
+    topic_tags TEXT[],
+    website_url TEXT,
+    gsoc_url TEXT,
+    ideas_list_url TEXT,
+    logo_url TEXT,
+    logo_bg_color TEXT,
+    contact_links JSONB,
+    years_participated INT[],
+    created_at TIMESTAMP DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- GET /orgs/ filters (keyset pagination walks the org_slug primary key)
+CREATE INDEX IF NOT EXISTS idx_orgs_tech_tags ON orgs USING GIN (tech_tags);
+CREATE INDEX IF NOT EXISTS idx_orgs_topic_tags ON orgs USING GIN (topic_tags);
+CREATE INDEX IF NOT EXISTS idx_orgs_years_participated ON orgs USING GIN (years_participated);
+CREATE INDEX IF NOT EXISTS idx_orgs_category ON orgs (category, org_slug);
+
+-- org-collector-service: alias -> canonical org slug. The master list
+-- derives slugs from names while Google's archive has real ones, so the
+-- same org is matched on slug, normalized name and website before upserts
+CREATE TABLE IF NOT EXISTS org_aliases (
+    alias_type TEXT NOT NULL,         -- 'slug' | 'name' | 'website'
+    alias TEXT NOT NULL,              -- normalized value
+    org_slug TEXT NOT NULL,           -- canonical slug
+    source TEXT NOT NULL,             -- 'google' | 'derived' | 'merge'
+    created_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (alias_type, alias)
 );
 
-CREATE TABLE org_projects (
+CREATE INDEX IF NOT EXISTS idx_org_aliases_org_slug ON org_aliases (org_slug);
+
+CREATE TABLE IF NOT EXISTS org_projects (
     project_id TEXT PRIMARY KEY,     -- GSoC project slug
+    project_slug TEXT,
     org_slug TEXT REFERENCES orgs(org_slug),
-
+    organization_name TEXT,
     year INT,
     title TEXT,
-    tech_tags JSONB,
-    topic_tags JSONB,
+    short_abstract TEXT,
+    long_abstract_html TEXT,
+    mentor_names TEXT[],
+    contributor_display_name TEXT,
+    tech_tags TEXT[],
+    topic_tags TEXT[],
+    project_code_url TEXT,
+    project_url TEXT,
     status TEXT,
-    contributor TEXT,
-    mentors JSONB,
-    abstract TEXT,
-    project_url TEXT
+    date_created TIMESTAMPTZ,
+    date_archived TIMESTAMPTZ,
+    created_at TIMESTAMP DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW()
 );
 
+CREATE INDEX IF NOT EXISTS idx_org_projects_org_year ON org_projects (org_slug, year);
+
+-- full-text search over title + abstracts (HTML tags stripped), for GET /orgs/projects/search
+ALTER TABLE org_projects ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(short_abstract, '')), 'B') ||
+        setweight(to_tsvector('english',
+            regexp_replace(coalesce(long_abstract_html, ''), '<[^>]*>', ' ', 'g')), 'C')
+    ) STORED;
+CREATE INDEX IF NOT EXISTS idx_org_projects_search ON org_projects USING GIN (search_tsv);
+
 
 
 -- user-profile-service 
@@ -46,3 +94,132 @@ CREATE TABLE IF NOT EXISTS users (
 
 -- optional index for quick lookup by github_username
 CREATE INDEX IF NOT EXISTS idx_users_github_username ON users (github_username);
+
+-- "find users by skill": && / @> on the arrays
+CREATE INDEX IF NOT EXISTS idx_users_languages ON users USING GIN (languages);
+CREATE INDEX IF NOT EXISTS idx_users_interests ON users USING GIN (interests);
+
+-- org-collector-service: fingerprint of the last payload written per org-year,
+-- so an incremental sync can skip unchanged orgs (year 0 = master list entry)
+CREATE TABLE IF NOT EXISTS sync_fingerprints (
+    org_slug TEXT NOT NULL,
+    year INT NOT NULL,
+    scope TEXT NOT NULL,             -- 'master' | 'yearly' | 'details'
+    fingerprint TEXT NOT NULL,       -- sha256 of the fetched payload
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (org_slug, year, scope)
+);
+
+-- org-collector-service: persisted sync jobs with per-year / per-org checkpoints
+CREATE TABLE IF NOT EXISTS sync_status (
+    name TEXT PRIMARY KEY,
+    last_synced TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS sync_jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,                 -- 'running' | 'finished' | 'finished_with_errors' | 'failed'
+    params JSONB NOT NULL,                -- modes the job was started with
+    master_done BOOLEAN NOT NULL DEFAULT FALSE,
+    years_listed INT[] NOT NULL DEFAULT '{}',       -- yearly lists already written
+    year_totals JSONB NOT NULL DEFAULT '{}'::jsonb, -- {"2016": n_orgs, ...}
+    orgs_done INT NOT NULL DEFAULT 0,
+    projects_done INT NOT NULL DEFAULT 0,
+    errors INT NOT NULL DEFAULT 0,
+    last_error TEXT,
+    orgs_at_resume INT NOT NULL DEFAULT 0,     -- counters when the current run started,
+    projects_at_resume INT NOT NULL DEFAULT 0, -- used for throughput
+    started_at TIMESTAMP DEFAULT NOW(),
+    resumed_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT NOW(),   -- last progress
+    heartbeat_at TIMESTAMP DEFAULT NOW(), -- last sign of life (bumped on a timer)
+    finished_at TIMESTAMP
+);
+
+ALTER TABLE sync_jobs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP DEFAULT NOW();
+
+CREATE TABLE IF NOT EXISTS sync_job_checkpoints (
+    job_id TEXT NOT NULL REFERENCES sync_jobs(job_id) ON DELETE CASCADE,
+    year INT NOT NULL,
+    org_slug TEXT NOT NULL,
+    PRIMARY KEY (job_id, year, org_slug)
+);
+
+DROP INDEX IF EXISTS idx_sync_jobs_running;
+CREATE INDEX IF NOT EXISTS idx_sync_jobs_heartbeat ON sync_jobs (heartbeat_at) WHERE status = 'running';
+
+-- repo-collector-service: GitHub repositories of GSoC orgs
+CREATE TABLE IF NOT EXISTS repos (
+    full_name TEXT PRIMARY KEY,       -- owner/name
+    org_slug TEXT REFERENCES orgs(org_slug),
+    owner TEXT,
+    name TEXT,
+    description TEXT,
+    url TEXT,
+    homepage_url TEXT,
+    primary_language TEXT,
+    topics TEXT[],
+    stars INT,
+    forks INT,
+    is_archived BOOLEAN,
+    license TEXT,
+    pushed_at TIMESTAMPTZ,
+    -- snapshot metrics (batched GraphQL totalCounts)
+    open_issues INT,
+    closed_issues INT,
+    good_first_issues INT,
+    open_prs INT,
+    merged_prs INT,
+    commits_recent INT,               -- commits on the default branch in the last N days
+    last_commit_at TIMESTAMPTZ,
+    metrics_updated_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_repos_org_slug ON repos (org_slug);
+
+-- repo-analytics-service: running activity aggregates per repo, advanced
+-- incrementally from the watermark (activity after it is not folded in yet)
+CREATE TABLE IF NOT EXISTS repo_activity (
+    full_name TEXT PRIMARY KEY,       -- owner/name
+    watermark TIMESTAMPTZ,
+    history_start TIMESTAMPTZ,        -- aggregates cover history_start .. watermark
+    commits_total INT NOT NULL DEFAULT 0,
+    commits_by_week JSONB NOT NULL DEFAULT '{}'::jsonb,     -- {"2024-W18": n}
+    issues_opened INT NOT NULL DEFAULT 0,
+    issues_closed INT NOT NULL DEFAULT 0,
+    issues_by_month JSONB NOT NULL DEFAULT '{}'::jsonb,     -- {"2024-05": {"opened": n, "closed": m}}
+    prs_merged INT NOT NULL DEFAULT 0,
+    pr_merge_seconds_total BIGINT NOT NULL DEFAULT 0,
+    prs_by_month JSONB NOT NULL DEFAULT '{}'::jsonb,
+    contributors_total INT NOT NULL DEFAULT 0,
+    contributors_by_month JSONB NOT NULL DEFAULT '{}'::jsonb, -- new contributors per month
+    analyzed_at TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS repo_contributors (
+    full_name TEXT NOT NULL,
+    login TEXT NOT NULL,
+    first_seen TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (full_name, login)
+);
+
+-- scoring-ml-service: tables materialized after each org sync
+CREATE TABLE IF NOT EXISTS org_similarity (
+    org_slug TEXT NOT NULL,
+    rank INT NOT NULL,                -- 1 = most similar
+    similar_slug TEXT NOT NULL,
+    score REAL NOT NULL,              -- cosine over tech + topic tags
+    PRIMARY KEY (org_slug, rank)
+);
+
+CREATE TABLE IF NOT EXISTS org_return_scores (
+    org_slug TEXT PRIMARY KEY,
+    probability REAL NOT NULL,        -- P(org takes part in the next program)
+    streak INT NOT NULL,              -- consecutive years up to the latest program
+    years_count INT NOT NULL,
+    last_year INT,
+    projects_last_year INT NOT NULL DEFAULT 0,
+    computed_at TIMESTAMP DEFAULT NOW()
+);
@@ -0,0 +1,19 @@
+# backend/embeddings-rag-service/src/embeddings_rag/config.py
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# where index builds live; every uvicorn worker memory-maps the same files
+INDEX_DIR = os.getenv("EMBEDDINGS_INDEX_DIR", ".cache/embeddings")
+
+# width of the hashed TF-IDF vectors (columns of the float32 matrix)
+EMBED_DIM = int(os.getenv("EMBEDDINGS_DIM", "1024"))
+
+# random-hyperplane LSH: bits per hash code and number of hash tables
+LSH_BITS = int(os.getenv("EMBEDDINGS_LSH_BITS", "12"))
+LSH_TABLES = int(os.getenv("EMBEDDINGS_LSH_TABLES", "8"))
+LSH_SEED = int(os.getenv("EMBEDDINGS_LSH_SEED", "42"))
+
+# how often (seconds) a worker checks for a newer build or a finished org sync
+INDEX_CHECK_INTERVAL = float(os.getenv("EMBEDDINGS_INDEX_CHECK_INTERVAL", "30"))
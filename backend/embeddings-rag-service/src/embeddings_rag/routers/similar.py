@@ -0,0 +1,40 @@
+from fastapi import APIRouter, HTTPException, Query
+from embeddings_rag.services.index_store import get_index, current_manifest, force_rebuild
+
+router = APIRouter(prefix="/similar", tags=["similar"])
+
+
+def _results(hits):
+    return [{**item, "score": score} for item, score in hits]
+
+
+@router.get("/orgs/{org_slug}")
+def similar_orgs(org_slug: str, k: int = Query(10, ge=1, le=100), exact: bool = False):
+    hits = get_index("orgs").similar_to(org_slug, k, exact)
+    if hits is None:
+        raise HTTPException(status_code=404, detail="org not indexed")
+    return {"org_slug": org_slug, "data": _results(hits)}
+
+
+@router.get("/projects/{project_id}")
+def similar_projects(project_id: str, k: int = Query(10, ge=1, le=100), exact: bool = False):
+    hits = get_index("projects").similar_to(project_id, k, exact)
+    if hits is None:
+        raise HTTPException(status_code=404, detail="project not indexed")
+    return {"project_id": project_id, "data": _results(hits)}
+
+
+@router.get("/search")
+def search(q: str = Query(..., min_length=1), kind: str = Query("orgs", pattern="^(orgs|projects)$"),
+           k: int = Query(10, ge=1, le=100), exact: bool = False):
+    return {"q": q, "kind": kind, "data": _results(get_index(kind).search_text(q, k, exact))}
+
+
+@router.get("/index")
+def index_info():
+    return current_manifest()
+
+
+@router.post("/index/rebuild")
+def rebuild():
+    return force_rebuild()
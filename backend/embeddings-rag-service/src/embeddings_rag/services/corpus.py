@@ -0,0 +1,66 @@
+# backend/embeddings-rag-service/src/embeddings_rag/services/corpus.py
+from psycopg.rows import dict_row
+from database.connect import pooled_conn
+from embeddings_rag.services.features import strip_html
+
+ORGS_SQL = """
+    SELECT org_slug, name, tagline, description, description_html, technologies, topics
+    FROM orgs ORDER BY org_slug
+"""
+
+PROJECTS_SQL = """
+    SELECT project_id, org_slug, year, title, short_abstract, long_abstract_html, tech_tags
+    FROM org_projects ORDER BY project_id
+"""
+
+
+def _join(*parts):
+    out = []
+    for p in parts:
+        if isinstance(p, list):
+            out.append(" ".join(p))
+        elif p:
+            out.append(p)
+    return "\n".join(out)
+
+
+def _fetch(sql: str):
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(sql)
+            return cur.fetchall()
+
+
+def load_org_docs():
+    """(items, texts) for every org: name, tagline, descriptions and tags."""
+    rows = _fetch(ORGS_SQL)
+    items = [{"id": r["org_slug"], "name": r["name"]} for r in rows]
+    texts = [
+        _join(r["name"], r["tagline"], r["description"], strip_html(r["description_html"]),
+              r["technologies"], r["topics"])
+        for r in rows
+    ]
+    return items, texts
+
+
+def load_project_docs():
+    """(items, texts) for every project: title, abstracts and tech tags."""
+    rows = _fetch(PROJECTS_SQL)
+    items = [
+        {"id": r["project_id"], "org_slug": r["org_slug"], "year": r["year"], "title": r["title"]}
+        for r in rows
+    ]
+    texts = [
+        _join(r["title"], r["short_abstract"], strip_html(r["long_abstract_html"]), r["tech_tags"])
+        for r in rows
+    ]
+    return items, texts
+
+
+def last_org_sync():
+    """sync_status.last_synced of the org sync, as an ISO string (or None)."""
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT last_synced FROM sync_status WHERE name = 'org_sync'")
+            row = cur.fetchone()
+    return row[0].isoformat() if row and row[0] else None
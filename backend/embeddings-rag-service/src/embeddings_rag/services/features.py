@@ -0,0 +1,57 @@
+# backend/embeddings-rag-service/src/embeddings_rag/services/features.py
+import html
+import re
+import zlib
+import numpy as np
+
+TAG_RE = re.compile(r"<[^>]+>")
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the
+this to was were will with we our you your their which also can more
+""".split())
+
+
+def strip_html(s: str):
+    return html.unescape(TAG_RE.sub(" ", s or ""))
+
+
+def tokenize(text: str):
+    """Unigrams plus adjacent bigrams, lowercased, stopwords dropped."""
+    words = [w for w in TOKEN_RE.findall((text or "").lower()) if w not in STOPWORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def hashed_counts(text: str, dim: int):
+    """Term counts folded into `dim` buckets (crc32 is stable across processes, hash() is not)."""
+    tokens = tokenize(text)
+    vec = np.zeros(dim, dtype=np.float32)
+    if tokens:
+        cols = np.fromiter((zlib.crc32(t.encode("utf-8")) % dim for t in tokens),
+                           dtype=np.int64, count=len(tokens))
+        np.add.at(vec, cols, 1.0)
+    return vec
+
+
+def _tfidf_rows(counts: np.ndarray, idf: np.ndarray):
+    # sublinear tf, idf weighting, unit length so a dot product is a cosine
+    rows = np.log1p(counts, out=counts) * idf
+    norms = np.linalg.norm(rows, axis=-1, keepdims=True)
+    np.divide(rows, norms, out=rows, where=norms > 0)
+    return rows
+
+
+def fit_tfidf(texts, dim: int):
+    """(n x dim float32 matrix of unit rows, idf vector) for a corpus."""
+    counts = np.zeros((len(texts), dim), dtype=np.float32)
+    for i, text in enumerate(texts):
+        counts[i] = hashed_counts(text, dim)
+    df = np.count_nonzero(counts, axis=0)
+    idf = (np.log((1 + len(texts)) / (1 + df)) + 1).astype(np.float32)
+    return _tfidf_rows(counts, idf), idf
+
+
+def embed(text: str, idf: np.ndarray):
+    """Vector of a query text in the space of an already fitted corpus."""
+    return _tfidf_rows(hashed_counts(text, len(idf)), idf)
@@ -0,0 +1,127 @@
+# backend/embeddings-rag-service/src/embeddings_rag/services/index_store.py
+import fcntl
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from embeddings_rag.config import (
+    INDEX_DIR, EMBED_DIM, LSH_BITS, LSH_TABLES, LSH_SEED, INDEX_CHECK_INTERVAL
+)
+from embeddings_rag.services.corpus import load_org_docs, load_project_docs, last_org_sync
+from embeddings_rag.services.vector_index import VectorIndex, build_index
+
+# kind -> loader of (items, texts)
+CORPORA = {
+    "orgs": load_org_docs,
+    "projects": load_project_docs,
+}
+
+# builds kept on disk; older ones may still be mapped by a slow worker
+KEEP_BUILDS = 2
+
+
+def _current_path():
+    return os.path.join(INDEX_DIR, "CURRENT")
+
+
+def read_manifest():
+    """Manifest of the build CURRENT points at, or None if nothing is built yet."""
+    try:
+        with open(_current_path()) as f:
+            build_id = f.read().strip()
+        with open(os.path.join(INDEX_DIR, build_id, "manifest.json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def rebuild_indexes(synced_at=None, only_if_stale: bool = False):
+    """
+    Build every corpus into a fresh directory, then swap CURRENT to it.
+    A file lock keeps concurrent workers from building at the same time;
+    with only_if_stale the build is skipped if another worker already
+    produced one for `synced_at` while we waited.
+    """
+    os.makedirs(INDEX_DIR, exist_ok=True)
+    with open(os.path.join(INDEX_DIR, ".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        manifest = read_manifest()
+        if only_if_stale and manifest and manifest.get("synced_at") == synced_at:
+            return manifest
+
+        build_id = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        path = os.path.join(INDEX_DIR, build_id)
+        started = time.perf_counter()
+        sizes = {}
+        for kind, loader in CORPORA.items():
+            items, texts = loader()
+            build_index(os.path.join(path, kind), items, texts, EMBED_DIM, LSH_BITS, LSH_TABLES, LSH_SEED)
+            sizes[kind] = len(items)
+
+        manifest = {
+            "build_id": build_id,
+            "synced_at": synced_at,
+            "built_at": time.time(),
+            "build_seconds": round(time.perf_counter() - started, 2),
+            "dim": EMBED_DIM,
+            "lsh_bits": LSH_BITS,
+            "lsh_tables": LSH_TABLES,
+            "sizes": sizes,
+        }
+        with open(os.path.join(path, "manifest.json"), "w") as f:
+            json.dump(manifest, f)
+
+        # atomic swap: readers see either the old or the new build
+        tmp = _current_path() + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(build_id)
+        os.replace(tmp, _current_path())
+        print(f"Embedding index built: {build_id} {sizes} in {manifest['build_seconds']}s")
+
+        builds = sorted(d for d in os.listdir(INDEX_DIR) if os.path.isdir(os.path.join(INDEX_DIR, d)))
+        for old in builds[:-KEEP_BUILDS]:
+            shutil.rmtree(os.path.join(INDEX_DIR, old), ignore_errors=True)
+        return manifest
+
+
+_lock = threading.Lock()
+_checked_at = 0.0
+_manifest = None
+_indexes = {}
+
+
+def get_index(kind: str):
+    """
+    VectorIndex for a corpus kind. Every INDEX_CHECK_INTERVAL seconds the
+    worker re-reads CURRENT (another worker may have rebuilt) and rebuilds
+    itself if an org sync finished after the current build.
+    """
+    global _checked_at, _manifest, _indexes
+    with _lock:
+        if _manifest is None or time.monotonic() - _checked_at >= INDEX_CHECK_INTERVAL:
+            manifest = read_manifest()
+            synced_at = last_org_sync()
+            if manifest is None or manifest.get("synced_at") != synced_at:
+                manifest = rebuild_indexes(synced_at, only_if_stale=True)
+            if _manifest is None or manifest["build_id"] != _manifest["build_id"]:
+                path = os.path.join(INDEX_DIR, manifest["build_id"])
+                _indexes = {k: VectorIndex(os.path.join(path, k)) for k in CORPORA}
+                _manifest = manifest
+            _checked_at = time.monotonic()
+        return _indexes[kind]
+
+
+def current_manifest():
+    get_index("orgs")
+    return _manifest
+
+
+def force_rebuild():
+    """Rebuild now regardless of sync state; workers pick it up on their next check."""
+    global _checked_at
+    manifest = rebuild_indexes(last_org_sync())
+    with _lock:
+        _checked_at = 0.0
+    return manifest
@@ -0,0 +1,101 @@
+# backend/embeddings-rag-service/src/embeddings_rag/services/vector_index.py
+import json
+import os
+import numpy as np
+from embeddings_rag.services.features import fit_tfidf, embed
+
+
+def lsh_codes(vectors: np.ndarray, planes: np.ndarray):
+    """
+    Random-hyperplane hash codes: (tables, n) uint32, one bit per plane
+    telling which side of it a vector falls on. Vectors with a small angle
+    between them tend to share codes.
+    """
+    weights = np.uint32(1) << np.arange(planes.shape[1], dtype=np.uint32)
+    return np.stack([((vectors @ p.T) > 0) @ weights for p in planes]).astype(np.uint32)
+
+
+def build_index(path: str, items, texts, dim: int, bits: int, tables: int, seed: int):
+    """
+    Write an index for `texts` into directory `path`:
+      vectors.npy  n x dim float32 TF-IDF rows (memory-mapped at query time)
+      idf.npy      idf weights, to embed free-text queries
+      planes.npy   LSH hyperplanes
+      codes.npy    per table: hash codes sorted ascending
+      order.npy    per table: row index of each sorted code
+      items.json   what each row is (id plus display fields)
+    """
+    os.makedirs(path, exist_ok=True)
+    vectors, idf = fit_tfidf(texts, dim)
+    planes = np.random.default_rng(seed).standard_normal((tables, bits, dim)).astype(np.float32)
+    codes = lsh_codes(vectors, planes)
+    order = np.argsort(codes, axis=1, kind="stable").astype(np.int32)
+
+    np.save(os.path.join(path, "vectors.npy"), vectors)
+    np.save(os.path.join(path, "idf.npy"), idf)
+    np.save(os.path.join(path, "planes.npy"), planes)
+    np.save(os.path.join(path, "codes.npy"), np.take_along_axis(codes, order, axis=1))
+    np.save(os.path.join(path, "order.npy"), order)
+    with open(os.path.join(path, "items.json"), "w") as f:
+        json.dump(items, f)
+
+
+class VectorIndex:
+    """
+    Read-only view of a built index. The arrays are memory-mapped, so
+    workers on one host share the page cache instead of each holding a copy.
+    """
+
+    def __init__(self, path: str):
+        load = lambda name: np.load(os.path.join(path, name), mmap_mode="r")
+        self.vectors = load("vectors.npy")
+        self.idf = np.load(os.path.join(path, "idf.npy"))
+        self.planes = np.load(os.path.join(path, "planes.npy"))
+        self.codes = load("codes.npy")
+        self.order = load("order.npy")
+        with open(os.path.join(path, "items.json")) as f:
+            self.items = json.load(f)
+        self.row_of = {item["id"]: i for i, item in enumerate(self.items)}
+
+    def __len__(self):
+        return len(self.items)
+
+    def _candidates(self, vec: np.ndarray):
+        # rows sharing the query's bucket in any table (binary search per table)
+        qcodes = lsh_codes(vec[None, :], self.planes)[:, 0]
+        found = []
+        for t, code in enumerate(qcodes):
+            lo = np.searchsorted(self.codes[t], code, side="left")
+            hi = np.searchsorted(self.codes[t], code, side="right")
+            found.append(self.order[t, lo:hi])
+        return np.unique(np.concatenate(found)) if found else np.array([], dtype=np.int32)
+
+    def search(self, vec: np.ndarray, k: int = 10, exclude: int = None, exact: bool = False):
+        """
+        [(item, score)] of the k nearest rows by cosine. Only LSH candidates
+        are scored; when they are fewer than k (or exact=True) every row is.
+        """
+        rows = None if exact else self._candidates(vec)
+        if rows is not None and exclude is not None:
+            rows = rows[rows != exclude]
+        if rows is None or len(rows) < k:
+            rows = np.arange(len(self.items))
+            if exclude is not None:
+                rows = rows[rows != exclude]
+        if not len(rows):
+            return []
+
+        scores = np.asarray(self.vectors[rows] @ vec)
+        k = min(k, len(rows))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self.items[rows[i]], round(float(scores[i]), 4)) for i in best if scores[i] > 0]
+
+    def similar_to(self, item_id, k: int = 10, exact: bool = False):
+        row = self.row_of.get(item_id)
+        if row is None:
+            return None
+        return self.search(np.asarray(self.vectors[row]), k, exclude=row, exact=exact)
+
+    def search_text(self, text: str, k: int = 10, exact: bool = False):
+        return self.search(embed(text, self.idf), k, exact=exact)
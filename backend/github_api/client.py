@@ -0,0 +1,259 @@
+# backend/github_api/client.py
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from dotenv import load_dotenv
+import requests
+
+load_dotenv()
+
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+GITHUB_GRAPHQL_URL = os.getenv("GITHUB_GRAPHQL_URL", "https://api.github.com/graphql")
+
+# comma separated; requests rotate across them (falls back to GITHUB_TOKEN)
+GITHUB_TOKENS = [
+    t.strip() for t in os.getenv("GITHUB_TOKENS", os.getenv("GITHUB_TOKEN", "")).split(",") if t.strip()
+]
+
+# ETag cache entries kept in memory (LRU)
+GITHUB_CACHE_SIZE = int(os.getenv("GITHUB_CACHE_SIZE", "5000"))
+# stop using a token when it has this many requests left
+GITHUB_RATE_RESERVE = int(os.getenv("GITHUB_RATE_RESERVE", "10"))
+GITHUB_TIMEOUT = float(os.getenv("GITHUB_TIMEOUT", "30"))
+
+# wait for a secondary limit that gives no usable hint (GitHub: "at least a minute")
+SECONDARY_LIMIT_WAIT = 60
+
+
+class GitHubError(Exception):
+    def __init__(self, status_code: int, message):
+        super().__init__(f"GitHub {status_code}: {message}")
+        self.status_code = status_code
+
+
+def retry_delay(headers, now: float = None):
+    """
+    Seconds to wait before retrying a rate-limited response: Retry-After
+    as delta-seconds or an HTTP-date, else X-RateLimit-Reset (epoch
+    seconds), else SECONDARY_LIMIT_WAIT.
+    """
+    now = time.time() if now is None else now
+    retry_after = (headers.get("Retry-After") or "").strip()
+    if retry_after:
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            when = parsedate_to_datetime(retry_after)
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            return max(when.timestamp() - now, 0.0)
+        except (TypeError, ValueError):
+            pass
+    reset = headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            return max(float(reset) - now, 0.0)
+        except ValueError:
+            pass
+    return float(SECONDARY_LIMIT_WAIT)
+
+
+class _TokenState:
+    """Last known quota of one token, per rate-limit resource (core, graphql, ...)."""
+
+    def __init__(self, token: str):
+        self.token = token
+        self.remaining = {}
+        self.reset_at = {}
+
+    def available(self, resource: str, now: float):
+        if self.reset_at.get(resource, 0) <= now:
+            return True  # unknown or window already reset
+        return self.remaining.get(resource, 1) > GITHUB_RATE_RESERVE
+
+
+class GitHubClient:
+    """
+    Shared GitHub client for repo-analytics and repo-collector.
+
+    - one keep-alive requests.Session
+    - GET responses cached by URL with ETag / Last-Modified revalidation;
+      a 304 is answered from the cache and doesn't count against the quota
+    - X-RateLimit-Remaining / -Reset tracked per token and resource: each
+      request goes to the token with the most quota left, and when every
+      token is exhausted the caller sleeps until the earliest reset
+    - 403/429 secondary limits are retried after Retry-After
+    """
+
+    def __init__(self, tokens=None, api_url: str = GITHUB_API_URL,
+                 graphql_url: str = GITHUB_GRAPHQL_URL, cache_size: int = GITHUB_CACHE_SIZE):
+        tokens = GITHUB_TOKENS if tokens is None else tokens
+        self.api_url = api_url.rstrip("/")
+        self.graphql_url = graphql_url
+        self._tokens = [_TokenState(t) for t in tokens] or [_TokenState(None)]
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "gsoc-repo-recommender",
+        })
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "not_modified": 0, "rate_limit_waits": 0}
+
+    # ------------------------------
+    # token scheduling
+    # ------------------------------
+    def _pick_token(self, resource: str):
+        while True:
+            now = time.time()
+            with self._lock:
+                usable = [t for t in self._tokens if t.available(resource, now)]
+                if usable:
+                    # unknown quota counts as full
+                    return max(usable, key=lambda t: t.remaining.get(resource, 1 << 30))
+                wait = min(t.reset_at.get(resource, now) for t in self._tokens) - now + 1
+                self.stats["rate_limit_waits"] += 1
+            print(f"[GITHUB] all tokens exhausted for '{resource}', sleeping {wait:.0f}s")
+            time.sleep(max(wait, 1))
+
+    def _record_limits(self, state: _TokenState, res, default_resource: str):
+        resource = res.headers.get("X-RateLimit-Resource", default_resource)
+        remaining = res.headers.get("X-RateLimit-Remaining")
+        reset = res.headers.get("X-RateLimit-Reset")
+        with self._lock:
+            if remaining is not None:
+                state.remaining[resource] = int(remaining)
+            if reset is not None:
+                state.reset_at[resource] = float(reset)
+
+    def _send(self, method: str, url: str, resource: str, headers=None, **kwargs):
+        while True:
+            state = self._pick_token(resource)
+            req_headers = dict(headers or {})
+            if state.token:
+                req_headers["Authorization"] = f"Bearer {state.token}"
+            res = self._session.request(method, url, headers=req_headers, timeout=GITHUB_TIMEOUT, **kwargs)
+            with self._lock:
+                self.stats["requests"] += 1
+            self._record_limits(state, res, resource)
+
+            if res.status_code in (403, 429) and (
+                res.headers.get("Retry-After") or res.headers.get("X-RateLimit-Remaining") == "0"
+            ):
+                if res.headers.get("Retry-After"):
+                    wait = retry_delay(res.headers)
+                    print(f"[GITHUB] secondary rate limit, retrying in {wait:.0f}s")
+                    time.sleep(wait)
+                # primary limit: the token is now marked exhausted, pick another
+                continue
+            return res
+
+    # ------------------------------
+    # REST
+    # ------------------------------
+    def _cache_get(self, url: str):
+        with self._lock:
+            entry = self._cache.get(url)
+            if entry is not None:
+                self._cache.move_to_end(url)
+            return entry
+
+    def _cache_put(self, url: str, entry: dict):
+        with self._lock:
+            self._cache[url] = entry
+            self._cache.move_to_end(url)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def get(self, path: str, params=None):
+        """
+        GET a REST resource (path or absolute URL). Returns (json, links)
+        where links maps rel -> URL from the Link header.
+        """
+        url = path if path.startswith("http") else f"{self.api_url}/{path.lstrip('/')}"
+        url = requests.Request("GET", url, params=params).prepare().url
+
+        cached = self._cache_get(url)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        res = self._send("GET", url, "core", headers=headers)
+        if res.status_code == 304 and cached:
+            with self._lock:
+                self.stats["not_modified"] += 1
+            return cached["body"], cached["links"]
+        if res.status_code >= 400:
+            raise GitHubError(res.status_code, res.text[:200])
+
+        body = res.json() if res.content else None
+        links = {rel: link["url"] for rel, link in res.links.items()}
+        if res.headers.get("ETag") or res.headers.get("Last-Modified"):
+            self._cache_put(url, {
+                "etag": res.headers.get("ETag"),
+                "last_modified": res.headers.get("Last-Modified"),
+                "body": body,
+                "links": links,
+            })
+        return body, links
+
+    def get_json(self, path: str, params=None):
+        return self.get(path, params)[0]
+
+    def paginate(self, path: str, params=None, max_pages: int = None):
+        """Yield items across pages by following Link rel="next"."""
+        url, pages = path, 0
+        while url:
+            body, links = self.get(url, params if pages == 0 else None)
+            yield from body or []
+            pages += 1
+            if max_pages and pages >= max_pages:
+                return
+            url = links.get("next")
+
+    # ------------------------------
+    # GraphQL
+    # ------------------------------
+    def graphql(self, query: str, variables=None):
+        """POST a GraphQL query; returns (data, errors). Partial errors keep their data."""
+        res = self._send("POST", self.graphql_url, "graphql",
+                         json={"query": query, "variables": variables or {}})
+        if res.status_code >= 400:
+            raise GitHubError(res.status_code, res.text[:200])
+        body = res.json()
+        if body.get("data") is None:
+            raise GitHubError(res.status_code, body.get("errors"))
+        return body["data"], body.get("errors") or []
+
+    def rate_limits(self):
+        """Last seen quota per token (tokens are masked)."""
+        with self._lock:
+            return [
+                {
+                    "token": f"...{t.token[-4:]}" if t.token else None,
+                    "remaining": dict(t.remaining),
+                    "reset_at": dict(t.reset_at),
+                }
+                for t in self._tokens
+            ]
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Process-wide GitHubClient, so all callers share one session, cache and quota view."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = GitHubClient()
+    return _client
@@ -0,0 +1,236 @@
+# backend/org-collector-service/src/org_collector/benchmarks/bench_sync.py
+"""
+Sync pipeline benchmark against the local fake archive and a local Postgres.
+
+    DB_NAME=gsoc_bench python -m org_collector.benchmarks.bench_sync \\
+        --orgs 500 --years 2016-2024 --projects 8 --reset
+
+Runs, in order:
+    cold    empty HTTP cache, no fingerprints: every page fetched, every row written
+    warm    HTTP cache and fingerprints from the cold run: measures the skip paths
+    replay  offline rebuild from the payload archive (forced writes)
+    micro   upsert_org / upsert_project one by one vs. the batch variants
+
+and reports wall time, HTTP requests/s, rows/s and DB round trips for each.
+Round trips are counted client side: every execute(), every executemany()
+batch (pipelined) and every pool checkout (its commit).
+
+--reset TRUNCATEs orgs, org_projects and the sync tables (CASCADE, so
+repos go too): point DB_NAME at a scratch database. Without it the sync
+runs still write the fake orgs; the micro benchmark cleans up its own
+bench-micro-* rows either way.
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from org_collector.benchmarks.fake_archive import FakeArchive, start_fake_archive
+from org_collector.utils import parse_years
+
+INSERT_RE = re.compile(r"INSERT\s+INTO\s+(\w+)", re.IGNORECASE)
+
+_counts = {}
+_counts_lock = threading.Lock()
+
+
+def _count(key: str, n: int = 1):
+    with _counts_lock:
+        _counts[key] = _counts.get(key, 0) + n
+
+
+def _counting_cursor_class():
+    import psycopg
+
+    class CountingCursor(psycopg.Cursor):
+        """Cursor that tallies statements and rows sent, per target table."""
+
+        def execute(self, query, params=None, **kwargs):
+            _count("execute")
+            return super().execute(query, params, **kwargs)
+
+        def executemany(self, query, params_seq, **kwargs):
+            params_seq = list(params_seq)
+            _count("executemany")
+            m = INSERT_RE.search(query if isinstance(query, str) else str(query))
+            if m:
+                _count(f"rows:{m.group(1)}", len(params_seq))
+            return super().executemany(query, params_seq, **kwargs)
+
+    return CountingCursor
+
+
+def _snapshot(server, pool):
+    with _counts_lock:
+        counts = dict(_counts)
+    return {
+        "time": time.perf_counter(),
+        "http": dict(server.stats),
+        "counts": counts,
+        "checkouts": pool.get_stats().get("requests_num", 0),
+    }
+
+
+def _report(name: str, before: dict, after: dict):
+    wall = after["time"] - before["time"]
+    http = {k: after["http"][k] - before["http"].get(k, 0) for k in after["http"]}
+    counts = {k: v - before["counts"].get(k, 0) for k, v in after["counts"].items()}
+    rows = {k.split(":", 1)[1]: v for k, v in counts.items() if k.startswith("rows:") and v}
+    checkouts = after["checkouts"] - before["checkouts"]
+    data_rows = rows.get("orgs", 0) + rows.get("org_projects", 0)
+    return {
+        "run": name,
+        "wall_s": round(wall, 3),
+        "http_requests": http["requests"],
+        "http_not_modified": http["not_modified"],
+        "http_mb": round(http["bytes"] / 1e6, 2),
+        "requests_per_s": round(http["requests"] / wall, 1) if wall else None,
+        "rows": rows,
+        "rows_per_s": round(data_rows / wall, 1) if wall else None,
+        "db": {
+            "execute": counts.get("execute", 0),
+            "executemany": counts.get("executemany", 0),
+            "checkouts": checkouts,
+            "round_trips": counts.get("execute", 0) + counts.get("executemany", 0) + checkouts,
+        },
+    }
+
+
+def _reset_db():
+    from database.connect import pooled_conn
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                TRUNCATE orgs, org_projects, sync_fingerprints, org_aliases,
+                         sync_jobs, sync_job_checkpoints, sync_status CASCADE
+                """
+            )
+
+
+def _drop_micro_rows():
+    from database.connect import pooled_conn
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM org_projects WHERE project_id LIKE 'bench-micro-%'")
+            cur.execute("DELETE FROM orgs WHERE org_slug LIKE 'bench-micro-%'")
+
+
+def _micro(n: int):
+    """
+    Per-row vs batch upserts of n synthetic orgs / projects. The bench-micro-*
+    rows are deleted again afterwards, so this is safe without --reset.
+    """
+    from org_collector.services.db_ops import upsert_org, upsert_orgs, upsert_project, upsert_projects
+    orgs = [{"org_slug": f"bench-micro-{i:05d}", "name": f"Bench {i}", "tech_tags": ["python"],
+             "years_participated": [2024]} for i in range(n)]
+    projects = [{"project_id": f"bench-micro-p{i:05d}", "org_slug": orgs[i % n]["org_slug"],
+                 "year": 2024, "title": f"Bench project {i}"} for i in range(n)]
+    out = {}
+    try:
+        for name, fn in (
+            ("upsert_org x n", lambda: [upsert_org(o) for o in orgs]),
+            ("upsert_orgs(n)", lambda: upsert_orgs(orgs)),
+            ("upsert_project x n", lambda: [upsert_project(p) for p in projects]),
+            ("upsert_projects(n)", lambda: upsert_projects(projects)),
+        ):
+            started = time.perf_counter()
+            fn()
+            wall = time.perf_counter() - started
+            out[name] = {"wall_s": round(wall, 3), "rows_per_s": round(n / wall, 1)}
+    finally:
+        _drop_micro_rows()
+    return out
+
+
+def _print(results):
+    print(f"\n{'run':<8} {'wall s':>8} {'http req':>9} {'304':>6} {'req/s':>8} "
+          f"{'orgs':>7} {'projects':>9} {'rows/s':>9} {'round trips':>12}")
+    for r in results["runs"]:
+        print(f"{r['run']:<8} {r['wall_s']:>8} {r['http_requests']:>9} {r['http_not_modified']:>6} "
+              f"{r['requests_per_s']:>8} {r['rows'].get('orgs', 0):>7} {r['rows'].get('org_projects', 0):>9} "
+              f"{r['rows_per_s']:>9} {r['db']['round_trips']:>12}")
+    if results.get("micro"):
+        print(f"\nmicro (n={results['micro_n']})")
+        for name, r in results["micro"].items():
+            print(f"  {name:<20} {r['wall_s']:>8} s {r['rows_per_s']:>10} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark the org sync pipeline")
+    parser.add_argument("--orgs", type=int, default=200)
+    parser.add_argument("--years", default="2016-2024")
+    parser.add_argument("--projects", type=int, default=5, help="projects per org-year")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="added to every fake response")
+    parser.add_argument("--workers", type=int, help="fetch threads (default: ORG_SYNC_FETCH_WORKERS)")
+    parser.add_argument("--runs", default="cold,warm,replay", help="subset of cold,warm,replay")
+    parser.add_argument("--micro", type=int, default=500, help="rows for the upsert micro benchmark (0 = skip)")
+    parser.add_argument("--reset", action="store_true", help="truncate sync tables first (scratch DB only)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    years = parse_years(args.years)
+    archive = FakeArchive(args.orgs, years, args.projects)
+    server = start_fake_archive(archive, latency=args.latency_ms / 1000)
+    workdir = tempfile.mkdtemp(prefix="org-sync-bench-")
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    # config is read at import time: point everything at the fake and the
+    # temp dirs before the pipeline is imported
+    os.environ.update({
+        "GSOC_ARCHIVE_BASE_URL": base,
+        "GSOC_ORGANIZATIONS_BASE_URL": base,
+        "ORG_SYNC_HTTP_CACHE_DIR": os.path.join(workdir, "http-cache"),
+        "ORG_SYNC_PAYLOAD_ARCHIVE_DIR": os.path.join(workdir, "payload-archive"),
+        "ORG_SYNC_REQUESTS_PER_SECOND": "100000",
+        "ORG_SYNC_REQUEST_BURST": "1000",
+        "ORG_SYNC_HTTP_CACHE_OFFLINE": "0",
+    })
+    if args.workers:
+        os.environ["ORG_SYNC_FETCH_WORKERS"] = str(args.workers)
+
+    from database.connect import configure_connections, get_pool, close_pool
+    cursor_class = _counting_cursor_class()
+    configure_connections(lambda conn: setattr(conn, "cursor_factory", cursor_class))
+    from org_collector.services.sync_pipeline import sync_master_then_yearly_then_projects
+
+    pool = get_pool()
+    print(f"Fake archive: {args.orgs} orgs x {len(years)} years, {archive.total_projects} projects, at {base}")
+    if args.reset:
+        print(f"Resetting sync tables in database {os.getenv('DB_NAME', 'gsoc')}")
+        _reset_db()
+
+    results = {
+        "scale": {"orgs": args.orgs, "years": years, "projects_per_org_year": args.projects,
+                  "total_projects": archive.total_projects, "latency_ms": args.latency_ms},
+        "runs": [],
+    }
+    modes = {
+        "cold": {"force": False, "replay": False},
+        "warm": {"force": False, "replay": False},
+        "replay": {"force": True, "replay": True},
+    }
+    try:
+        for name in [r for r in args.runs.split(",") if r]:
+            before = _snapshot(server, pool)
+            sync_master_then_yearly_then_projects(True, True, True, years=years, **modes[name])
+            results["runs"].append(_report(name, before, _snapshot(server, pool)))
+        if args.micro:
+            results["micro_n"] = args.micro
+            results["micro"] = _micro(args.micro)
+    finally:
+        close_pool()
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    _print(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# backend/org-collector-service/src/org_collector/benchmarks/fake_archive.py
+"""
+Local stand-in for the two upstreams of the sync pipeline, serving
+deterministic synthetic data at a configurable scale:
+
+    python -m org_collector.benchmarks.fake_archive --orgs 500 --years 2016-2024 --projects 8
+    GSOC_ARCHIVE_BASE_URL=http://127.0.0.1:8766 \
+    GSOC_ORGANIZATIONS_BASE_URL=http://127.0.0.1:8766 org-collector sync ...
+
+Routes (same shapes the fetchers parse):
+    /page-data/index/page-data.json                          gsocorganizations.dev index
+    /api/archive/programs/{year}/organizations/              yearly org list
+    /api/archive/programs/{year}/organizations/{slug}/       org details + projects
+
+Responses carry an ETag and honour If-None-Match, so HTTP cache
+revalidation can be measured too.
+"""
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+import zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from org_collector.utils import parse_years
+
+YEARLY_RE = re.compile(r"^/api/archive/programs/(\d+)/organizations/$")
+DETAILS_RE = re.compile(r"^/api/archive/programs/(\d+)/organizations/([^/]+)/$")
+MASTER_PATH = "/page-data/index/page-data.json"
+
+TECH = ["python", "c++", "javascript", "rust", "go", "java", "postgresql", "llvm", "kubernetes", "react"]
+TOPICS = ["machine learning", "compilers", "web", "science", "security", "databases", "cloud", "education"]
+
+
+def _seed(text: str):
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def _pick(options, seed: int, n: int):
+    return [options[(seed >> (3 * i)) % len(options)] for i in range(n)]
+
+
+class FakeArchive:
+    """Synthetic orgs x years x projects; bodies are built once and reused."""
+
+    def __init__(self, orgs: int, years, projects_per_org: int, participation: float = 0.7):
+        self.years = list(years)
+        self.projects_per_org = projects_per_org
+        self.slugs = [f"org-{i:05d}" for i in range(orgs)]
+        # each org takes part in a stable subset of the years
+        self.participation = {
+            slug: [y for y in self.years if _seed(f"{slug}/{y}") % 1000 < participation * 1000]
+            for slug in self.slugs
+        }
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    def _org(self, slug: str):
+        seed = _seed(slug)
+        return {
+            "slug": slug,
+            "name": slug.replace("-", " ").title(),
+            "tagline": f"Synthetic organization {slug}",
+            "logo_url": f"https://example.org/{slug}.png",
+            "website_url": f"https://{slug}.example.org",
+            "tech_tags": _pick(TECH, seed, 3),
+            "topic_tags": _pick(TOPICS, seed, 2),
+            "categories": ["Science and medicine"],
+            "description_html": f"<p>{slug} builds synthetic software. " * 5 + "</p>",
+            "ideas_list_url": f"https://{slug}.example.org/ideas",
+            "contact_links": [{"name": "chat", "value": f"https://chat.example.org/{slug}"}],
+        }
+
+    def master(self):
+        edges = []
+        for slug in self.slugs:
+            org = self._org(slug)
+            edges.append({"node": {
+                "name": org["name"],
+                "category": "Science and medicine",
+                "description": org["tagline"],
+                "technologies": org["tech_tags"],
+                "topics": org["topic_tags"],
+                "image_url": org["logo_url"],
+                "image_background_color": "#ffffff",
+                "url": org["website_url"],
+                "years": {f"_{y}": None for y in self.participation[slug]},
+            }})
+        return {"result": {"data": {"allOrganization": {"edges": edges}}}, "staticQueryHashes": []}
+
+    def yearly(self, year: int):
+        return [
+            {**self._org(slug), "program_slug": str(year)}
+            for slug in self.slugs if year in self.participation[slug]
+        ]
+
+    def details(self, year: int, slug: str):
+        if slug not in self.participation or year not in self.participation[slug]:
+            return None
+        org = self._org(slug)
+        projects = []
+        for i in range(self.projects_per_org):
+            pid = f"{slug}-{year}-{i}"
+            seed = _seed(pid)
+            projects.append({
+                "id": pid,
+                "title": f"Project {i} of {slug} in {year}",
+                "project_code_url": f"https://example.org/{pid}",
+                "date_created": f"{year}-05-01T00:00:00Z",
+                "tech_tags": _pick(TECH, seed, 2),
+                "topic_tags": _pick(TOPICS, seed, 1),
+                "status": "completed",
+                "organization_slug": slug,
+                "organization_name": org["name"],
+                "mentor_names": ["Mentor A", "Mentor B"],
+                "contributor_display_name": f"Contributor {seed % 10000}",
+                "abstract_short": f"Short abstract of {pid}.",
+                "abstract_html": f"<p>Long abstract of {pid}. " * 10 + "</p>",
+                "date_archived": f"{year}-11-01T00:00:00Z",
+            })
+        return {**org, "program_slug": str(year), "projects": projects}
+
+    def body(self, path: str):
+        """(bytes, etag) for a path, or (None, None) for a 404."""
+        with self._lock:
+            if path in self._bodies:
+                return self._bodies[path]
+        if path == MASTER_PATH:
+            payload = self.master()
+        elif m := YEARLY_RE.match(path):
+            payload = self.yearly(int(m.group(1)))
+        elif m := DETAILS_RE.match(path):
+            payload = self.details(int(m.group(1)), m.group(2))
+        else:
+            payload = None
+        if payload is None:
+            return None, None
+        raw = json.dumps(payload).encode("utf-8")
+        entry = (raw, '"%s"' % hashlib.sha1(raw).hexdigest())
+        with self._lock:
+            self._bodies[path] = entry
+        return entry
+
+    @property
+    def total_projects(self):
+        return sum(len(ys) for ys in self.participation.values()) * self.projects_per_org
+
+
+def start_fake_archive(archive: FakeArchive, port: int = 0, latency: float = 0.0):
+    """
+    Serve `archive` on 127.0.0.1 in a daemon thread. `latency` (seconds)
+    is added to every response. Returns the server; server.stats counts
+    requests, 304s and body bytes sent.
+    """
+    stats = {"requests": 0, "not_modified": 0, "bytes": 0}
+    stats_lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            body, etag = archive.body(self.path.split("?", 1)[0])
+            with stats_lock:
+                stats["requests"] += 1
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.headers.get("If-None-Match") == etag:
+                with stats_lock:
+                    stats["not_modified"] += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            with stats_lock:
+                stats["bytes"] += len(body)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    server.stats = stats
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fake GSoC archive + gsocorganizations.dev")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--orgs", type=int, default=200)
+    parser.add_argument("--years", default="2016-2024")
+    parser.add_argument("--projects", type=int, default=5, help="projects per org-year")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    archive = FakeArchive(args.orgs, parse_years(args.years), args.projects)
+    server = start_fake_archive(archive, args.port, args.latency_ms / 1000)
+    print(f"Fake archive on http://127.0.0.1:{server.server_port} "
+          f"({args.orgs} orgs, {archive.total_projects} projects)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# backend/org-collector-service/src/org_collector/cli.py
+"""
+Command line entry point for running syncs outside the API process.
+
+    org-collector sync --workers 4                  # shard years over 4 processes
+    org-collector sync --shard-by slug --workers 8  # shard orgs by slug hash
+    org-collector sync --shard-index 0 --shard-count 3 --shard-by slug
+                                                    # one shard of a multi-host backfill
+    org-collector resume <job_id>
+    org-collector replay --years 2016-2024          # rebuild from the payload archive, offline
+    org-collector merge-orgs --dry-run              # list duplicate orgs that would be merged
+"""
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from org_collector.config import REQUESTS_PER_SECOND
+from org_collector.utils import parse_years
+
+
+def _shard_kwargs(args, index: int, count: int, years):
+    """Pipeline kwargs for shard `index` of `count`."""
+    kwargs = {
+        "do_master": False,
+        "do_yearly": args.yearly,
+        "do_projects": args.projects,
+        "force": args.force,
+        "replay": args.replay,
+    }
+    if args.shard_by == "year":
+        kwargs["years"] = years[index::count]
+    else:
+        kwargs["years"] = years
+        kwargs["shard"] = (index, count)
+    return kwargs
+
+
+def _run_shard(kwargs):
+    # imported in the worker so each process opens its own DB pool
+    from org_collector.services.sync_pipeline import sync_master_then_yearly_then_projects
+    if not kwargs.get("years"):
+        return
+    sync_master_then_yearly_then_projects(**kwargs)
+
+
+def cmd_sync(args):
+    from org_collector.services.sync_pipeline import YEARS, sync_master_then_yearly_then_projects
+    years = parse_years(args.years) if args.years else YEARS
+
+    # a single shard of a multi-invocation backfill
+    if args.shard_index is not None:
+        kwargs = _shard_kwargs(args, args.shard_index, args.shard_count, years)
+        kwargs["do_master"] = args.master and args.shard_index == 0
+        _run_shard(kwargs)
+        return
+
+    # master list is one request, do it once before fanning out
+    if args.master:
+        sync_master_then_yearly_then_projects(True, False, False, args.force, replay=args.replay)
+
+    if not args.yearly:
+        return
+
+    workers = max(1, args.workers)
+    if args.shard_by == "year":
+        workers = min(workers, len(years))
+
+    # the requests/s budget is per process; split it so the total stays polite
+    # (replays make no requests, so this is a no-op for them)
+    os.environ["ORG_SYNC_REQUESTS_PER_SECOND"] = str(REQUESTS_PER_SECOND / workers)
+
+    shards = [_shard_kwargs(args, i, workers, years) for i in range(workers)]
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = {pool.submit(_run_shard, kw): i for i, kw in enumerate(shards)}
+        for fut in as_completed(futures):
+            i = futures[fut]
+            try:
+                fut.result()
+                print(f"Shard {i}/{workers} finished")
+            except Exception as e:
+                print(f"Shard {i}/{workers} failed: {e!r}")
+
+
+def cmd_replay(args):
+    # transform bugs don't change the payload fingerprints, so a replay
+    # rewrites every row unless told otherwise
+    args.force = not args.incremental
+    if not args.years:
+        from org_collector.services.payload_archive import archived_years
+        years = archived_years()
+        if not years:
+            print("Payload archive is empty, nothing to replay.")
+            return
+        args.years = ",".join(str(y) for y in years)
+    cmd_sync(args)
+
+
+def cmd_merge_orgs(args):
+    from org_collector.services.org_identity import merge_duplicate_orgs
+    report = merge_duplicate_orgs(dry_run=args.dry_run)
+    for old, new in report["merges"]:
+        print(f"{'would merge' if args.dry_run else 'merge'}: {old} -> {new}")
+    for group in report["conflicts"]:
+        print(f"skipped (several archive slugs): {', '.join(group)}")
+    print(f"{report['orgs']} orgs, {len(report['merges'])} duplicates, {len(report['conflicts'])} conflicts")
+
+
+def cmd_resume(args):
+    from org_collector.services.sync_pipeline import resume_sync_job
+    resume_sync_job(args.job_id)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="org-collector")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sync = sub.add_parser("sync", help="run a sync outside the API process")
+    sync.add_argument("--years", help="e.g. 2016-2024 or 2019,2021 (default: all)")
+    sync.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                      help="worker processes (default: CPU count)")
+    sync.add_argument("--shard-by", choices=["year", "slug"], default="year")
+    sync.add_argument("--shard-index", type=int, help="run only this shard (with --shard-count)")
+    sync.add_argument("--shard-count", type=int, help="total shards across invocations")
+    sync.add_argument("--no-master", dest="master", action="store_false")
+    sync.add_argument("--no-yearly", dest="yearly", action="store_false")
+    sync.add_argument("--no-projects", dest="projects", action="store_false")
+    sync.add_argument("--force", action="store_true", help="ignore stored fingerprints")
+    sync.set_defaults(func=cmd_sync, replay=False)
+
+    replay = sub.add_parser("replay", help="rebuild orgs / projects from the payload archive, offline")
+    replay.add_argument("--years", help="e.g. 2016-2024 or 2019,2021 (default: every archived year)")
+    replay.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    replay.add_argument("--shard-by", choices=["year", "slug"], default="year")
+    replay.add_argument("--no-master", dest="master", action="store_false")
+    replay.add_argument("--no-yearly", dest="yearly", action="store_false")
+    replay.add_argument("--no-projects", dest="projects", action="store_false")
+    replay.add_argument("--incremental", action="store_true",
+                        help="skip payloads whose fingerprint is unchanged")
+    replay.set_defaults(func=cmd_replay, replay=True, shard_index=None, shard_count=None)
+
+    merge = sub.add_parser("merge-orgs", help="merge duplicate orgs into one canonical slug")
+    merge.add_argument("--dry-run", action="store_true", help="only report what would be merged")
+    merge.set_defaults(func=cmd_merge_orgs)
+
+    resume = sub.add_parser("resume", help="resume an interrupted sync job")
+    resume.add_argument("job_id")
+    resume.set_defaults(func=cmd_resume)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "sync" and (args.shard_index is None) != (args.shard_count is None):
+        parser.error("--shard-index and --shard-count go together")
+    if args.command == "sync" and args.shard_count is not None and not 0 <= args.shard_index < args.shard_count:
+        parser.error("--shard-index must be in [0, --shard-count)")
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# backend/org-collector-service/src/org_collector/config.py
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# upstream hosts (overridable to point syncs / benchmarks at a local stand-in)
+GSOC_ARCHIVE_BASE_URL = os.getenv("GSOC_ARCHIVE_BASE_URL", "https://summerofcode.withgoogle.com").rstrip("/")
+GSOC_ORGANIZATIONS_BASE_URL = os.getenv("GSOC_ORGANIZATIONS_BASE_URL", "https://www.gsocorganizations.dev").rstrip("/")
+
+# global politeness budget shared by every request the sync pipeline makes
+REQUESTS_PER_SECOND = float(os.getenv("ORG_SYNC_REQUESTS_PER_SECOND", "5"))
+REQUEST_BURST = int(os.getenv("ORG_SYNC_REQUEST_BURST", "5"))
+
+# number of threads fetching archive pages concurrently
+FETCH_WORKERS = int(os.getenv("ORG_SYNC_FETCH_WORKERS", "8"))
+
+# on-disk HTTP cache for archive responses ("" disables it)
+HTTP_CACHE_DIR = os.getenv("ORG_SYNC_HTTP_CACHE_DIR", ".cache/gsoc-archive")
+# serve every cached response without touching the network
+HTTP_CACHE_OFFLINE = os.getenv("ORG_SYNC_HTTP_CACHE_OFFLINE", "0") == "1"
+HTTP_TIMEOUT = float(os.getenv("ORG_SYNC_HTTP_TIMEOUT", "30"))
+
+# a running sync job refreshes its heartbeat this often; one whose
+# heartbeat is older than JOB_STALE_SECONDS is treated as interrupted
+JOB_HEARTBEAT_SECONDS = float(os.getenv("ORG_SYNC_JOB_HEARTBEAT_SECONDS", "30"))
+JOB_STALE_SECONDS = int(os.getenv("ORG_SYNC_JOB_STALE_SECONDS", "120"))
+
+# seconds the count / last-sync endpoints serve from memory
+STATS_CACHE_TTL = float(os.getenv("ORG_STATS_CACHE_TTL", "60"))
+
+# streaming master list: bytes read per chunk, orgs written per batch
+STREAM_CHUNK_SIZE = int(os.getenv("ORG_SYNC_STREAM_CHUNK_SIZE", str(64 * 1024)))
+MASTER_BATCH_SIZE = int(os.getenv("ORG_SYNC_MASTER_BATCH_SIZE", "500"))
+
+# raw payload archive: every changed payload, gzip JSON lines, one file
+# per year ("" disables it); `org-collector replay` rebuilds from it
+PAYLOAD_ARCHIVE_DIR = os.getenv("ORG_SYNC_PAYLOAD_ARCHIVE_DIR", ".cache/payload-archive")
+# records buffered per year before they're appended as one gzip member;
+# details checkpoints are batched to the same size, and every checkpoint
+# is written only after the archive flush that backs it
+ARCHIVE_FLUSH_RECORDS = int(os.getenv("ORG_SYNC_ARCHIVE_FLUSH_RECORDS", "200"))
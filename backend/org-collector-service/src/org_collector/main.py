@@ -1,7 +1,35 @@
+import threading
+import traceback
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from database.connect import get_pool, close_pool
 from .routers import orgs
+from org_collector.services.sync_jobs import claim_stale_jobs
+from org_collector.services.sync_pipeline import resume_sync_job
 
-app = FastAPI(title="Org Collector Service", version="1.0.0")
+
+def resume_interrupted_syncs():
+    """Pick up sync jobs whose process died mid-run."""
+    try:
+        job_ids = claim_stale_jobs()
+    except Exception:
+        print("Failed checking for interrupted sync jobs.")
+        traceback.print_exc()
+        return
+    for job_id in job_ids:
+        print(f"Resuming interrupted sync job {job_id}")
+        threading.Thread(target=resume_sync_job, args=(job_id,), daemon=True).start()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_pool()  # open the pool before the first request
+    resume_interrupted_syncs()
+    yield
+    close_pool()
+
+
+app = FastAPI(title="Org Collector Service", version="1.0.0", lifespan=lifespan)
 
 app.include_router(orgs.router)
 
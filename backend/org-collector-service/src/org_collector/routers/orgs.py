@@ -1,58 +1,117 @@
 
 
 # backend/org-collector-service/src/org_collector/routers/orgs.py
-from database.connect import get_conn
-from fastapi import APIRouter, BackgroundTasks
-from org_collector.services.sync_pipeline import sync_master_then_yearly_then_projects
+from database.connect import pooled_conn
+from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from org_collector.services.sync_pipeline import sync_master_then_yearly_then_projects, resume_sync_job
+from org_collector.services.sync_jobs import SyncJob, get_job_report
+from org_collector.services.org_queries import list_orgs, search_projects
+from org_collector.services.ttl_cache import stats_cache
 
 router = APIRouter(prefix="/orgs", tags=["orgs"])
 
 @router.get("/")
-def get_orgs():
-    return {"status": "ok", "data": []}
+def get_orgs(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    tech_tags: Optional[List[str]] = Query(None),
+    topic_tags: Optional[List[str]] = Query(None),
+    category: Optional[str] = None,
+    years: Optional[List[int]] = Query(None)
+):
+    rows, next_cursor = list_orgs(
+        after=cursor,
+        limit=limit,
+        tech_tags=tech_tags,
+        topic_tags=topic_tags,
+        category=category,
+        years=years
+    )
+    return {"status": "ok", "data": rows, "next_cursor": next_cursor}
 
 @router.post("/sync")
 def sync_orgs(
     background_tasks: BackgroundTasks,
     master: bool = True,
     yearly: bool = True,
-    projects: bool = True
+    projects: bool = True,
+    force: bool = False,
+    replay: bool = False
 ):    # run in background to avoid blocking request
+    job = SyncJob.create({"master": master, "yearly": yearly, "projects": projects, "force": force, "replay": replay})
     background_tasks.add_task(
         sync_master_then_yearly_then_projects,
         master,
         yearly,
-        projects
+        projects,
+        force,
+        job,
+        replay=replay
     )
     return {
         "status": "sync_started",
+        "job_id": job.job_id,
         "modes": {
             "master": master,
             "yearly": yearly,
-            "projects": projects
+            "projects": projects,
+            "force": force,
+            "replay": replay
         }
     }
 
+@router.get("/sync/{job_id}")
+def sync_job_status(job_id: str):
+    report = get_job_report(job_id)
+    if not report:
+        raise HTTPException(status_code=404, detail="sync job not found")
+    return report
+
+@router.post("/sync/{job_id}/resume")
+def resume_sync(job_id: str, background_tasks: BackgroundTasks):
+    report = get_job_report(job_id)
+    if not report:
+        raise HTTPException(status_code=404, detail="sync job not found")
+    # 'finished_with_errors' stays resumable: the failed org-years have no checkpoint
+    if report["status"] == "finished":
+        raise HTTPException(status_code=409, detail="sync job already finished")
+    background_tasks.add_task(resume_sync_job, job_id)
+    return {"status": "sync_resumed", "job_id": job_id}
+
+def _count_rows(table: str):
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT COUNT(*) FROM {table};")
+            return cur.fetchone()[0]
+
 @router.get("/count")
 def count_orgs():
-    conn = get_conn()
-    with conn.cursor() as cur:
-        cur.execute("SELECT COUNT(*) FROM orgs;")
-        n = cur.fetchone()[0]
-    conn.close()
+    n = stats_cache.get_or_set("orgs_count", lambda: _count_rows("orgs"))
     return {"orgs": n}
 
 @router.get("/projects/count")
 def count_projects():
-    conn = get_conn()
-    with conn.cursor() as cur:
-        cur.execute("SELECT COUNT(*) FROM org_projects;")
-        n = cur.fetchone()[0]
-    conn.close()
+    n = stats_cache.get_or_set("projects_count", lambda: _count_rows("org_projects"))
     return {"projects": n}
 
+@router.get("/projects/search")
+def search_org_projects(
+    q: str = Query(..., min_length=2),
+    org_slug: Optional[str] = None,
+    year: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=1000)
+):
+    rows = search_projects(q, org_slug=org_slug, year=year, limit=limit, offset=offset)
+    return {"status": "ok", "data": rows}
+
 @router.get("/last-sync")
 def last_sync():
     from org_collector.services.sync_status import get_sync_status
-    ts = get_sync_status("org_sync")
+    ts = stats_cache.get_or_set("last_sync", lambda: get_sync_status("org_sync"))
     return {"last_synced_at": ts}
+
+@router.get("/cache-stats")
+def cache_stats():
+    return stats_cache.stats()
@@ -0,0 +1,32 @@
+# backend/org-collector-service/src/org_collector/services/fetch_engine.py
+from concurrent.futures import ThreadPoolExecutor
+from org_collector.config import FETCH_WORKERS
+
+
+class FetchEngine:
+    """
+    Bounded pool of fetch threads.
+
+    Network requests are throttled by the shared `archive_limiter` token
+    bucket (see http_cache.cached_get), so politeness is a global
+    requests/s budget no matter how many workers are busy, and cache hits
+    cost no tokens. Results come back as futures; the caller does the DB
+    writes, keeping fetching and writing decoupled.
+    """
+
+    def __init__(self, workers: int = FETCH_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="org-fetch")
+
+    def submit(self, fn, *args):
+        return self._executor.submit(fn, *args)
+
+    def shutdown(self, cancel: bool = False):
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # drop queued fetches if the consumer blew up
+        self.shutdown(cancel=exc_type is not None)
+        return False
@@ -0,0 +1,23 @@
+# backend/org-collector-service/src/org_collector/services/fingerprints.py
+import hashlib
+import json
+from database.connect import pooled_conn
+
+# fingerprint scopes, one per kind of payload written for an (org_slug, year)
+MASTER = "master"    # gsocorganizations.dev entry, stored with year 0
+YEARLY = "yearly"    # entry in the yearly Google org list
+DETAILS = "details"  # org details page incl. its projects
+
+
+def payload_fingerprint(payload):
+    """Stable sha256 of a fetched payload (key order independent)."""
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def load_fingerprints():
+    """All stored fingerprints as {(org_slug, year, scope): fingerprint}."""
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT org_slug, year, scope, fingerprint FROM sync_fingerprints")
+            return {(slug, year, scope): fp for slug, year, scope, fp in cur.fetchall()}
@@ -0,0 +1,188 @@
+# backend/org-collector-service/src/org_collector/services/http_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+import requests
+from org_collector.config import HTTP_CACHE_DIR, HTTP_CACHE_OFFLINE, HTTP_TIMEOUT, STREAM_CHUNK_SIZE
+from org_collector.services.rate_limiter import archive_limiter
+
+# one keep-alive session per fetch thread
+_local = threading.local()
+
+
+def _session():
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+    return _local.session
+
+
+def is_past_year(year: int):
+    """GSoC archives for finished years never change."""
+    return year < datetime.now(timezone.utc).year
+
+
+class CachedResponse:
+    """The bits of requests.Response the fetchers use."""
+
+    def __init__(self, url: str, status_code: int, content: bytes, from_cache: bool):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.from_cache = from_cache
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for url: {self.url}")
+
+
+def _network_get(url: str, headers=None, stream: bool = False):
+    archive_limiter.acquire()
+    return _session().get(url, headers=headers, timeout=HTTP_TIMEOUT, stream=stream)
+
+
+def _paths(url: str):
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    base = os.path.join(HTTP_CACHE_DIR, key)
+    return base + ".body", base + ".meta.json"
+
+
+def _read(url: str):
+    body_path, meta_path = _paths(url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, None
+    return meta, body
+
+
+def _read_meta(url: str):
+    """Like _read(), without loading the body; (None, None) if either file is missing."""
+    body_path, meta_path = _paths(url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None, None
+    if not os.path.exists(body_path):
+        return None, None
+    return meta, body_path
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _write_meta(url: str, res):
+    meta = {
+        "url": url,
+        "etag": res.headers.get("ETag"),
+        "last_modified": res.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+    }
+    _write_atomic(_paths(url)[1], json.dumps(meta).encode("utf-8"))
+
+
+def _store(url: str, res, body: bytes):
+    os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+    # body first, so a meta file always points at a complete body
+    _write_atomic(_paths(url)[0], body)
+    _write_meta(url, res)
+
+
+def _revalidation_headers(meta):
+    headers = {}
+    if meta is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def cached_get(url: str, immutable: bool = False):
+    """
+    GET `url` through the on-disk cache.
+
+    immutable=True  -> a cached body is returned without any request
+                       (past-year archives).
+    immutable=False -> revalidate with If-None-Match / If-Modified-Since;
+                       a 304 is served from disk.
+    Only network requests take a token from archive_limiter; only 200
+    responses are stored. With ORG_SYNC_HTTP_CACHE_OFFLINE=1
+    every cached body is served as-is, so syncs can run without network.
+    """
+    if not HTTP_CACHE_DIR:
+        res = _network_get(url)
+        return CachedResponse(url, res.status_code, res.content, False)
+
+    meta, body = _read(url)
+    if meta is not None and (immutable or HTTP_CACHE_OFFLINE):
+        return CachedResponse(url, 200, body, True)
+
+    res = _network_get(url, _revalidation_headers(meta))
+    if res.status_code == 304 and meta is not None:
+        return CachedResponse(url, 200, body, True)
+
+    if res.status_code == 200:
+        _store(url, res, res.content)
+    return CachedResponse(url, res.status_code, res.content, False)
+
+
+def _file_chunks(path: str, chunk_size: int):
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def cached_iter(url: str, immutable: bool = False, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    Streaming counterpart of cached_get(): yields the body in chunks
+    instead of returning it whole. Same cache rules; a fresh 200 body is
+    teed into a temp file as it arrives and only becomes the cached copy
+    once the download completed, so an aborted stream never leaves a
+    truncated entry behind. Raises requests.HTTPError on 4xx/5xx.
+    """
+    if not HTTP_CACHE_DIR:
+        res = _network_get(url, stream=True)
+        with res:
+            res.raise_for_status()
+            yield from res.iter_content(chunk_size)
+        return
+
+    body_path, meta_path = _paths(url)
+    meta, _ = _read_meta(url)
+    if meta is not None and (immutable or HTTP_CACHE_OFFLINE):
+        yield from _file_chunks(body_path, chunk_size)
+        return
+
+    res = _network_get(url, _revalidation_headers(meta), stream=True)
+    with res:
+        if res.status_code == 304 and meta is not None:
+            yield from _file_chunks(body_path, chunk_size)
+            return
+        res.raise_for_status()
+
+        os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+        tmp = f"{body_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in res.iter_content(chunk_size):
+                    f.write(chunk)
+                    yield chunk
+            os.replace(tmp, body_path)
+            _write_meta(url, res)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
@@ -0,0 +1,77 @@
+# backend/org-collector-service/src/org_collector/services/json_stream.py
+import codecs
+import json
+import re
+
+_WS = re.compile(r"[\s,]*")
+_decoder = json.JSONDecoder()
+
+
+def iter_json_array(chunks, key_path):
+    """
+    Yield the elements of the array found under `key_path` in a JSON
+    document that arrives as byte chunks, e.g.
+
+        iter_json_array(chunks, ("allOrganization", "edges"))
+
+    Each key is located in order after the previous one (keys of the
+    nesting path, not a full JSON path match), then every element is
+    parsed with raw_decode as soon as it is complete. Only the element
+    being parsed is held in memory, never the whole document. Elements
+    must be objects or arrays: a truncated one never parses, so "needs
+    more input" and "element done" can't be confused.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    it = iter(chunks)
+    buf = ""
+    eof = False
+
+    def more():
+        nonlocal buf, eof
+        chunk = next(it, None)
+        if chunk is None:
+            eof = True
+            buf += utf8.decode(b"", final=True)
+        else:
+            buf += utf8.decode(chunk)
+
+    # 1) walk to the opening bracket of the array
+    for i, key in enumerate(key_path):
+        pattern = re.compile(r'"%s"\s*:\s*%s' % (re.escape(key), r"\[" if i == len(key_path) - 1 else ""))
+        while True:
+            m = pattern.search(buf)
+            if m:
+                buf = buf[m.end():]
+                break
+            if eof:
+                raise ValueError(f"key {key!r} not found in JSON stream")
+            # keep a tail in case the key is split across chunks
+            buf = buf[-(len(key) + 64):]
+            more()
+
+    # 2) decode elements one by one
+    pos = 0
+    while True:
+        pos = _WS.match(buf, pos).end()
+        if pos >= len(buf):
+            if eof:
+                raise ValueError("JSON stream ended inside the array")
+            buf, pos = buf[pos:], 0
+            more()
+            continue
+        if buf[pos] == "]":
+            # read the rest so the source completes (cached_iter only
+            # commits its cache entry once the body was fully read)
+            for _ in it:
+                pass
+            return
+        try:
+            item, end = _decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            buf, pos = buf[pos:], 0
+            more()
+            continue
+        yield item
+        pos = end
@@ -1,45 +1,54 @@
-import requests
+from org_collector.config import GSOC_ORGANIZATIONS_BASE_URL
+from org_collector.services.http_cache import cached_iter
+from org_collector.services.json_stream import iter_json_array
 
-MASTER_ORG_URL = "https://www.gsocorganizations.dev/page-data/index/page-data.json"
+MASTER_ORG_URL = GSOC_ORGANIZATIONS_BASE_URL + "/page-data/index/page-data.json"
 
 
-def fetch_master_orgs():
-    print("Fetching master org list...")
+def parse_master_org(node: dict):
+    # extract years participated
+    years_dict = node.get("years", {})
+    years = []
+    for key, val in years_dict.items():
+        # keys like _2016, _2018
+        y = int(key.replace("_", ""))
 
-    res = requests.get(MASTER_ORG_URL)
-    res.raise_for_status()
+        # if value is null OR object → means participated
+        if val is None or isinstance(val, dict):
+            years.append(y)
 
-    data = res.json()
+    return {
+        "org_slug": node.get("name").lower().replace(" ", "-"),  # fallback slug
+        "name": node.get("name"),
+        "category": node.get("category"),
+        "description": node.get("description"),
+        "technologies": node.get("technologies", []),
+        "topics": node.get("topics", []),
+        "image_url": node.get("image_url"),
+        "image_background_color": node.get("image_background_color"),
+        "website_url": node.get("url"),
+        "years_participated": years
+    }
 
-    edges = data["result"]["data"]["allOrganization"]["edges"]
 
-    master_orgs = []
+def iter_master_nodes():
+    """
+    Generator over the raw org nodes of result.data.allOrganization.edges,
+    parsed while the page-data body streams in (from the network or the
+    HTTP cache), so orgs can be written before the download finishes.
+    """
+    print("Streaming master org list...")
 
-    for edge in edges:
-        node = edge["node"]
+    # the index changes between seasons, so always revalidate
+    for edge in iter_json_array(cached_iter(MASTER_ORG_URL), ("allOrganization", "edges")):
+        yield edge["node"]
 
-        # extract years participated
-        years_dict = node.get("years", {})
-        years = []
-        for key, val in years_dict.items():
-            # keys like _2016, _2018
-            y = int(key.replace("_", ""))
 
-            # if value is null OR object → means participated
-            if val is None or isinstance(val, dict):
-                years.append(y)
+def iter_master_orgs():
+    for node in iter_master_nodes():
+        yield parse_master_org(node)
 
-        master_orgs.append({
-            "org_slug": node.get("name").lower().replace(" ", "-"),  # fallback slug
-            "name": node.get("name"),
-            "category": node.get("category"),
-            "description": node.get("description"),
-            "technologies": node.get("technologies", []),
-            "topics": node.get("topics", []),
-            "image_url": node.get("image_url"),
-            "image_background_color": node.get("image_background_color"),
-            "website_url": node.get("url"),
-            "years_participated": years
-        })
 
-    return master_orgs
+def fetch_master_orgs():
+    """The whole master org list at once."""
+    return list(iter_master_orgs())
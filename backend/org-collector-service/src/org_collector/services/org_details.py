@@ -1,30 +1,30 @@
-import requests
+from org_collector.config import GSOC_ARCHIVE_BASE_URL
+from org_collector.services.http_cache import cached_get, is_past_year
 
-ORG_DETAILS_URL = (
-    "https://summerofcode.withgoogle.com/api/archive/programs/{year}/organizations/{slug}/"
-)
+ORG_DETAILS_URL = GSOC_ARCHIVE_BASE_URL + "/api/archive/programs/{year}/organizations/{slug}/"
 
 
-def fetch_org_details(year: int, slug: str):
-    """
-    Fetch full details for an organization + list of projects for that specific year.
-
-    Returns:
-    {
-        "org": {...},
-        "projects": [ {...}, {...} ]
-    }
-    """
+def fetch_org_details_payload(year: int, slug: str):
+    """Raw details payload of an org-year as returned by the archive API (None on failure)."""
     url = ORG_DETAILS_URL.format(year=year, slug=slug)
     print(f"[ORG DETAILS] Fetching: {url}")
 
-    res = requests.get(url)
+    res = cached_get(url, immutable=is_past_year(year))
     if res.status_code != 200:
         print(f"[ORG DETAILS] FAILED: {url}")
         return None
 
-    data = res.json()
+    return res.json()
+
 
+def parse_org_details(data: dict, year: int):
+    """
+    Returns:
+    {
+        "org": {...},
+        "projects": [ {...}, {...} ]
+    }
+    """
     # Extract full org data
     org_info = {
         "slug": data.get("slug"),
@@ -71,3 +71,9 @@ def fetch_org_details(year: int, slug: str):
         "org": org_info,
         "projects": project_list
     }
+
+
+def fetch_org_details(year: int, slug: str):
+    """Fetch full details for an organization + list of projects for that specific year."""
+    data = fetch_org_details_payload(year, slug)
+    return parse_org_details(data, year) if data is not None else None
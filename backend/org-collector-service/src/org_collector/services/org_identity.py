@@ -0,0 +1,265 @@
+# backend/org-collector-service/src/org_collector/services/org_identity.py
+import re
+import threading
+import traceback
+import unicodedata
+from urllib.parse import urlsplit
+from psycopg.rows import dict_row
+from database.connect import pooled_conn
+
+SLUG, NAME, WEBSITE = "slug", "name", "website"
+
+UPSERT_ALIAS_SQL = """
+    INSERT INTO org_aliases (alias_type, alias, org_slug, source)
+    VALUES (%s,%s,%s,%s)
+    ON CONFLICT (alias_type, alias) DO UPDATE SET
+      org_slug = EXCLUDED.org_slug,
+      source = EXCLUDED.source;
+"""
+
+# org columns merged from a duplicate into its canonical row (canonical wins)
+MERGE_COLUMNS = (
+    "org_id", "name", "category", "tagline", "description", "description_html",
+    "technologies", "tech_tags", "topics", "topic_tags", "website_url", "gsoc_url",
+    "ideas_list_url", "logo_url", "logo_bg_color", "contact_links",
+)
+
+
+def normalize_name(name: str):
+    """'The Tor Project, Inc.' -> 'torprojectinc'."""
+    if not name:
+        return None
+    s = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    s = re.sub(r"^the\s+", "", s.strip())
+    s = re.sub(r"[^a-z0-9]", "", s)
+    return s or None
+
+
+def normalize_website(url: str):
+    """'https://www.Python.org/' -> 'python.org'; paths are kept (github.com/foo)."""
+    if not url:
+        return None
+    parts = urlsplit(url.strip() if "//" in url else "//" + url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if not host:
+        return None
+    path = parts.path.rstrip("/").lower()
+    return host + path
+
+
+class OrgResolver:
+    """
+    In-memory alias index: (slug | normalized name | website) -> canonical slug.
+
+    Google's archive slugs are trusted; slugs derived from names (master
+    list) are not. A derived row takes the canonical slug of any org it
+    matches. A trusted row keeps its own slug, and if it matches an org
+    known only under a derived slug, that org is renamed to it (the
+    rename is applied to the DB on flush()). Two trusted slugs are never
+    merged on name / website alone.
+    """
+
+    def __init__(self, aliases=(), trusted=()):
+        self._by_key = {(t, a): slug for t, a, slug in aliases}
+        self.trusted = set(trusted)
+        self._new = {}
+        self.renames = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls):
+        with pooled_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT alias_type, alias, org_slug, source FROM org_aliases")
+                rows = cur.fetchall()
+        return cls(
+            [(t, a, slug) for t, a, slug, _ in rows],
+            {slug for _, _, slug, source in rows if source == "google"}
+        )
+
+    def _keys(self, slug, name, website):
+        keys = [(SLUG, slug), (WEBSITE, normalize_website(website)), (NAME, normalize_name(name))]
+        return [k for k in keys if k[1]]
+
+    def resolve(self, slug: str, name: str = None, website: str = None, trusted: bool = False):
+        """Canonical slug for an incoming org row, learning its aliases."""
+        if not slug:
+            return slug
+        with self._lock:
+            keys = self._keys(slug, name, website)
+            canonical = self._by_key.get((SLUG, slug))
+            if canonical is None:
+                match = next((self._by_key[k] for k in keys[1:] if k in self._by_key), None)
+                if not trusted:
+                    canonical = match
+                elif match is not None and match not in self.trusted:
+                    self._rename(match, slug)
+            if canonical is None:
+                canonical = slug
+            if trusted and canonical == slug:
+                self.trusted.add(slug)
+
+            source = "google" if canonical in self.trusted else "derived"
+            for k in keys:
+                if k not in self._by_key:
+                    self._by_key[k] = canonical
+                    self._new[k] = (canonical, source)
+            return canonical
+
+    def _rename(self, old: str, new: str):
+        for k, v in self._by_key.items():
+            if v == old:
+                self._by_key[k] = new
+                self._new[k] = (new, "google")
+        self.renames[old] = new
+
+    def flush(self):
+        """Persist learned aliases and merge renamed orgs into their new slug."""
+        with self._lock:
+            new, self._new = self._new, {}
+            renames, self.renames = self.renames, {}
+        if not new and not renames:
+            return
+        with pooled_conn() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(
+                    UPSERT_ALIAS_SQL,
+                    [(t, a, slug, source) for (t, a), (slug, source) in new.items()]
+                )
+                for old, target in renames.items():
+                    print(f"Merging org {old} into {target}")
+                    merge_org_into(cur, old, target)
+
+
+def merge_org_into(cur, old: str, new: str):
+    """
+    Fold org `old` into `new` inside the caller's transaction: fill the
+    canonical row's gaps, union years, repoint projects / repos / aliases,
+    drop rows derived from the old slug, then delete it.
+    """
+    cols = ", ".join(MERGE_COLUMNS)
+    params = {"old": old, "new": new}
+    # the target may not be written yet: start it as a copy of the duplicate
+    cur.execute(
+        f"""
+        INSERT INTO orgs (org_slug, {cols}, years_participated, created_at, updated_at)
+        SELECT %(new)s, {cols}, years_participated, created_at, NOW()
+        FROM orgs WHERE org_slug = %(old)s
+        ON CONFLICT (org_slug) DO NOTHING
+        """,
+        params
+    )
+    fill = ",\n".join(f"{c} = COALESCE(t.{c}, d.{c})" for c in MERGE_COLUMNS)
+    cur.execute(
+        f"""
+        UPDATE orgs t SET
+          {fill},
+          years_participated = (
+              SELECT array_agg(DISTINCT y ORDER BY y)
+              FROM unnest(coalesce(t.years_participated, '{{}}') || coalesce(d.years_participated, '{{}}')) AS y
+          ),
+          updated_at = NOW()
+        FROM orgs d
+        WHERE t.org_slug = %(new)s AND d.org_slug = %(old)s
+        """,
+        params
+    )
+    cur.execute("UPDATE org_projects SET org_slug = %(new)s WHERE org_slug = %(old)s", params)
+    cur.execute("UPDATE repos SET org_slug = %(new)s WHERE org_slug = %(old)s", params)
+    # fingerprints and scoring tables are rebuilt by the next sync / table job
+    cur.execute("DELETE FROM sync_fingerprints WHERE org_slug = %(old)s", params)
+    cur.execute("DELETE FROM org_similarity WHERE org_slug = %(old)s OR similar_slug = %(old)s", params)
+    cur.execute("DELETE FROM org_return_scores WHERE org_slug = %(old)s", params)
+    cur.execute("UPDATE org_aliases SET org_slug = %(new)s WHERE org_slug = %(old)s", params)
+    cur.execute(UPSERT_ALIAS_SQL, (SLUG, old, new, "merge"))
+    cur.execute("DELETE FROM orgs WHERE org_slug = %(old)s", params)
+
+
+def _trusted_slugs(cur):
+    # slugs that came from Google's archive (yearly list / details / projects)
+    cur.execute(
+        """
+        SELECT org_slug FROM sync_fingerprints WHERE scope IN ('yearly', 'details')
+        UNION SELECT org_slug FROM org_projects WHERE org_slug IS NOT NULL
+        UNION SELECT org_slug FROM org_aliases WHERE source = 'google'
+        """
+    )
+    return {r["org_slug"] for r in cur.fetchall()}
+
+
+def find_duplicate_groups(orgs):
+    """Connected groups (len > 1) of org slugs sharing a normalized name or website."""
+    parent = {o["org_slug"]: o["org_slug"] for o in orgs}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    first_by_key = {}
+    for o in orgs:
+        for key in ((NAME, normalize_name(o["name"])), (WEBSITE, normalize_website(o["website_url"]))):
+            if not key[1]:
+                continue
+            other = first_by_key.setdefault(key, o["org_slug"])
+            parent[find(o["org_slug"])] = find(other)
+
+    groups = {}
+    for slug in parent:
+        groups.setdefault(find(slug), []).append(slug)
+    return [sorted(g) for g in groups.values() if len(g) > 1]
+
+
+def merge_duplicate_orgs(dry_run: bool = False):
+    """
+    One-off cleanup: merge existing duplicate orgs into a canonical slug
+    (the Google one when there is exactly one; otherwise the row with the
+    most years), then seed org_aliases from every remaining org so later
+    syncs resolve to the same slugs. Groups with several Google slugs are
+    reported, not merged.
+    """
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute("SELECT org_slug, name, website_url, years_participated FROM orgs")
+            orgs = cur.fetchall()
+            trusted = _trusted_slugs(cur)
+
+    years = {o["org_slug"]: len(o["years_participated"] or []) for o in orgs}
+    merges, conflicts = [], []
+    for group in find_duplicate_groups(orgs):
+        google = [s for s in group if s in trusted]
+        if len(google) > 1:
+            conflicts.append(group)
+            continue
+        canonical = google[0] if google else max(group, key=lambda s: (years[s], -len(s), s))
+        merges.extend((s, canonical) for s in group if s != canonical)
+
+    report = {"orgs": len(orgs), "merges": merges, "conflicts": conflicts, "dry_run": dry_run}
+    if dry_run:
+        return report
+
+    done = 0
+    for old, new in merges:
+        try:
+            with pooled_conn() as conn:
+                with conn.cursor() as cur:
+                    merge_org_into(cur, old, new)
+            done += 1
+        except Exception:
+            print(f"Failed merging org {old} into {new}")
+            traceback.print_exc()
+
+    # seed the alias index from what is left
+    merged = {old for old, _ in merges}
+    resolver = OrgResolver.load()
+    for o in orgs:
+        if o["org_slug"] not in merged:
+            resolver.resolve(o["org_slug"], o["name"], o["website_url"], trusted=o["org_slug"] in trusted)
+    resolver.renames.clear()  # duplicates were merged above
+    resolver.flush()
+
+    report["merged"] = done
+    return report
@@ -0,0 +1,85 @@
+# backend/org-collector-service/src/org_collector/services/org_queries.py
+from psycopg.rows import dict_row
+from database.connect import pooled_conn
+
+LIST_COLUMNS = """
+    org_slug, name, category, tagline, logo_url, logo_bg_color, website_url,
+    tech_tags, topic_tags, years_participated
+"""
+
+
+def list_orgs(after: str = None, limit: int = 50, tech_tags=None, topic_tags=None,
+              category: str = None, years=None):
+    """
+    One page of orgs ordered by org_slug, using keyset pagination:
+    pass the previous page's next_cursor as `after`. Tag and year filters
+    match orgs that have *all* the given values (array @>, GIN indexed).
+
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    where, params = [], []
+    if after:
+        where.append("org_slug > %s")
+        params.append(after)
+    if tech_tags:
+        where.append("tech_tags @> %s::text[]")
+        params.append(list(tech_tags))
+    if topic_tags:
+        where.append("topic_tags @> %s::text[]")
+        params.append(list(topic_tags))
+    if category:
+        where.append("category = %s")
+        params.append(category)
+    if years:
+        where.append("years_participated @> %s::int[]")
+        params.append(list(years))
+
+    sql = f"SELECT {LIST_COLUMNS} FROM orgs"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    # fetch one extra row to know whether there is a next page
+    sql += " ORDER BY org_slug LIMIT %s"
+    params.append(limit + 1)
+
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1]["org_slug"]
+    return rows, next_cursor
+
+
+def search_projects(q: str, org_slug: str = None, year: int = None,
+                    limit: int = 20, offset: int = 0):
+    """
+    Ranked full-text search over project titles and abstracts.
+    `q` uses web search syntax ("quoted phrase", -exclude, or); matching
+    goes through the GIN index on org_projects.search_tsv.
+    """
+    where = ["p.search_tsv @@ q"]
+    params = [q]
+    if org_slug:
+        where.append("p.org_slug = %s")
+        params.append(org_slug)
+    if year:
+        where.append("p.year = %s")
+        params.append(year)
+    params += [limit, offset]
+
+    sql = f"""
+        SELECT p.project_id, p.org_slug, p.organization_name, p.year, p.title,
+               p.short_abstract, p.tech_tags, p.project_code_url,
+               ts_rank_cd(p.search_tsv, q) AS rank
+        FROM org_projects p, websearch_to_tsquery('english', %s) AS q
+        WHERE {" AND ".join(where)}
+        ORDER BY rank DESC, p.project_id
+        LIMIT %s OFFSET %s
+    """
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(sql, params)
+            return cur.fetchall()
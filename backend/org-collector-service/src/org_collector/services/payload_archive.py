@@ -0,0 +1,132 @@
+# backend/org-collector-service/src/org_collector/services/payload_archive.py
+import fcntl
+import glob
+import gzip
+import json
+import os
+import threading
+import time
+from org_collector.config import PAYLOAD_ARCHIVE_DIR, ARCHIVE_FLUSH_RECORDS
+# archive record kinds are the fingerprint scopes
+from org_collector.services.fingerprints import payload_fingerprint, MASTER, YEARLY, DETAILS
+
+# the master list isn't tied to a program year
+MASTER_YEAR = 0
+
+
+def archive_path(year: int, directory: str = PAYLOAD_ARCHIVE_DIR):
+    return os.path.join(directory, f"{year}.jsonl.gz")
+
+
+def index_path(year: int, directory: str = PAYLOAD_ARCHIVE_DIR):
+    """Sidecar {"kind\tkey": fingerprint} of the last record archived per key."""
+    return os.path.join(directory, f"{year}.index.json")
+
+
+def _load_index(year: int, directory: str):
+    # an index without its data file (archive cleared by hand) means nothing is archived
+    if not os.path.exists(archive_path(year, directory)):
+        return {}
+    try:
+        with open(index_path(year, directory), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class PayloadArchive:
+    """
+    Append-only store of raw fetched payloads: one gzip JSON-lines file
+    per year, each record {"kind", "key", "fetched_at", "payload"}.
+
+    Only payloads whose fingerprint differs from the last archived one
+    for the same (kind, key) are written, so re-syncing unchanged (or
+    HTTP-cached) pages doesn't grow the files. The fingerprints live in a
+    small sidecar index per year.
+
+    Records are buffered per year and appended as one gzip member (a file
+    of concatenated members is still one valid gzip stream). Callers flush
+    before checkpointing work that depends on them. Appends hold an flock,
+    so shard processes can share the files; readers keep the last record
+    per (kind, key).
+    """
+
+    def __init__(self, directory: str = PAYLOAD_ARCHIVE_DIR, flush_records: int = ARCHIVE_FLUSH_RECORDS):
+        self.directory = directory
+        self.flush_records = flush_records
+        self._buffers = {}
+        self._indexes = {}   # year -> {"kind\tkey": fingerprint}, archived or buffered
+        self._pending = {}   # year -> index entries buffered but not written yet
+        self._lock = threading.Lock()
+
+    def add(self, year: int, kind: str, key: str, payload):
+        """Buffer `payload` unless it matches what is already archived. Returns True if buffered."""
+        if not self.directory:
+            return False
+        fp = payload_fingerprint(payload)
+        index_key = f"{kind}\t{key}"
+        with self._lock:
+            if year not in self._indexes:
+                self._indexes[year] = _load_index(year, self.directory)
+            if self._indexes[year].get(index_key) == fp:
+                return False
+            self._indexes[year][index_key] = fp
+            self._pending.setdefault(year, {})[index_key] = fp
+            self._buffers.setdefault(year, []).append(json.dumps(
+                {"kind": kind, "key": key, "fetched_at": time.time(), "payload": payload},
+                separators=(",", ":")
+            ))
+            if len(self._buffers[year]) >= self.flush_records:
+                self._flush_year(year)
+        return True
+
+    def flush(self, year: int = None):
+        """Write buffered records (of one year, or all) to disk."""
+        with self._lock:
+            for y in ([year] if year is not None else list(self._buffers)):
+                if y in self._buffers:
+                    self._flush_year(y)
+
+    def _flush_year(self, year: int):
+        lines = self._buffers.pop(year)
+        pending = self._pending.pop(year, {})
+        os.makedirs(self.directory, exist_ok=True)
+        member = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"))
+        with open(archive_path(year, self.directory), "ab") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.write(member)
+                f.flush()
+                # index after data: a crash in between only costs a duplicate record
+                index = _load_index(year, self.directory)
+                index.update(pending)
+                tmp = index_path(year, self.directory) + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as out:
+                    json.dump(index, out, separators=(",", ":"))
+                os.replace(tmp, index_path(year, self.directory))
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def read_archive(year: int, directory: str = PAYLOAD_ARCHIVE_DIR):
+    """{(kind, key): payload} of a year, last record winning; {} if not archived."""
+    path = archive_path(year, directory)
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            r = json.loads(line)
+            records[(r["kind"], r["key"])] = r["payload"]
+    return records
+
+
+def archived_years(directory: str = PAYLOAD_ARCHIVE_DIR):
+    years = []
+    for path in glob.glob(os.path.join(directory, "*.jsonl.gz")):
+        name = os.path.basename(path).split(".", 1)[0]
+        if name.isdigit() and int(name) != MASTER_YEAR:
+            years.append(int(name))
+    return sorted(years)
@@ -0,0 +1,80 @@
+# backend/org-collector-service/src/org_collector/services/payload_sources.py
+import threading
+from org_collector.services.master_orgs import iter_master_nodes, parse_master_org
+from org_collector.services.yearly_orgs import fetch_yearly_payload, parse_yearly_orgs
+from org_collector.services.org_details import fetch_org_details_payload, parse_org_details
+from org_collector.services.fingerprints import MASTER, YEARLY, DETAILS
+from org_collector.services.payload_archive import PayloadArchive, read_archive, MASTER_YEAR
+
+# Where the sync pipeline gets its payloads from. Both sources hand out the
+# same parsed shapes; only the raw payloads' origin differs.
+
+
+class LiveSource:
+    """Fetch from the GSoC archive (through the HTTP cache), archiving changed raw payloads."""
+
+    def __init__(self, archive: PayloadArchive = None):
+        self.archive = archive or PayloadArchive()
+
+    def master_orgs(self):
+        for node in iter_master_nodes():
+            self.archive.add(MASTER_YEAR, MASTER, node.get("name"), node)
+            yield parse_master_org(node)
+
+    def yearly_orgs(self, year: int):
+        data = fetch_yearly_payload(year)
+        if data is None:
+            return []
+        self.archive.add(year, YEARLY, "", data)
+        return parse_yearly_orgs(data, year)
+
+    def org_details(self, year: int, slug: str):
+        data = fetch_org_details_payload(year, slug)
+        if data is None:
+            return None
+        self.archive.add(year, DETAILS, slug, data)
+        return parse_org_details(data, year)
+
+    def flush(self, year: int = None):
+        """Persist archived payloads before the job checkpoints the work they back."""
+        self.archive.flush(year)
+
+    def close(self):
+        self.archive.flush()
+
+
+class ArchiveSource:
+    """Replay payloads from the local archive only; never touches the network."""
+
+    def __init__(self, directory: str = None):
+        self.directory = directory
+        self._years = {}
+        self._lock = threading.Lock()
+
+    def _records(self, year: int):
+        with self._lock:
+            if year not in self._years:
+                kwargs = {"directory": self.directory} if self.directory else {}
+                self._years[year] = read_archive(year, **kwargs)
+            return self._years[year]
+
+    def master_orgs(self):
+        for (kind, _), node in self._records(MASTER_YEAR).items():
+            if kind == MASTER:
+                yield parse_master_org(node)
+
+    def yearly_orgs(self, year: int):
+        data = self._records(year).get((YEARLY, ""))
+        if data is None:
+            raise LookupError(f"no archived org list for {year}")
+        return parse_yearly_orgs(data, year)
+
+    def org_details(self, year: int, slug: str):
+        data = self._records(year).get((DETAILS, slug))
+        return parse_org_details(data, year) if data is not None else None
+
+    def flush(self, year: int = None):
+        pass
+
+    def close(self):
+        self._years.clear()
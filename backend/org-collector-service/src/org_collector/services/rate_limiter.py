@@ -0,0 +1,40 @@
+# backend/org-collector-service/src/org_collector/services/rate_limiter.py
+import threading
+import time
+from org_collector.config import REQUESTS_PER_SECOND, REQUEST_BURST
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    `rate` tokens are added per second up to `capacity`; acquire() blocks
+    until a token is available, so all callers share one requests/s budget.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: int = 1):
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# the single requests/s budget for every archive request in this process
+archive_limiter = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
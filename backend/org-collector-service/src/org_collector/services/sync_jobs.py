@@ -0,0 +1,271 @@
+# backend/org-collector-service/src/org_collector/services/sync_jobs.py
+import threading
+import traceback
+import uuid
+from contextlib import contextmanager
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from database.connect import pooled_conn
+from org_collector.config import JOB_STALE_SECONDS, JOB_HEARTBEAT_SECONDS
+
+JOB_COLUMNS = """
+    job_id, status, params, master_done, years_listed, year_totals,
+    orgs_done, projects_done, errors, last_error, orgs_at_resume,
+    projects_at_resume, started_at, resumed_at, updated_at, heartbeat_at, finished_at
+"""
+
+
+class SyncJob:
+    """
+    Persisted state of one sync run.
+
+    Checkpoints are written as work completes (master list written, yearly
+    list of a year written, details of an org-year written), so a job that
+    is loaded again after a restart skips everything already done.
+    While it runs, heartbeat() bumps heartbeat_at on a timer so a slow but
+    live job is never mistaken for a dead one.
+    """
+
+    def __init__(self, job_id: str, params: dict, master_done: bool = False,
+                 years_listed=None, done_orgs=None):
+        self.job_id = job_id
+        self.params = params
+        self.master_done = master_done
+        self.years_listed = set(years_listed or [])
+        self.done_orgs = set(done_orgs or [])
+        # errors recorded by this run (the errors column spans every run)
+        self.run_errors = 0
+
+    @classmethod
+    def create(cls, params: dict):
+        job_id = uuid.uuid4().hex
+        with pooled_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO sync_jobs
+                    (job_id, status, params, started_at, resumed_at, updated_at, heartbeat_at)
+                    VALUES (%s, 'running', %s, NOW(), NOW(), NOW(), NOW())
+                    """,
+                    (job_id, Jsonb(params))
+                )
+        return cls(job_id, params)
+
+    @classmethod
+    def load(cls, job_id: str):
+        """Load a job with its checkpoints and mark it running again."""
+        with pooled_conn() as conn:
+            with conn.cursor(row_factory=dict_row) as cur:
+                cur.execute(
+                    """
+                    UPDATE sync_jobs SET
+                      status = 'running',
+                      finished_at = NULL,
+                      resumed_at = NOW(),
+                      updated_at = NOW(),
+                      heartbeat_at = NOW(),
+                      orgs_at_resume = orgs_done,
+                      projects_at_resume = projects_done
+                    WHERE job_id = %s
+                    RETURNING job_id, params, master_done, years_listed
+                    """,
+                    (job_id,)
+                )
+                row = cur.fetchone()
+                if not row:
+                    return None
+                cur.execute(
+                    "SELECT year, org_slug FROM sync_job_checkpoints WHERE job_id = %s",
+                    (job_id,)
+                )
+                done = [(r["year"], r["org_slug"]) for r in cur.fetchall()]
+        return cls(row["job_id"], row["params"], row["master_done"], row["years_listed"], done)
+
+    def _update(self, sql: str, params: tuple):
+        with pooled_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+
+    def is_org_done(self, year: int, slug: str):
+        return (year, slug) in self.done_orgs
+
+    def mark_master_done(self):
+        self._update(
+            "UPDATE sync_jobs SET master_done = TRUE, updated_at = NOW() WHERE job_id = %s",
+            (self.job_id,)
+        )
+        self.master_done = True
+
+    def record_year_total(self, year: int, n_orgs: int):
+        self._update(
+            """
+            UPDATE sync_jobs SET
+              year_totals = year_totals || jsonb_build_object(%s::text, %s::int),
+              updated_at = NOW()
+            WHERE job_id = %s
+            """,
+            (year, n_orgs, self.job_id)
+        )
+
+    def mark_year_listed(self, year: int):
+        self._update(
+            """
+            UPDATE sync_jobs SET
+              years_listed = array_append(array_remove(years_listed, %s), %s),
+              updated_at = NOW()
+            WHERE job_id = %s
+            """,
+            (year, year, self.job_id)
+        )
+        self.years_listed.add(year)
+
+    def mark_orgs_done(self, year: int, done):
+        """done: iterable of (org_slug, n_projects) finished for `year`."""
+        projects_by_slug = dict(done)
+        if not projects_by_slug:
+            return
+        with pooled_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO sync_job_checkpoints (job_id, year, org_slug)
+                    SELECT %s, %s, unnest(%s::text[])
+                    ON CONFLICT DO NOTHING
+                    RETURNING org_slug
+                    """,
+                    (self.job_id, year, list(projects_by_slug))
+                )
+                new = [r[0] for r in cur.fetchall()]
+                # only count checkpoints that weren't there already
+                cur.execute(
+                    """
+                    UPDATE sync_jobs SET
+                      orgs_done = orgs_done + %s,
+                      projects_done = projects_done + %s,
+                      updated_at = NOW()
+                    WHERE job_id = %s
+                    """,
+                    (len(new), sum(projects_by_slug[s] for s in new), self.job_id)
+                )
+        self.done_orgs.update((year, slug) for slug in projects_by_slug)
+
+    def mark_org_done(self, year: int, slug: str, n_projects: int = 0):
+        self.mark_orgs_done(year, [(slug, n_projects)])
+
+    def record_error(self, message: str):
+        self.run_errors += 1
+        self._update(
+            """
+            UPDATE sync_jobs SET errors = errors + 1, last_error = %s, updated_at = NOW()
+            WHERE job_id = %s
+            """,
+            (message, self.job_id)
+        )
+
+    @contextmanager
+    def heartbeat(self):
+        """Bump heartbeat_at every JOB_HEARTBEAT_SECONDS until the block exits."""
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(JOB_HEARTBEAT_SECONDS):
+                try:
+                    self._update(
+                        "UPDATE sync_jobs SET heartbeat_at = NOW() WHERE job_id = %s AND status = 'running'",
+                        (self.job_id,)
+                    )
+                except Exception:
+                    print(f"Failed heartbeat for sync job {self.job_id}")
+                    traceback.print_exc()
+
+        thread = threading.Thread(target=beat, daemon=True, name=f"sync-job-{self.job_id[:8]}")
+        thread.start()
+        try:
+            yield self
+        finally:
+            stop.set()
+            thread.join()
+
+    def finish(self, status: str = None):
+        """
+        Close the job. Without an explicit status it ends 'finished', or
+        'finished_with_errors' when this run recorded errors; such a job can
+        be resumed to retry the failed org-years.
+        """
+        if status is None:
+            status = "finished_with_errors" if self.run_errors else "finished"
+        self._update(
+            """
+            UPDATE sync_jobs SET status = %s, finished_at = NOW(), updated_at = NOW()
+            WHERE job_id = %s
+            """,
+            (status, self.job_id)
+        )
+
+
+def claim_stale_jobs():
+    """
+    Return ids of 'running' jobs whose heartbeat stopped JOB_STALE_SECONDS
+    ago (their process died). Claiming bumps heartbeat_at, so concurrent
+    workers starting up do not resume the same job twice.
+    """
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE sync_jobs SET heartbeat_at = NOW()
+                WHERE status = 'running'
+                  AND COALESCE(heartbeat_at, updated_at) < NOW() - make_interval(secs => %s)
+                RETURNING job_id
+                """,
+                (JOB_STALE_SECONDS,)
+            )
+            return [r[0] for r in cur.fetchall()]
+
+
+def get_job_report(job_id: str):
+    """Progress, throughput and ETA of a job, or None if it doesn't exist."""
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(f"SELECT {JOB_COLUMNS}, LOCALTIMESTAMP AS now FROM sync_jobs WHERE job_id = %s", (job_id,))
+            job = cur.fetchone()
+    if not job:
+        return None
+
+    total_orgs = sum((job["year_totals"] or {}).values())
+    end = job["finished_at"] or job["now"]
+    # throughput over the current run only (a resumed job restarts the clock)
+    since = job["resumed_at"] or job["started_at"]
+    elapsed = max((end - since).total_seconds(), 1e-6)
+    orgs_per_s = (job["orgs_done"] - job["orgs_at_resume"]) / elapsed
+    projects_per_s = (job["projects_done"] - job["projects_at_resume"]) / elapsed
+
+    eta_seconds = None
+    if job["status"] == "running" and orgs_per_s > 0 and total_orgs:
+        eta_seconds = round(max(total_orgs - job["orgs_done"], 0) / orgs_per_s, 1)
+
+    return {
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "params": job["params"],
+        "progress": {
+            "master_done": job["master_done"],
+            "years_listed": sorted(job["years_listed"] or []),
+            "total_orgs": total_orgs,
+            "orgs_done": job["orgs_done"],
+            "projects_done": job["projects_done"],
+            "percent": round(100.0 * job["orgs_done"] / total_orgs, 1) if total_orgs else None,
+        },
+        "throughput": {
+            "orgs_per_s": round(orgs_per_s, 3),
+            "projects_per_s": round(projects_per_s, 3),
+        },
+        "errors": job["errors"],
+        "last_error": job["last_error"],
+        "eta_seconds": eta_seconds,
+        "started_at": job["started_at"],
+        "resumed_at": job["resumed_at"],
+        "updated_at": job["updated_at"],
+        "heartbeat_at": job["heartbeat_at"],
+        "finished_at": job["finished_at"],
+    }
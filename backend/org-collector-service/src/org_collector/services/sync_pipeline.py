@@ -1,173 +1,390 @@
 # backend/org-collector-service/src/org_collector/services/sync_pipeline.py
-import time
 import traceback
-from org_collector.services.master_orgs import fetch_master_orgs
-from org_collector.services.yearly_orgs import fetch_yearly_orgs
-from org_collector.services.org_details import fetch_org_details
-from org_collector.services.db_ops import upsert_org, upsert_project
+import zlib
+from concurrent.futures import as_completed
+from itertools import islice
+from org_collector.config import MASTER_BATCH_SIZE, ARCHIVE_FLUSH_RECORDS
+from org_collector.services.payload_sources import LiveSource, ArchiveSource
+from org_collector.services.payload_archive import MASTER_YEAR
+from org_collector.services.org_identity import OrgResolver
+from org_collector.services.db_ops import upsert_orgs, upsert_org_year
 from org_collector.services.sync_status import update_sync_status
+from org_collector.services.fetch_engine import FetchEngine
+from org_collector.services.sync_jobs import SyncJob
+from org_collector.services.fingerprints import (
+    MASTER, YEARLY, DETAILS, payload_fingerprint, load_fingerprints
+)
 
 # parameters you can tweak
 YEARS = list(range(2016, 2024 + 1))
-SLEEP_BETWEEN_REQUESTS = 0.2  # seconds -- be polite
-SLEEP_BETWEEN_ORGS = 0.1
+
+
+def _master_org_row(m: dict):
+    return {
+        "org_slug": m.get("org_slug"),
+        "name": m.get("name"),
+        "category": m.get("category"),
+        "description": m.get("description"),
+        "technologies": m.get("technologies"),
+        "topics": m.get("topics"),
+        "website_url": m.get("website_url"),
+        "logo_url": m.get("image_url"),
+        "logo_bg_color": m.get("image_background_color"),
+        "years_participated": m.get("years_participated", [])
+    }
+
+
+def _yearly_org_row(g: dict, year: int):
+    return {
+        "org_slug": g.get("slug"),
+        "org_id": None,
+        "name": g.get("name"),
+        "tagline": g.get("tagline"),
+        "description_html": g.get("description_html"),
+        "tech_tags": g.get("tech_tags"),
+        "topic_tags": g.get("topic_tags"),
+        "website_url": g.get("website_url"),
+        "ideas_list_url": g.get("ideas_list_url"),
+        "logo_url": g.get("logo_url"),
+        "years_participated": [year]
+    }
+
+
+def _details_org_row(org_info: dict, year: int, slug: str):
+    return {
+        "org_slug": org_info.get("slug") or slug,
+        "org_id": None,
+        "name": org_info.get("name"),
+        "tagline": org_info.get("tagline"),
+        "description_html": org_info.get("description_html"),
+        "tech_tags": org_info.get("tech_tags"),
+        "topic_tags": org_info.get("topic_tags"),
+        "website_url": org_info.get("website_url"),
+        "ideas_list_url": org_info.get("ideas_list_url"),
+        "logo_url": org_info.get("logo_url"),
+        "contact_links": org_info.get("contact_links"),
+        "years_participated": [year]
+    }
+
+
+def _project_row(p: dict, year: int, slug: str):
+    return {
+        "project_id": p.get("project_id"),
+        "project_slug": p.get("project_id"),
+        "org_slug": p.get("organization_slug") or slug,
+        "organization_name": p.get("organization_name"),
+        "year": p.get("year") or year,
+        "title": p.get("title"),
+        "short_abstract": p.get("abstract_short"),
+        "long_abstract_html": p.get("abstract_html"),
+        "mentor_names": p.get("mentor_names"),
+        "contributor_display_name": p.get("contributor_display_name"),
+        "tech_tags": p.get("tech_tags"),
+        "topic_tags": p.get("topic_tags"),
+        "project_code_url": p.get("project_code_url"),
+        "project_url": None,
+        "status": p.get("status"),
+        "date_created": p.get("date_created"),
+        "date_archived": p.get("date_archived")
+    }
+
+
+def in_shard(slug: str, shard):
+    """shard = (index, count); stable across processes (unlike hash())."""
+    if not shard:
+        return True
+    index, count = shard
+    return zlib.crc32((slug or "").encode("utf-8")) % count == index
+
+
+def _changed_rows(entries, known: dict):
+    """
+    entries: iterable of (key, payload, row) with key = (org_slug, year, scope).
+    Returns (rows, fingerprint_rows) for the entries whose payload
+    fingerprint differs from the stored one.
+    """
+    rows, fingerprints = [], []
+    for key, payload, row in entries:
+        fp = payload_fingerprint(payload)
+        if known.get(key) == fp:
+            continue
+        rows.append(row)
+        fingerprints.append((*key, fp))
+    return rows, fingerprints
+
+
+def batched(iterable, size: int):
+    it = iter(iterable)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _canonical_row(row: dict, slug: str):
+    row["org_slug"] = slug
+    return row
+
+
+def _flush_aliases(resolver, job):
+    try:
+        resolver.flush()
+    except Exception as e:
+        print("Failed writing org aliases / merges.")
+        traceback.print_exc()
+        job.record_error(f"org aliases: {e!r}")
+
+
+def _sync_master(job, known: dict, source, resolver):
+    """
+    Stream the master list into the DB in MASTER_BATCH_SIZE batches: each
+    batch is written while the rest of the body is still downloading.
+    Upserts are idempotent, so a stream that fails halfway is simply
+    redone by the next run (master_done is only set at the end).
+    Master slugs are derived from names, so each org is first resolved to
+    its canonical slug.
+    """
+    seen = changed = 0
+    try:
+        for batch in batched(source.master_orgs(), MASTER_BATCH_SIZE):
+            entries = []
+            for m in batch:
+                slug = resolver.resolve(m.get("org_slug"), m.get("name"), m.get("website_url"))
+                entries.append(((slug, 0, MASTER), m, _canonical_row(_master_org_row(m), slug)))
+            rows, fingerprints = _changed_rows(entries, known)
+            upsert_orgs(rows, fingerprints)
+            seen += len(batch)
+            changed += len(rows)
+    except Exception as e:
+        print(f"Failed syncing master org list after {seen} orgs.")
+        traceback.print_exc()
+        job.record_error(f"master list: {e!r}")
+        return
+    print(f"Master orgs changed: {changed} / {seen}")
+    _flush_aliases(resolver, job)
+    source.flush(MASTER_YEAR)
+    job.mark_master_done()
+
+
+def _write_org_details(details: dict, year: int, slug: str, known: dict, resolver):
+    """
+    Upsert enriched org details plus all its projects in one transaction.
+    Returns False when the payload matches the stored fingerprint and the
+    write was skipped.
+    """
+    org_info = details.get("org", {})
+    canonical = resolver.resolve(
+        org_info.get("slug") or slug, org_info.get("name"), org_info.get("website_url"), trusted=True
+    )
+    key = (canonical, year, DETAILS)
+    fp = payload_fingerprint(details)
+    if known.get(key) == fp:
+        return False
+
+    projects = details.get("projects", [])
+    upsert_org_year(
+        _canonical_row(_details_org_row(org_info, year, slug), canonical),
+        [_canonical_row(_project_row(p, year, slug), canonical) for p in projects],
+        fingerprints=[(*key, fp)]
+    )
+    return True
+
+
+def _checkpoint_details(job, source, year: int, orgs):
+    """Persist the archived payloads of `orgs` first, then mark them done."""
+    source.flush(year)
+    job.mark_orgs_done(year, orgs)
+
 
 def sync_master_then_yearly_then_projects(
     do_master=True,
     do_yearly=True,
-    do_projects=True
+    do_projects=True,
+    force=False,
+    job=None,
+    years=None,
+    shard=None,
+    replay=False
 ):
     """
     Enhanced sync pipeline with toggleable stages:
       do_master  -> fetch and upsert master orgs (gsocorganizations.dev)
       do_yearly  -> fetch yearly Google org list (slug, tagline, tech, etc.)
       do_projects -> fetch detailed projects for each org-year
+      force      -> write every payload even if its fingerprint is unchanged
+      job        -> SyncJob to checkpoint into; a loaded job skips the work
+                    its checkpoints say is done. A new job is created if None.
+      years      -> subset of YEARS to sync (default: all)
+      shard      -> (index, count): only orgs whose slug hashes to this shard
+      replay     -> read payloads from the local payload archive instead of
+                    the network (rebuild orgs / org_projects offline)
+
+    Fetches run concurrently on a FetchEngine (shared requests/s budget);
+    every DB write happens on the calling thread as results arrive.
     """
 
-    print("STEP 4: Starting sync pipeline")
-    print(f"Modes => master: {do_master}, yearly: {do_yearly}, projects: {do_projects}")
+    years = list(years or YEARS)
+    if job is None:
+        job = SyncJob.create({
+            "master": do_master, "yearly": do_yearly, "projects": do_projects, "force": force,
+            "years": years, "shard": list(shard) if shard else None, "replay": replay
+        })
+
+    print(f"STEP 4: Starting sync pipeline (job {job.job_id})")
+    print(f"Modes => master: {do_master}, yearly: {do_yearly}, projects: {do_projects}, force: {force}")
+    print(f"Years => {years}, shard: {shard}, replay: {replay}")
+
+    source = ArchiveSource() if replay else LiveSource()
+    try:
+        with job.heartbeat():
+            _run_pipeline(job, do_master, do_yearly, do_projects, force, years, shard, source)
+    except Exception as e:
+        print("Sync pipeline aborted.")
+        traceback.print_exc()
+        job.record_error(repr(e))
+        job.finish("failed")
+        return
+    finally:
+        source.close()
+
+    # 'finished_with_errors' when some org-years failed; resuming retries them
+    job.finish()
+    print(f"\nSTEP 4: Sync pipeline finished ({job.run_errors} errors)")
+    update_sync_status("org_sync")
+
 
-    # ------------------------------
-    # 1) MASTER ORGS
-    # ------------------------------
-    if do_master:
-        print("\n=== MASTER ORGS SYNC ===")
+def resume_sync_job(job_id: str):
+    """Re-run a persisted job with its original modes, skipping checkpointed work."""
+    job = SyncJob.load(job_id)
+    if job is None:
+        print(f"Sync job not found: {job_id}")
+        return
+    p = job.params
+    sync_master_then_yearly_then_projects(
+        p.get("master", True), p.get("yearly", True), p.get("projects", True),
+        p.get("force", False), job, p.get("years"), p.get("shard"), p.get("replay", False)
+    )
+
+
+def _run_pipeline(job, do_master, do_yearly, do_projects, force, years, shard, source):
+    # fingerprints of what was last written, per (org_slug, year, scope)
+    known = {}
+    if not force:
         try:
-            master = fetch_master_orgs()
-            print(f"Master orgs loaded: {len(master)}")
+            known = load_fingerprints()
         except Exception:
-            print("Failed loading master org list.")
+            print("Failed loading sync fingerprints, writing everything.")
             traceback.print_exc()
-            master = []
-
-        for m in master:
-            try:
-                upsert_org({
-                    "org_slug": m.get("org_slug"),
-                    "name": m.get("name"),
-                    "category": m.get("category"),
-                    "description": m.get("description"),
-                    "technologies": m.get("technologies"),
-                    "topics": m.get("topics"),
-                    "website_url": m.get("website_url"),
-                    "logo_url": m.get("image_url"),
-                    "logo_bg_color": m.get("image_background_color"),
-                    "years_participated": m.get("years_participated", [])
-                })
-            except Exception:
-                print(f"Failed upsert master org: {m.get('name')}")
-                traceback.print_exc()
-
-            time.sleep(SLEEP_BETWEEN_REQUESTS)
-
-    # ------------------------------
-    # 2) YEARLY ORGS
-    # ------------------------------
-    if do_yearly:
-        print("\n=== YEARLY ORG SYNC ===")
-
-        for year in YEARS:
-            print(f"\n--- Processing year {year} ---")
-
-            try:
-                yearly = fetch_yearly_orgs(year)
-            except Exception:
-                print(f"Failed fetching yearly list for {year}")
-                traceback.print_exc()
-                yearly = []
 
-            # ------------------------------
-            # For each org in that year
-            # ------------------------------
-            for g in yearly:
-                slug = g.get("slug")
+    try:
+        resolver = OrgResolver.load()
+    except Exception:
+        print("Failed loading org aliases, starting with an empty index.")
+        traceback.print_exc()
+        resolver = OrgResolver()
+
+    try:
+        _run_stages(job, do_master, do_yearly, do_projects, years, shard, source, known, resolver)
+    finally:
+        _flush_aliases(resolver, job)
+
+
+def _run_stages(job, do_master, do_yearly, do_projects, years, shard, source, known, resolver):
+    with FetchEngine() as engine:
+        # ------------------------------
+        # 1) MASTER ORGS
+        # ------------------------------
+        if do_master and job.master_done:
+            print("\n=== MASTER ORGS SYNC === (done in an earlier run, skipping)")
+        elif do_master:
+            print("\n=== MASTER ORGS SYNC ===")
+            _sync_master(job, known, source, resolver)
+
+        # ------------------------------
+        # 2) YEARLY ORGS
+        # ------------------------------
+        if do_yearly:
+            print("\n=== YEARLY ORG SYNC ===")
+
+            year_futures = {engine.submit(source.yearly_orgs, year): year for year in years}
+            detail_futures = {}
+
+            for fut in as_completed(year_futures):
+                year = year_futures[fut]
+                print(f"\n--- Processing year {year} ---")
 
-                # YEARLY UPSERT
                 try:
-                    upsert_org({
-                        "org_slug": slug,
-                        "org_id": None,
-                        "name": g.get("name"),
-                        "tagline": g.get("tagline"),
-                        "description_html": g.get("description_html"),
-                        "tech_tags": g.get("tech_tags"),
-                        "topic_tags": g.get("topic_tags"),
-                        "website_url": g.get("website_url"),
-                        "ideas_list_url": g.get("ideas_list_url"),
-                        "logo_url": g.get("logo_url"),
-                        "years_participated": [year]
-                    })
-                except Exception:
-                    print(f"Failed upsert yearly org: {slug}")
+                    yearly = fut.result()
+                except Exception as e:
+                    print(f"Failed fetching yearly list for {year}")
                     traceback.print_exc()
+                    job.record_error(f"yearly list {year}: {e!r}")
+                    continue
 
-                time.sleep(SLEEP_BETWEEN_REQUESTS)
+                yearly = [g for g in yearly if in_shard(g.get("slug"), shard)]
+                job.record_year_total(year, len(yearly))
 
-                # ------------------------------
-                # 3) PROJECT DETAILS
-                # ------------------------------
+                # queue the detail fetches before writing so they overlap the upsert
                 if do_projects:
-                    try:
-                        details = fetch_org_details(year, slug)
-                        if not details:
+                    for g in yearly:
+                        slug = g.get("slug")
+                        if job.is_org_done(year, slug):
                             continue
+                        detail_futures[engine.submit(source.org_details, year, slug)] = (year, slug)
+
+                if year in job.years_listed:
+                    print(f"Yearly orgs for {year} written in an earlier run, skipping")
+                    continue
+
+                # YEARLY UPSERT (changed orgs of the year in one transaction)
+                entries = []
+                for g in yearly:
+                    slug = resolver.resolve(g.get("slug"), g.get("name"), g.get("website_url"), trusted=True)
+                    entries.append(((slug, year, YEARLY), g, _canonical_row(_yearly_org_row(g, year), slug)))
+                rows, fingerprints = _changed_rows(entries, known)
+                print(f"Yearly orgs changed in {year}: {len(rows)} / {len(yearly)}")
+                try:
+                    upsert_orgs(rows, fingerprints)
+                except Exception as e:
+                    print(f"Failed upsert yearly orgs for {year}")
+                    traceback.print_exc()
+                    job.record_error(f"yearly upsert {year}: {e!r}")
+                    continue
 
-                        org_info = details.get("org", {})
-                        projects = details.get("projects", [])
-
-                        # Upsert enriched org details
-                        try:
-                            upsert_org({
-                                "org_slug": org_info.get("slug") or slug,
-                                "org_id": None,
-                                "name": org_info.get("name"),
-                                "tagline": org_info.get("tagline"),
-                                "description_html": org_info.get("description_html"),
-                                "tech_tags": org_info.get("tech_tags"),
-                                "topic_tags": org_info.get("topic_tags"),
-                                "website_url": org_info.get("website_url"),
-                                "ideas_list_url": org_info.get("ideas_list_url"),
-                                "logo_url": org_info.get("logo_url"),
-                                "contact_links": org_info.get("contact_links"),
-                                "years_participated": [year]
-                            })
-                        except Exception:
-                            print(f"Failed upsert org(details): {slug}")
-                            traceback.print_exc()
-
-                        # Insert all projects
-                        for p in projects:
-                            try:
-                                upsert_project({
-                                    "project_id": p.get("project_id"),
-                                    "project_slug": p.get("project_id"),
-                                    "org_slug": p.get("organization_slug") or slug,
-                                    "organization_name": p.get("organization_name"),
-                                    "year": p.get("year") or year,
-                                    "title": p.get("title"),
-                                    "short_abstract": p.get("abstract_short"),
-                                    "long_abstract_html": p.get("abstract_html"),
-                                    "mentor_names": p.get("mentor_names"),
-                                    "contributor_display_name": p.get("contributor_display_name"),
-                                    "tech_tags": p.get("tech_tags"),
-                                    "topic_tags": p.get("topic_tags"),
-                                    "project_code_url": p.get("project_code_url"),
-                                    "project_url": None,
-                                    "status": p.get("status"),
-                                    "date_created": p.get("date_created"),
-                                    "date_archived": p.get("date_archived")
-                                })
-                            except Exception:
-                                print(f"Failed upsert project: {p.get('project_id')}")
-                                traceback.print_exc()
-
-                            time.sleep(SLEEP_BETWEEN_REQUESTS)
-
-                    except Exception:
-                        print(f"Failed fetch details for {slug} year {year}")
-                        traceback.print_exc()
-
-                time.sleep(SLEEP_BETWEEN_ORGS)
-
-    print("\nSTEP 4: Sync pipeline finished")
-    update_sync_status("org_sync")
\ No newline at end of file
+                _flush_aliases(resolver, job)
+                source.flush(year)
+                job.mark_year_listed(year)
+                if not do_projects:
+                    # without details an org-year is complete once listed
+                    job.mark_orgs_done(year, [(g.get("slug"), 0) for g in yearly])
+
+            # ------------------------------
+            # 3) PROJECT DETAILS
+            # ------------------------------
+            # org-years are checkpointed ARCHIVE_FLUSH_RECORDS at a time, each
+            # batch right after the archive flush that persists its payloads;
+            # a crash only redoes the orgs of the unflushed batch
+            unchanged = 0
+            done = {}
+            for fut in as_completed(detail_futures):
+                year, slug = detail_futures[fut]
+                try:
+                    details = fut.result()
+                    if not details:
+                        job.record_error(f"details {year}/{slug}: fetch failed")
+                        continue
+                    if not _write_org_details(details, year, slug, known, resolver):
+                        unchanged += 1
+                    done.setdefault(year, []).append((slug, len(details.get("projects", []))))
+                    if len(done[year]) >= ARCHIVE_FLUSH_RECORDS:
+                        _checkpoint_details(job, source, year, done.pop(year))
+                except Exception as e:
+                    print(f"Failed fetch details for {slug} year {year}")
+                    traceback.print_exc()
+                    job.record_error(f"details {year}/{slug}: {e!r}")
+            for year, orgs in done.items():
+                try:
+                    _checkpoint_details(job, source, year, orgs)
+                except Exception as e:
+                    print(f"Failed checkpointing details for year {year}")
+                    traceback.print_exc()
+                    job.record_error(f"details checkpoint {year}: {e!r}")
+            print(f"Org details unchanged (skipped): {unchanged} / {len(detail_futures)}")
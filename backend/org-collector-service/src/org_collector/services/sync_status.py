@@ -1,25 +1,25 @@
-from database.connect import get_conn
+from database.connect import pooled_conn
 from datetime import datetime
+from org_collector.services.ttl_cache import stats_cache
 
 def update_sync_status(name: str):
-    conn = get_conn()
-    with conn.cursor() as cur:
-        cur.execute(
-            """
-            INSERT INTO sync_status (name, last_synced)
-            VALUES (%s, NOW())
-            ON CONFLICT (name)
-            DO UPDATE SET last_synced = NOW();
-            """,
-            (name,)
-        )
-    conn.commit()
-    conn.close()
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO sync_status (name, last_synced)
+                VALUES (%s, NOW())
+                ON CONFLICT (name)
+                DO UPDATE SET last_synced = NOW();
+                """,
+                (name,)
+            )
+    # counts and last-sync time are stale now
+    stats_cache.invalidate()
 
 def get_sync_status(name: str):
-    conn = get_conn()
-    with conn.cursor() as cur:
-        cur.execute("SELECT last_synced FROM sync_status WHERE name = %s", (name,))
-        row = cur.fetchone()
-    conn.close()
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT last_synced FROM sync_status WHERE name = %s", (name,))
+            row = cur.fetchone()
     return row[0] if row else None
@@ -0,0 +1,65 @@
+# backend/org-collector-service/src/org_collector/services/ttl_cache.py
+import threading
+import time
+from org_collector.config import STATS_CACHE_TTL
+
+
+class TTLCache:
+    """
+    Small in-process cache: values expire after `ttl` seconds or when
+    invalidate() is called. Keeps hit/miss counters for /orgs/cache-stats.
+
+    invalidate() bumps a generation counter; a load that was in flight
+    across an invalidation returns its value but doesn't store it, so a
+    pre-sync value can't outlive the sync that invalidated it.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._generation = 0
+
+    def get_or_set(self, key, loader):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        value = loader()
+        with self._lock:
+            if self._generation == generation:
+                self._data[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+            self.invalidations += 1
+            self._generation += 1
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "ttl_seconds": self.ttl,
+                "entries": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 3) if total else None,
+                "invalidations": self.invalidations,
+            }
+
+
+# counts and last-sync time only change when a sync writes
+stats_cache = TTLCache(STATS_CACHE_TTL)
@@ -1,19 +1,23 @@
-import requests
+from org_collector.config import GSOC_ARCHIVE_BASE_URL
+from org_collector.services.http_cache import cached_get, is_past_year
 
-GOOGLE_ORG_LIST = "https://summerofcode.withgoogle.com/api/archive/programs/{year}/organizations/"
+GOOGLE_ORG_LIST = GSOC_ARCHIVE_BASE_URL + "/api/archive/programs/{year}/organizations/"
 
 
-def fetch_yearly_orgs(year: int):
+def fetch_yearly_payload(year: int):
+    """Raw org list of a year as returned by the archive API (None on failure)."""
     url = GOOGLE_ORG_LIST.format(year=year)
     print(f"Fetching org list for year {year}: {url}")
 
-    res = requests.get(url)
+    res = cached_get(url, immutable=is_past_year(year))
     if res.status_code != 200:
         print(f"FAILED: {url}")
-        return []
+        return None
+
+    return res.json()
 
-    data = res.json()
 
+def parse_yearly_orgs(data, year: int):
     result = []
 
     for org in data:
@@ -34,3 +38,7 @@ def fetch_yearly_orgs(year: int):
         })
 
     return result
+
+
+def fetch_yearly_orgs(year: int):
+    return parse_yearly_orgs(fetch_yearly_payload(year) or [], year)
@@ -0,0 +1,10 @@
+# backend/org-collector-service/src/org_collector/utils.py
+# Small helpers shared by the cli and the benchmarks; no config imports here.
+
+
+def parse_years(value: str):
+    # "2016-2024" or "2016,2018,2020"
+    if "-" in value:
+        start, end = value.split("-", 1)
+        return list(range(int(start), int(end) + 1))
+    return [int(y) for y in value.split(",") if y]
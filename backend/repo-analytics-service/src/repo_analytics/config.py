@@ -0,0 +1,12 @@
+# backend/repo-analytics-service/src/repo_analytics/config.py
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# GitHub endpoints, tokens and client limits (GITHUB_*) are read by the
+# shared client in backend/github_api
+
+# the first analysis of a repo only reads this far back; later runs read
+# just the activity since the stored watermark
+ANALYTICS_BACKFILL_DAYS = int(os.getenv("ANALYTICS_BACKFILL_DAYS", "365"))
@@ -1,7 +1,17 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from database.connect import get_pool, close_pool
 from repo_analytics.routers import repos
 
-app = FastAPI(title="Repo Analytics Service", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_pool()  # open the pool before the first request
+    yield
+    close_pool()
+
+
+app = FastAPI(title="Repo Analytics Service", version="1.0.0", lifespan=lifespan)
 
 app.include_router(repos.router)
 
@@ -1,8 +1,29 @@
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from github_api.client import get_client
+from repo_analytics.services.metrics_engine import analyze_repo, get_repo_metrics, list_repo_metrics
 
 router = APIRouter(prefix="/repos", tags=["repos"])
 
 @router.get("/")
-def get_repos():
-    return {"status": "ok", "data": []}
-    
\ No newline at end of file
+def get_repos(cursor: Optional[str] = None, limit: int = Query(50, ge=1, le=200)):
+    rows, next_cursor = list_repo_metrics(after=cursor, limit=limit)
+    return {"status": "ok", "data": rows, "next_cursor": next_cursor}
+
+@router.get("/github/rate-limit")
+def github_rate_limit():
+    client = get_client()
+    return {"tokens": client.rate_limits(), "stats": client.stats}
+
+@router.get("/{owner}/{name}")
+def repo_metrics(owner: str, name: str):
+    metrics = get_repo_metrics(f"{owner}/{name}")
+    if metrics is None:
+        raise HTTPException(status_code=404, detail="repo not analyzed yet")
+    return {"status": "ok", "repo": f"{owner}/{name}", "metrics": metrics}
+
+@router.post("/{owner}/{name}/analyze")
+def analyze(owner: str, name: str, background_tasks: BackgroundTasks):
+    # incremental: only activity since the last analysis is fetched
+    background_tasks.add_task(analyze_repo, f"{owner}/{name}")
+    return {"status": "analysis_started", "repo": f"{owner}/{name}"}
@@ -0,0 +1,293 @@
+# backend/repo-analytics-service/src/repo_analytics/services/metrics_engine.py
+import copy
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from database.connect import pooled_conn
+from repo_analytics.config import ANALYTICS_BACKFILL_DAYS
+from github_api.client import get_client
+
+EMPTY_STATE = {
+    "watermark": None,
+    "history_start": None,
+    "commits_total": 0,
+    "commits_by_week": {},
+    "issues_opened": 0,
+    "issues_closed": 0,
+    "issues_by_month": {},
+    "prs_merged": 0,
+    "pr_merge_seconds_total": 0,
+    "prs_by_month": {},
+    "contributors_total": 0,
+    "contributors_by_month": {},
+}
+
+
+def _parse_ts(value: str):
+    return datetime.fromisoformat(value.replace("Z", "+00:00")) if value else None
+
+
+def _iso(ts: datetime):
+    return ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _week(ts: datetime):
+    year, week, _ = ts.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _month(ts: datetime):
+    return ts.strftime("%Y-%m")
+
+
+def _in_window(ts, since, until):
+    return ts is not None and (since is None or ts > since) and ts <= until
+
+
+def _add_counts(target: dict, delta: Counter):
+    for k, v in delta.items():
+        target[k] = target.get(k, 0) + v
+
+
+class ActivityDelta:
+    """Activity between two watermarks, folded into the stored aggregates."""
+
+    def __init__(self):
+        self.commits_by_week = Counter()
+        self.commit_authors = {}  # login -> earliest commit date seen in this window
+        self.issues_opened = Counter()
+        self.issues_closed = Counter()
+        self.prs_merged = Counter()
+        self.pr_merge_seconds = 0
+
+
+def _collect_commits(client, full_name, since, until, delta):
+    params = {"per_page": 100, "until": _iso(until)}
+    if since:
+        params["since"] = _iso(since)
+    for c in client.paginate(f"/repos/{full_name}/commits", params):
+        commit = c.get("commit") or {}
+        ts = _parse_ts((commit.get("author") or {}).get("date") or (commit.get("committer") or {}).get("date"))
+        if ts is None:
+            continue
+        delta.commits_by_week[_week(ts)] += 1
+        login = (c.get("author") or {}).get("login")
+        if login and (login not in delta.commit_authors or ts < delta.commit_authors[login]):
+            delta.commit_authors[login] = ts
+
+
+def _collect_issues(client, full_name, since, until, delta):
+    # `since` filters on updated_at, which covers both new and newly closed issues
+    params = {"state": "all", "sort": "updated", "direction": "asc", "per_page": 100}
+    if since:
+        params["since"] = _iso(since)
+    for issue in client.paginate(f"/repos/{full_name}/issues", params):
+        if "pull_request" in issue:
+            continue  # PRs are counted from /pulls
+        created = _parse_ts(issue.get("created_at"))
+        closed = _parse_ts(issue.get("closed_at"))
+        if _in_window(created, since, until):
+            delta.issues_opened[_month(created)] += 1
+        if _in_window(closed, since, until):
+            delta.issues_closed[_month(closed)] += 1
+
+
+def _collect_pulls(client, full_name, since, until, delta):
+    # /pulls has no `since`: walk most recently updated first and stop at the watermark
+    params = {"state": "closed", "sort": "updated", "direction": "desc", "per_page": 100}
+    for pr in client.paginate(f"/repos/{full_name}/pulls", params):
+        updated = _parse_ts(pr.get("updated_at"))
+        if since and updated and updated <= since:
+            break
+        merged = _parse_ts(pr.get("merged_at"))
+        if _in_window(merged, since, until):
+            delta.prs_merged[_month(merged)] += 1
+            delta.pr_merge_seconds += int((merged - _parse_ts(pr["created_at"])).total_seconds())
+
+
+def load_state(full_name: str):
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute("SELECT * FROM repo_activity WHERE full_name = %s", (full_name,))
+            row = cur.fetchone()
+    # deep copy: analyze_repo adds into the nested per-week / per-month dicts
+    state = copy.deepcopy(EMPTY_STATE)
+    if row:
+        state.update({k: row[k] for k in EMPTY_STATE})
+    return state
+
+
+def _save(full_name: str, prev_watermark, state: dict, delta: ActivityDelta):
+    """
+    Store the new aggregates and contributors in one transaction. The
+    watermark check makes a concurrent run on the same repo a no-op
+    instead of double counting. Returns False if we lost that race.
+    """
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT watermark FROM repo_activity WHERE full_name = %s FOR UPDATE",
+                (full_name,)
+            )
+            row = cur.fetchone()
+            if row and row[0] != prev_watermark:
+                return False
+
+            # only logins not seen before count as new contributors
+            new_by_month = Counter()
+            if delta.commit_authors:
+                logins = list(delta.commit_authors)
+                cur.execute(
+                    """
+                    INSERT INTO repo_contributors (full_name, login, first_seen)
+                    SELECT %s, login, first_seen
+                    FROM unnest(%s::text[], %s::timestamptz[]) AS t(login, first_seen)
+                    ON CONFLICT DO NOTHING
+                    RETURNING first_seen
+                    """,
+                    (full_name, logins, [delta.commit_authors[l] for l in logins])
+                )
+                for (first_seen,) in cur.fetchall():
+                    new_by_month[_month(first_seen)] += 1
+            state["contributors_total"] += sum(new_by_month.values())
+            _add_counts(state["contributors_by_month"], new_by_month)
+
+            cur.execute(
+                """
+                INSERT INTO repo_activity
+                (full_name, watermark, history_start, commits_total, commits_by_week,
+                 issues_opened, issues_closed, issues_by_month, prs_merged,
+                 pr_merge_seconds_total, prs_by_month, contributors_total,
+                 contributors_by_month, analyzed_at)
+                VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,NOW())
+                ON CONFLICT (full_name) DO UPDATE SET
+                  watermark = EXCLUDED.watermark,
+                  history_start = EXCLUDED.history_start,
+                  commits_total = EXCLUDED.commits_total,
+                  commits_by_week = EXCLUDED.commits_by_week,
+                  issues_opened = EXCLUDED.issues_opened,
+                  issues_closed = EXCLUDED.issues_closed,
+                  issues_by_month = EXCLUDED.issues_by_month,
+                  prs_merged = EXCLUDED.prs_merged,
+                  pr_merge_seconds_total = EXCLUDED.pr_merge_seconds_total,
+                  prs_by_month = EXCLUDED.prs_by_month,
+                  contributors_total = EXCLUDED.contributors_total,
+                  contributors_by_month = EXCLUDED.contributors_by_month,
+                  analyzed_at = NOW();
+                """,
+                (
+                    full_name, state["watermark"], state["history_start"],
+                    state["commits_total"], Jsonb(state["commits_by_week"]),
+                    state["issues_opened"], state["issues_closed"], Jsonb(state["issues_by_month"]),
+                    state["prs_merged"], state["pr_merge_seconds_total"], Jsonb(state["prs_by_month"]),
+                    state["contributors_total"], Jsonb(state["contributors_by_month"]),
+                )
+            )
+    return True
+
+
+def analyze_repo(full_name: str):
+    """
+    Bring a repo's running aggregates up to date.
+
+    Only commits / issues / PRs after the stored watermark are fetched and
+    added to the aggregates, so the cost is proportional to new activity.
+    The first run reads ANALYTICS_BACKFILL_DAYS of history.
+    """
+    client = get_client()
+    state = load_state(full_name)
+    prev_watermark = state["watermark"]
+    until = datetime.now(timezone.utc).replace(microsecond=0)
+    since = prev_watermark
+    if since is None:
+        since = until - timedelta(days=ANALYTICS_BACKFILL_DAYS)
+        state["history_start"] = since
+
+    print(f"[ANALYZE] {full_name}: activity {_iso(since)} .. {_iso(until)}")
+    delta = ActivityDelta()
+    _collect_commits(client, full_name, since, until, delta)
+    _collect_issues(client, full_name, since, until, delta)
+    _collect_pulls(client, full_name, since, until, delta)
+
+    state["commits_total"] += sum(delta.commits_by_week.values())
+    _add_counts(state["commits_by_week"], delta.commits_by_week)
+    state["issues_opened"] += sum(delta.issues_opened.values())
+    state["issues_closed"] += sum(delta.issues_closed.values())
+    for month, n in delta.issues_opened.items():
+        state["issues_by_month"].setdefault(month, {"opened": 0, "closed": 0})["opened"] += n
+    for month, n in delta.issues_closed.items():
+        state["issues_by_month"].setdefault(month, {"opened": 0, "closed": 0})["closed"] += n
+    state["prs_merged"] += sum(delta.prs_merged.values())
+    state["pr_merge_seconds_total"] += delta.pr_merge_seconds
+    _add_counts(state["prs_by_month"], delta.prs_merged)
+    state["watermark"] = until
+
+    if not _save(full_name, prev_watermark, state, delta):
+        print(f"[ANALYZE] {full_name}: another run advanced the watermark, discarding")
+        return None
+    return summarize(state)
+
+
+def summarize(state: dict, recent_weeks: int = 12):
+    """API view of the aggregates: trends plus a few derived numbers."""
+    weeks = sorted(state["commits_by_week"].items())
+    merged = state["prs_merged"]
+    return {
+        "watermark": state["watermark"],
+        "history_start": state["history_start"],
+        "commit_activity": {
+            "total": state["commits_total"],
+            "recent_weeks": dict(weeks[-recent_weeks:]),
+        },
+        "issue_trends": {
+            "opened": state["issues_opened"],
+            "closed": state["issues_closed"],
+            "by_month": dict(sorted(state["issues_by_month"].items())),
+        },
+        "pr_merge_time": {
+            "merged": merged,
+            "avg_hours": round(state["pr_merge_seconds_total"] / merged / 3600, 2) if merged else None,
+            "by_month": dict(sorted(state["prs_by_month"].items())),
+        },
+        "contributor_growth": {
+            "total": state["contributors_total"],
+            "new_by_month": dict(sorted(state["contributors_by_month"].items())),
+        },
+    }
+
+
+def get_repo_metrics(full_name: str):
+    state = load_state(full_name)
+    if state["watermark"] is None:
+        return None
+    return summarize(state)
+
+
+def list_repo_metrics(after: str = None, limit: int = 50):
+    """
+    Keyset-paginated overview of analyzed repos.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    sql = """
+        SELECT full_name, watermark, commits_total, issues_opened, issues_closed,
+               prs_merged, pr_merge_seconds_total, contributors_total, analyzed_at
+        FROM repo_activity
+    """
+    params = []
+    if after:
+        sql += " WHERE full_name > %s"
+        params.append(after)
+    # one extra row tells whether another page exists
+    sql += " ORDER BY full_name LIMIT %s"
+    params.append(limit + 1)
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1]["full_name"]
+    return rows, next_cursor
@@ -0,0 +1,87 @@
+# backend/repo-analytics-service/tests/test_metrics_engine.py
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+import pytest
+from repo_analytics.services import metrics_engine
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.params = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.params = params
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        # honour LIMIT, the last query parameter
+        return self.rows[:self.params[-1]]
+
+
+def fake_pooled_conn(rows):
+    cursor = FakeCursor(rows)
+
+    class Conn:
+        def cursor(self, row_factory=None):
+            return cursor
+
+    @contextmanager
+    def pooled_conn():
+        yield Conn()
+
+    return pooled_conn
+
+
+class FakeClient:
+    """One commit per repo, dated yesterday, and no issues or PRs."""
+
+    def paginate(self, path, params=None):
+        if not path.endswith("/commits"):
+            return []
+        day = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return [{"commit": {"author": {"date": day}}, "author": {"login": path.split("/")[2]}}]
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    states = {}
+
+    def save(full_name, prev_watermark, state, delta):
+        states[full_name] = state
+        return True
+
+    monkeypatch.setattr(metrics_engine, "get_client", lambda: FakeClient())
+    monkeypatch.setattr(metrics_engine, "pooled_conn", fake_pooled_conn([]))
+    monkeypatch.setattr(metrics_engine, "_save", save)
+    return states
+
+
+def test_new_repos_start_from_empty_state(saved):
+    metrics_engine.analyze_repo("x/one")
+    metrics_engine.analyze_repo("y/two")
+
+    assert saved["x/one"]["commits_total"] == 1
+    assert saved["y/two"]["commits_total"] == 1
+    assert sum(saved["y/two"]["commits_by_week"].values()) == 1
+    assert saved["x/one"]["commits_by_week"] is not saved["y/two"]["commits_by_week"]
+    assert metrics_engine.EMPTY_STATE["commits_by_week"] == {}
+
+
+@pytest.mark.parametrize("n_rows, expected_cursor", [(2, None), (3, None), (4, "repo/2")])
+def test_list_repo_metrics_cursor(monkeypatch, n_rows, expected_cursor):
+    rows = [{"full_name": f"repo/{i}"} for i in range(n_rows)]
+    monkeypatch.setattr(metrics_engine, "pooled_conn", fake_pooled_conn(rows))
+
+    page, next_cursor = metrics_engine.list_repo_metrics(limit=3)
+
+    assert len(page) == min(n_rows, 3)
+    assert next_cursor == expected_cursor
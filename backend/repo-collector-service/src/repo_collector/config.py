@@ -0,0 +1,16 @@
+# backend/repo-collector-service/src/repo_collector/config.py
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# GitHub endpoint and tokens (GITHUB_GRAPHQL_URL, GITHUB_TOKENS) are read by
+# the shared client in backend/github_api
+
+# how much work goes into one GraphQL request
+ORGS_PER_QUERY = int(os.getenv("REPO_COLLECTOR_ORGS_PER_QUERY", "10"))
+REPOS_PER_ORG = int(os.getenv("REPO_COLLECTOR_REPOS_PER_ORG", "30"))
+REPOS_PER_METRICS_QUERY = int(os.getenv("REPO_COLLECTOR_REPOS_PER_METRICS_QUERY", "25"))
+
+# window for "recent commits"
+COMMIT_WINDOW_DAYS = int(os.getenv("REPO_COLLECTOR_COMMIT_WINDOW_DAYS", "90"))
@@ -0,0 +1,20 @@
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from database.connect import get_pool, close_pool
+from repo_collector.routes import router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_pool()  # open the pool before the first request
+    yield
+    close_pool()
+
+
+app = FastAPI(title="Repo Collector Service", version="1.0.0", lifespan=lifespan)
+
+app.include_router(router)
+
+@app.get("/")
+def root():
+    return {"message": "Repo Collector Service Running"}
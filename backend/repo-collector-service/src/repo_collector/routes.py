@@ -0,0 +1,27 @@
+# backend/repo-collector-service/src/repo_collector/routes.py
+from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Query
+from repo_collector.services import collect_pipeline
+from repo_collector.services.upsert_repo import count_repos
+
+router = APIRouter(prefix="/repos", tags=["repo-collector"])
+
+@router.post("/collect")
+def collect(
+    background_tasks: BackgroundTasks,
+    org_slugs: Optional[List[str]] = Query(None),
+    metrics: bool = True
+):
+    background_tasks.add_task(collect_pipeline.collect_repos, org_slugs, metrics)
+    return {"status": "collect_started", "org_slugs": org_slugs, "metrics": metrics}
+
+@router.get("/collect/stats")
+def collect_stats():
+    run = collect_pipeline.last_run_stats
+    if not run:
+        return {"status": "never_run"}
+    return {"status": run["status"], "graphql": run["graphql"].snapshot()}
+
+@router.get("/count")
+def repos_count():
+    return {"repos": count_repos()}
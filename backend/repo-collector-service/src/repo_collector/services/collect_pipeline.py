@@ -0,0 +1,60 @@
+# backend/repo-collector-service/src/repo_collector/services/collect_pipeline.py
+import traceback
+from repo_collector.services.fetch_repos import github_login, fetch_org_repos
+from repo_collector.services.fetch_metrics import fetch_repo_metrics
+from repo_collector.services.graphql_client import GraphQLStats
+from repo_collector.services.upsert_repo import load_org_links, upsert_repos, update_repo_metrics
+
+# stats of the most recent run, for GET /repos/collect/stats
+last_run_stats = {}
+
+
+def collect_repos(org_slugs=None, with_metrics=True):
+    """
+    Collect repositories (and their metrics) for orgs in `orgs`.
+    Both stages use batched GraphQL queries: ORGS_PER_QUERY owners per
+    repo listing request, REPOS_PER_METRICS_QUERY repos per metrics request.
+    A failed fetch or write only loses its own batch; the run always ends
+    as "finished" or "failed" in last_run_stats.
+    """
+    global last_run_stats
+    stats = GraphQLStats()
+    last_run_stats = {"status": "running", "graphql": stats}
+    status = "failed"
+
+    try:
+        print("Starting repo collection")
+        owners = []
+        for org in load_org_links(org_slugs):
+            login = github_login(org)
+            if login:
+                owners.append((org["org_slug"], login))
+        print(f"Orgs with a GitHub owner: {len(owners)}")
+
+        full_names = []
+        for repos in fetch_org_repos(owners, stats):
+            try:
+                upsert_repos(repos)
+                full_names.extend(r["full_name"] for r in repos)
+            except Exception:
+                print("Failed upsert repo batch")
+                traceback.print_exc()
+                stats.record_failure()
+
+        if with_metrics:
+            for metrics in fetch_repo_metrics(full_names, stats):
+                try:
+                    update_repo_metrics(metrics)
+                except Exception:
+                    print("Failed update metrics batch")
+                    traceback.print_exc()
+                    stats.record_failure()
+        status = "finished"
+    except Exception:
+        print("Repo collection aborted.")
+        traceback.print_exc()
+    finally:
+        last_run_stats = {"status": status, "graphql": stats}
+
+    print(f"Repo collection {status}: {stats.snapshot()}")
+    return stats.snapshot()
@@ -0,0 +1,87 @@
+# backend/repo-collector-service/src/repo_collector/services/fetch_metrics.py
+import traceback
+from datetime import datetime, timedelta, timezone
+from repo_collector.config import REPOS_PER_METRICS_QUERY, COMMIT_WINDOW_DAYS
+from repo_collector.services.graphql_client import post_graphql
+
+# only totalCount on every connection: counts are cheap, nodes are not
+METRIC_FIELDS = """
+fragment MetricFields on Repository {
+  nameWithOwner
+  openIssues: issues(states: OPEN) { totalCount }
+  closedIssues: issues(states: CLOSED) { totalCount }
+  goodFirstIssues: issues(states: OPEN, labels: ["good first issue"]) { totalCount }
+  openPullRequests: pullRequests(states: OPEN) { totalCount }
+  mergedPullRequests: pullRequests(states: MERGED) { totalCount }
+  defaultBranchRef {
+    target {
+      ... on Commit {
+        committedDate
+        recent: history(since: $since) { totalCount }
+      }
+    }
+  }
+}
+"""
+
+
+def build_metrics_query(n_repos: int):
+    """Aliased repository(owner:, name:) blocks (r0, r1, ...) in one request."""
+    params = ", ".join(["$since: GitTimestamp!"] + [f"$o{i}: String!, $n{i}: String!" for i in range(n_repos)])
+    blocks = "\n".join(
+        f"  r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...MetricFields }}" for i in range(n_repos)
+    )
+    return f"query({params}) {{\n  rateLimit {{ cost remaining resetAt }}\n{blocks}\n}}\n{METRIC_FIELDS}"
+
+
+def normalize_metrics(node: dict):
+    target = ((node.get("defaultBranchRef") or {}).get("target")) or {}
+    return {
+        "full_name": node["nameWithOwner"],
+        "open_issues": node["openIssues"]["totalCount"],
+        "closed_issues": node["closedIssues"]["totalCount"],
+        "good_first_issues": node["goodFirstIssues"]["totalCount"],
+        "open_prs": node["openPullRequests"]["totalCount"],
+        "merged_prs": node["mergedPullRequests"]["totalCount"],
+        "commits_recent": (target.get("recent") or {}).get("totalCount"),
+        "last_commit_at": target.get("committedDate"),
+    }
+
+
+def fetch_metrics_batch(full_names, stats=None):
+    """Metrics for up to REPOS_PER_METRICS_QUERY repos from one GraphQL request."""
+    since = datetime.now(timezone.utc) - timedelta(days=COMMIT_WINDOW_DAYS)
+    variables = {"since": since.strftime("%Y-%m-%dT%H:%M:%SZ")}
+    for i, full_name in enumerate(full_names):
+        owner, _, name = full_name.partition("/")
+        variables[f"o{i}"] = owner
+        variables[f"n{i}"] = name
+
+    data, errors = post_graphql(build_metrics_query(len(full_names)), variables)
+    for err in errors:
+        print(f"[FETCH METRICS] {err.get('message')}")
+
+    metrics = [normalize_metrics(data[f"r{i}"]) for i in range(len(full_names)) if data.get(f"r{i}")]
+    if stats is not None:
+        # repos were counted when listed; only add the points here
+        stats.record(data.get("rateLimit"), 0)
+    return metrics
+
+
+def fetch_repo_metrics(full_names, stats=None):
+    """
+    Yield metric batches for all repos, REPOS_PER_METRICS_QUERY at a time.
+    Failed batches are logged, counted in `stats` and skipped.
+    """
+    full_names = list(full_names)
+    for start in range(0, len(full_names), REPOS_PER_METRICS_QUERY):
+        batch = full_names[start:start + REPOS_PER_METRICS_QUERY]
+        try:
+            metrics = fetch_metrics_batch(batch, stats)
+        except Exception:
+            print(f"[FETCH METRICS] failed batch: {batch[0]} .. {batch[-1]}")
+            traceback.print_exc()
+            if stats is not None:
+                stats.record_failure()
+            continue
+        yield metrics
@@ -0,0 +1,131 @@
+# backend/repo-collector-service/src/repo_collector/services/fetch_repos.py
+import re
+import traceback
+from repo_collector.config import ORGS_PER_QUERY, REPOS_PER_ORG
+from repo_collector.services.graphql_client import post_graphql
+
+GITHUB_OWNER_RE = re.compile(r"github\.com/([A-Za-z0-9](?:[A-Za-z0-9-]{0,38}))(?:[/?#]|$)", re.I)
+
+# non-owner paths that show up in org links
+NOT_OWNERS = {"orgs", "sponsors", "topics", "features", "about", "marketplace"}
+
+REPO_FIELDS = """
+fragment RepoFields on Repository {
+  nameWithOwner
+  name
+  description
+  url
+  homepageUrl
+  primaryLanguage { name }
+  stargazerCount
+  forkCount
+  isArchived
+  isFork
+  pushedAt
+  licenseInfo { spdxId }
+  repositoryTopics(first: 10) { nodes { topic { name } } }
+}
+"""
+
+
+def github_login(org: dict):
+    """Best-effort GitHub owner login from an orgs row (contact links, then website)."""
+    candidates = []
+    for link in org.get("contact_links") or []:
+        if isinstance(link, dict):
+            candidates.append(link.get("value") or link.get("url") or "")
+        elif isinstance(link, str):
+            candidates.append(link)
+    candidates.append(org.get("website_url") or "")
+
+    for url in candidates:
+        m = GITHUB_OWNER_RE.search(url)
+        if m and m.group(1).lower() not in NOT_OWNERS:
+            return m.group(1)
+    return None
+
+
+def build_repos_query(n_owners: int, repos_per_owner: int = REPOS_PER_ORG):
+    """
+    One query for `n_owners` owners, each under its own alias (o0, o1, ...),
+    so many orgs' repositories come back in a single request.
+    """
+    params = ", ".join(f"$l{i}: String!" for i in range(n_owners))
+    blocks = "\n".join(
+        f"""  o{i}: repositoryOwner(login: $l{i}) {{
+    login
+    repositories(first: {repos_per_owner}, isFork: false, privacy: PUBLIC,
+                 orderBy: {{field: STARGAZERS, direction: DESC}}) {{
+      totalCount
+      nodes {{ ...RepoFields }}
+    }}
+  }}"""
+        for i in range(n_owners)
+    )
+    return f"query({params}) {{\n  rateLimit {{ cost remaining resetAt }}\n{blocks}\n}}\n{REPO_FIELDS}"
+
+
+def normalize_repo(node: dict, org_slug: str):
+    owner, _, name = node["nameWithOwner"].partition("/")
+    return {
+        "full_name": node["nameWithOwner"],
+        "org_slug": org_slug,
+        "owner": owner,
+        "name": name,
+        "description": node.get("description"),
+        "url": node.get("url"),
+        "homepage_url": node.get("homepageUrl"),
+        "primary_language": (node.get("primaryLanguage") or {}).get("name"),
+        "topics": [t["topic"]["name"] for t in (node.get("repositoryTopics") or {}).get("nodes", [])],
+        "stars": node.get("stargazerCount"),
+        "forks": node.get("forkCount"),
+        "is_archived": node.get("isArchived"),
+        "license": (node.get("licenseInfo") or {}).get("spdxId"),
+        "pushed_at": node.get("pushedAt"),
+    }
+
+
+def fetch_repos_batch(owners, stats=None):
+    """
+    owners: [(org_slug, github_login), ...] -- at most ORGS_PER_QUERY.
+    Returns normalized repo dicts for all of them from one GraphQL request.
+    """
+    query = build_repos_query(len(owners))
+    variables = {f"l{i}": login for i, (_, login) in enumerate(owners)}
+    data, errors = post_graphql(query, variables)
+    for err in errors:
+        print(f"[FETCH REPOS] {err.get('message')}")
+
+    repos = []
+    for i, (org_slug, login) in enumerate(owners):
+        owner = data.get(f"o{i}")
+        if not owner:
+            print(f"[FETCH REPOS] no GitHub owner: {login}")
+            continue
+        for node in owner["repositories"]["nodes"]:
+            repos.append(normalize_repo(node, org_slug))
+
+    if stats is not None:
+        stats.record(data.get("rateLimit"), len(repos))
+    return repos
+
+
+def fetch_org_repos(owners, stats=None):
+    """
+    Yield repo batches for all (org_slug, login) pairs, ORGS_PER_QUERY at a
+    time. A batch whose request fails is logged, counted in `stats` and
+    skipped; the remaining batches are still fetched.
+    """
+    owners = list(owners)
+    for start in range(0, len(owners), ORGS_PER_QUERY):
+        batch = owners[start:start + ORGS_PER_QUERY]
+        print(f"[FETCH REPOS] owners {start + 1}-{start + len(batch)} of {len(owners)}")
+        try:
+            repos = fetch_repos_batch(batch, stats)
+        except Exception:
+            print(f"[FETCH REPOS] failed batch: {[login for _, login in batch]}")
+            traceback.print_exc()
+            if stats is not None:
+                stats.record_failure()
+            continue
+        yield repos
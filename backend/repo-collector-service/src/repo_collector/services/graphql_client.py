@@ -0,0 +1,46 @@
+# backend/repo-collector-service/src/repo_collector/services/graphql_client.py
+import threading
+from github_api.client import get_client
+
+
+class GraphQLStats:
+    """Rate-limit points spent per repo, the number we optimise for."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.points = 0
+        self.repos = 0
+        self.failed_batches = 0
+        self.remaining = None
+
+    def record(self, rate_limit: dict, repos: int):
+        with self._lock:
+            self.requests += 1
+            self.repos += repos
+            if rate_limit:
+                self.points += rate_limit.get("cost") or 0
+                self.remaining = rate_limit.get("remaining")
+
+    def record_failure(self):
+        with self._lock:
+            self.failed_batches += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "points": self.points,
+                "repos": self.repos,
+                "points_per_repo": round(self.points / self.repos, 4) if self.repos else None,
+                "failed_batches": self.failed_batches,
+                "rate_limit_remaining": self.remaining,
+            }
+
+
+def post_graphql(query: str, variables: dict):
+    """
+    Run a query through the shared rate-limit-aware GitHub client.
+    Partial errors (e.g. one unknown login) still come with data for the rest.
+    """
+    return get_client().graphql(query, variables)
@@ -0,0 +1,90 @@
+# backend/repo-collector-service/src/repo_collector/services/upsert_repo.py
+from psycopg.rows import dict_row
+from database.connect import pooled_conn
+
+UPSERT_REPO_SQL = """
+    INSERT INTO repos
+    (full_name, org_slug, owner, name, description, url, homepage_url, primary_language,
+     topics, stars, forks, is_archived, license, pushed_at, created_at, updated_at)
+    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,NOW(),NOW())
+    ON CONFLICT (full_name) DO UPDATE SET
+      org_slug = COALESCE(EXCLUDED.org_slug, repos.org_slug),
+      description = EXCLUDED.description,
+      url = EXCLUDED.url,
+      homepage_url = EXCLUDED.homepage_url,
+      primary_language = EXCLUDED.primary_language,
+      topics = EXCLUDED.topics,
+      stars = EXCLUDED.stars,
+      forks = EXCLUDED.forks,
+      is_archived = EXCLUDED.is_archived,
+      license = EXCLUDED.license,
+      pushed_at = EXCLUDED.pushed_at,
+      updated_at = NOW();
+"""
+
+UPDATE_METRICS_SQL = """
+    UPDATE repos SET
+      open_issues = %s,
+      closed_issues = %s,
+      good_first_issues = %s,
+      open_prs = %s,
+      merged_prs = %s,
+      commits_recent = %s,
+      last_commit_at = %s,
+      metrics_updated_at = NOW()
+    WHERE full_name = %s;
+"""
+
+
+def upsert_repos(repos):
+    """Write a batch of repos in one transaction (pipelined executemany)."""
+    params = [
+        (
+            r["full_name"], r.get("org_slug"), r.get("owner"), r.get("name"),
+            r.get("description"), r.get("url"), r.get("homepage_url"), r.get("primary_language"),
+            r.get("topics"), r.get("stars"), r.get("forks"), r.get("is_archived"),
+            r.get("license"), r.get("pushed_at")
+        )
+        for r in repos
+    ]
+    if not params:
+        return
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.executemany(UPSERT_REPO_SQL, params)
+
+
+def update_repo_metrics(metrics):
+    params = [
+        (
+            m.get("open_issues"), m.get("closed_issues"), m.get("good_first_issues"),
+            m.get("open_prs"), m.get("merged_prs"), m.get("commits_recent"),
+            m.get("last_commit_at"), m["full_name"]
+        )
+        for m in metrics
+    ]
+    if not params:
+        return
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.executemany(UPDATE_METRICS_SQL, params)
+
+
+def load_org_links(org_slugs=None):
+    """orgs rows with the fields needed to find their GitHub owner."""
+    sql = "SELECT org_slug, website_url, contact_links FROM orgs"
+    params = ()
+    if org_slugs:
+        sql += " WHERE org_slug = ANY(%s)"
+        params = (list(org_slugs),)
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(sql + " ORDER BY org_slug", params)
+            return cur.fetchall()
+
+
+def count_repos():
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM repos;")
+            return cur.fetchone()[0]
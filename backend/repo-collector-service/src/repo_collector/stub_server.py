@@ -0,0 +1,132 @@
+# backend/repo-collector-service/src/repo_collector/stub_server.py
+"""
+Local stand-in for the GitHub GraphQL API, for exercising the collector
+offline:
+
+    python -m repo_collector.stub_server --port 8765
+    GITHUB_GRAPHQL_URL=http://127.0.0.1:8765/graphql ...
+
+It understands the two aliased query shapes the collector sends
+(repositoryOwner blocks o0..oN keyed by $lN, repository blocks r0..rN
+keyed by $oN/$nN), returns deterministic synthetic data and reports a
+rateLimit.cost computed like GitHub's (connection calls / 100).
+Logins starting with "missing-" resolve to null with an error; a request
+naming a login that starts with "broken-" fails with HTTP 502, like a
+GitHub timeout on one batch.
+"""
+import argparse
+import json
+import math
+import re
+import threading
+import zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+FIRST_RE = re.compile(r"repositories\(first:\s*(\d+)")
+
+
+def _seed(text: str):
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def fake_repo(login: str, i: int):
+    name = f"{login}-repo-{i}"
+    seed = _seed(name)
+    return {
+        "nameWithOwner": f"{login}/{name}",
+        "name": name,
+        "description": f"Synthetic repository {i} of {login}",
+        "url": f"https://github.com/{login}/{name}",
+        "homepageUrl": None,
+        "primaryLanguage": {"name": ["Python", "C++", "JavaScript", "Rust", "Go"][seed % 5]},
+        "stargazerCount": seed % 5000,
+        "forkCount": seed % 700,
+        "isArchived": False,
+        "isFork": False,
+        "pushedAt": "2024-05-01T00:00:00Z",
+        "licenseInfo": {"spdxId": "Apache-2.0"},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "gsoc"}}]},
+    }
+
+
+def fake_metrics(full_name: str):
+    seed = _seed(full_name)
+    return {
+        "nameWithOwner": full_name,
+        "openIssues": {"totalCount": seed % 300},
+        "closedIssues": {"totalCount": seed % 3000},
+        "goodFirstIssues": {"totalCount": seed % 20},
+        "openPullRequests": {"totalCount": seed % 50},
+        "mergedPullRequests": {"totalCount": seed % 2000},
+        "defaultBranchRef": {"target": {"committedDate": "2024-05-01T00:00:00Z",
+                                        "recent": {"totalCount": seed % 400}}},
+    }
+
+
+def answer(query: str, variables: dict, repos_per_owner: int):
+    data, errors, calls = {}, [], 0
+    if "repositoryOwner(" in query:
+        m = FIRST_RE.search(query)
+        first = int(m.group(1)) if m else 30
+        n = min(first, repos_per_owner)
+        for key, login in variables.items():
+            if not re.fullmatch(r"l\d+", key):
+                continue
+            alias = "o" + key[1:]
+            calls += 1 + first  # owner's repositories + each repo's topics
+            if login.startswith("missing-"):
+                data[alias] = None
+                errors.append({"message": f"Could not resolve to a RepositoryOwner with the login of '{login}'."})
+                continue
+            data[alias] = {
+                "login": login,
+                "repositories": {"totalCount": n, "nodes": [fake_repo(login, i) for i in range(n)]},
+            }
+    else:
+        for key, owner in variables.items():
+            if not re.fullmatch(r"o\d+", key):
+                continue
+            idx = key[1:]
+            calls += 6  # one per totalCount connection
+            data["r" + idx] = fake_metrics(f"{owner}/{variables['n' + idx]}")
+
+    data["rateLimit"] = {"cost": max(1, math.ceil(calls / 100)), "remaining": 5000, "resetAt": None}
+    return {"data": data, "errors": errors} if errors else {"data": data}
+
+
+def make_handler(repos_per_owner: int):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            if any(str(v).startswith("broken-") for v in (body.get("variables") or {}).values()):
+                self.send_error(502, "Bad Gateway")
+                return
+            payload = json.dumps(answer(body["query"], body.get("variables") or {}, repos_per_owner)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("X-RateLimit-Remaining", "5000")
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def start_stub_server(port: int = 0, repos_per_owner: int = 5):
+    """Start in a daemon thread; returns (server, graphql_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(repos_per_owner))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/graphql"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--repos-per-owner", type=int, default=5)
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args.repos_per_owner))
+    print(f"GitHub GraphQL stub on http://127.0.0.1:{args.port}/graphql")
+    server.serve_forever()
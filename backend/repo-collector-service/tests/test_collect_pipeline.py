@@ -0,0 +1,64 @@
+# backend/repo-collector-service/tests/test_collect_pipeline.py
+import pytest
+from github_api.client import GitHubClient
+from repo_collector.services import collect_pipeline, fetch_repos, graphql_client
+from repo_collector.stub_server import start_stub_server
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """collect_repos wired to the GraphQL stub, with the DB calls recorded in memory."""
+    server, url = start_stub_server(repos_per_owner=3)
+    client = GitHubClient(tokens=[], graphql_url=url)
+    monkeypatch.setattr(graphql_client, "get_client", lambda: client)
+    monkeypatch.setattr(fetch_repos, "ORGS_PER_QUERY", 2)
+
+    written = {"repos": [], "metrics": []}
+    orgs = []
+    monkeypatch.setattr(collect_pipeline, "load_org_links", lambda slugs=None: orgs)
+    monkeypatch.setattr(collect_pipeline, "upsert_repos", written["repos"].extend)
+    monkeypatch.setattr(collect_pipeline, "update_repo_metrics", written["metrics"].extend)
+    yield orgs, written
+    server.shutdown()
+
+
+def _org(login: str):
+    return {"org_slug": login, "website_url": f"https://github.com/{login}", "contact_links": []}
+
+
+def test_collect_repos_against_stub(stub):
+    orgs, written = stub
+    orgs.extend(_org(login) for login in ["alpha", "beta", "gamma"])
+
+    snapshot = collect_pipeline.collect_repos()
+
+    assert sorted({r["org_slug"] for r in written["repos"]}) == ["alpha", "beta", "gamma"]
+    assert len(written["repos"]) == 9
+    assert {m["full_name"] for m in written["metrics"]} == {r["full_name"] for r in written["repos"]}
+    assert snapshot["requests"] == 3  # 2 listing batches + 1 metrics batch
+    assert snapshot["failed_batches"] == 0
+    assert collect_pipeline.last_run_stats["status"] == "finished"
+
+
+def test_failed_batch_does_not_stop_the_run(stub):
+    orgs, written = stub
+    # ORGS_PER_QUERY=2: the first batch fails, the second is still fetched
+    orgs.extend(_org(login) for login in ["alpha", "broken-org", "gamma"])
+
+    snapshot = collect_pipeline.collect_repos()
+
+    assert {r["org_slug"] for r in written["repos"]} == {"gamma"}
+    assert len(written["metrics"]) == 3
+    assert snapshot["failed_batches"] == 1
+    assert collect_pipeline.last_run_stats["status"] == "finished"
+
+
+def test_status_is_failed_when_the_run_aborts(stub, monkeypatch):
+    def no_db(slugs=None):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(collect_pipeline, "load_org_links", no_db)
+
+    collect_pipeline.collect_repos()
+
+    assert collect_pipeline.last_run_stats["status"] == "failed"
@@ -0,0 +1,23 @@
+# backend/repo-collector-service/tests/test_github_client.py
+from email.utils import formatdate
+from github_api.client import retry_delay, SECONDARY_LIMIT_WAIT
+
+NOW = 1_700_000_000.0
+
+
+def test_retry_after_seconds():
+    assert retry_delay({"Retry-After": "30"}, NOW) == 30
+
+
+def test_retry_after_http_date():
+    headers = {"Retry-After": formatdate(NOW + 45, usegmt=True)}
+    assert retry_delay(headers, NOW) == 45
+
+
+def test_falls_back_to_rate_limit_reset():
+    assert retry_delay({"Retry-After": "soon", "X-RateLimit-Reset": str(int(NOW) + 90)}, NOW) == 90
+    assert retry_delay({"X-RateLimit-Reset": str(int(NOW) - 5)}, NOW) == 0
+
+
+def test_no_hint_waits_a_minute():
+    assert retry_delay({"Retry-After": "soon"}, NOW) == SECONDARY_LIMIT_WAIT
@@ -0,0 +1,22 @@
+# backend/scoring-ml-service/src/scoring_ml/config.py
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# weights of the score components (each component is in [0, 1])
+WEIGHT_SKILL = float(os.getenv("SCORING_WEIGHT_SKILL", "0.40"))
+WEIGHT_INTEREST = float(os.getenv("SCORING_WEIGHT_INTEREST", "0.20"))
+WEIGHT_HEALTH = float(os.getenv("SCORING_WEIGHT_HEALTH", "0.15"))
+WEIGHT_FRIENDLINESS = float(os.getenv("SCORING_WEIGHT_FRIENDLINESS", "0.10"))
+WEIGHT_HISTORY = float(os.getenv("SCORING_WEIGHT_HISTORY", "0.15"))
+
+# seconds before the in-memory feature matrix is rebuilt from the DB
+FEATURE_MATRIX_TTL = float(os.getenv("SCORING_FEATURE_MATRIX_TTL", "3600"))
+
+# how often (seconds) to check sync_status for a finished org sync, which
+# triggers a rebuild of the tag index and feature matrix
+SYNC_CHECK_INTERVAL = float(os.getenv("SCORING_SYNC_CHECK_INTERVAL", "30"))
+
+# similar orgs kept per org in org_similarity
+SIMILAR_ORGS_TOP_N = int(os.getenv("SCORING_SIMILAR_ORGS_TOP_N", "20"))
@@ -0,0 +1,25 @@
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from database.connect import get_pool, close_pool
+from scoring_ml.routers import recommend, tags, orgs
+from scoring_ml.services.org_tables import start_table_watcher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_pool()  # open the pool before the first request
+    stop_watcher = start_table_watcher()
+    yield
+    stop_watcher.set()
+    close_pool()
+
+
+app = FastAPI(title="Scoring ML Service", version="1.0.0", lifespan=lifespan)
+
+app.include_router(recommend.router)
+app.include_router(tags.router)
+app.include_router(orgs.router)
+
+@app.get("/")
+def root():
+    return {"message": "Scoring ML Service Running"}
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException, Query
+from scoring_ml.config import SIMILAR_ORGS_TOP_N
+from scoring_ml.services.org_tables import (
+    get_similar_orgs, get_return_score, materialize_org_tables
+)
+
+router = APIRouter(prefix="/orgs", tags=["orgs"])
+
+
+@router.get("/{org_slug}/similar")
+def similar(org_slug: str, limit: int = Query(10, ge=1, le=SIMILAR_ORGS_TOP_N)):
+    rows = get_similar_orgs(org_slug, limit)
+    # every materialized org has a return score: no rows and no score means unknown org
+    if not rows and not get_return_score(org_slug):
+        raise HTTPException(status_code=404, detail="org not found in the materialized tables")
+    return {"org_slug": org_slug, "data": rows}
+
+
+@router.get("/{org_slug}/return-probability")
+def return_probability(org_slug: str):
+    row = get_return_score(org_slug)
+    if not row:
+        raise HTTPException(status_code=404, detail="no score for this org")
+    return row
+
+
+@router.post("/tables/rebuild")
+def rebuild_tables():
+    stats = materialize_org_tables()
+    if stats is None:
+        raise HTTPException(status_code=409, detail="a rebuild is already running")
+    return stats
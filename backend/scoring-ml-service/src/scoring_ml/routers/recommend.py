@@ -0,0 +1,50 @@
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+from scoring_ml.services.feature_matrix import get_feature_matrix
+from scoring_ml.services.scoring import recommend, get_user_profile
+from scoring_ml.services.tag_index import get_tag_index
+
+router = APIRouter(prefix="/recommend", tags=["recommend"])
+
+
+class ProfileIn(BaseModel):
+    languages: Optional[List[str]] = []
+    interests: Optional[List[str]] = []
+
+
+def _candidates(languages, prefilter: bool):
+    # narrow to orgs tagged with at least one of the user's languages;
+    # if none are, fall back to ranking every org
+    if not prefilter or not languages:
+        return None
+    return get_tag_index().org_slugs_for(languages, mode="any") or None
+
+
+@router.get("/users/{user_id}")
+def recommend_for_user(user_id: int, k: int = Query(10, ge=1, le=100), prefilter: bool = True):
+    user = get_user_profile(user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="user not found")
+    fm = get_feature_matrix()
+    candidates = _candidates(user["languages"], prefilter)
+    return {"user_id": user_id, "data": recommend(fm, user["languages"], user["interests"], k, candidates)}
+
+
+@router.post("/")
+def recommend_for_profile(payload: ProfileIn, k: int = Query(10, ge=1, le=100), prefilter: bool = True):
+    fm = get_feature_matrix()
+    candidates = _candidates(payload.languages, prefilter)
+    return {"data": recommend(fm, payload.languages, payload.interests, k, candidates)}
+
+
+@router.post("/refresh")
+def refresh_features():
+    fm = get_feature_matrix(refresh=True)
+    index = get_tag_index(refresh=True)
+    return {
+        "candidates": len(fm),
+        "tech_tags": len(fm.tech_vocab),
+        "topic_tags": len(fm.topic_vocab),
+        "indexed_tags": len(index.vocab),
+    }
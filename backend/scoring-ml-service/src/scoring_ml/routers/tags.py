@@ -0,0 +1,24 @@
+from typing import List
+from fastapi import APIRouter, Query
+from scoring_ml.services.tag_index import get_tag_index, normalize_tag
+
+router = APIRouter(prefix="/tags", tags=["tags"])
+
+
+@router.get("/normalize")
+def normalize(tags: List[str] = Query(...)):
+    index = get_tag_index()
+    return {"data": [{"tag": t, "normalized": normalize_tag(t), "tag_id": index.vocab.id_of(t)} for t in tags]}
+
+
+@router.get("/orgs")
+def orgs_by_tags(tags: List[str] = Query(...), mode: str = Query("all", pattern="^(all|any)$")):
+    slugs = get_tag_index().org_slugs_for(tags, mode)
+    return {"count": len(slugs), "data": slugs}
+
+
+@router.get("/projects")
+def projects_by_tags(tags: List[str] = Query(...), mode: str = Query("all", pattern="^(all|any)$"),
+                     limit: int = Query(500, ge=1, le=5000)):
+    projects = get_tag_index().projects_for(tags, mode)
+    return {"count": len(projects), "data": projects[:limit]}
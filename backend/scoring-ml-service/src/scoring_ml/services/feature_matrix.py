@@ -0,0 +1,137 @@
+# backend/scoring-ml-service/src/scoring_ml/services/feature_matrix.py
+import threading
+import time
+import numpy as np
+from psycopg.rows import dict_row
+from database.connect import pooled_conn
+from scoring_ml.config import FEATURE_MATRIX_TTL
+from scoring_ml.services.sync_watch import last_org_sync
+from scoring_ml.services.tag_index import normalize_tag
+
+CANDIDATES_SQL = """
+    SELECT o.org_slug, o.name,
+           coalesce(o.tech_tags, '{}') || coalesce(o.technologies, '{}') AS tech,
+           coalesce(o.topic_tags, '{}') || coalesce(o.topics, '{}') AS topics,
+           coalesce(o.years_participated, '{}') AS years,
+           coalesce(r.stars, 0) AS stars,
+           coalesce(r.commits_recent, 0) AS commits_recent,
+           coalesce(r.open_issues, 0) AS open_issues,
+           coalesce(r.closed_issues, 0) AS closed_issues,
+           coalesce(r.good_first_issues, 0) AS good_first_issues,
+           coalesce(r.open_prs, 0) AS open_prs,
+           coalesce(r.merged_prs, 0) AS merged_prs
+    FROM orgs o
+    LEFT JOIN (
+        SELECT org_slug, sum(stars) AS stars, sum(commits_recent) AS commits_recent,
+               sum(open_issues) AS open_issues, sum(closed_issues) AS closed_issues,
+               sum(good_first_issues) AS good_first_issues,
+               sum(open_prs) AS open_prs, sum(merged_prs) AS merged_prs
+        FROM repos
+        GROUP BY org_slug
+    ) r ON r.org_slug = o.org_slug
+    ORDER BY o.org_slug
+"""
+
+
+def _minmax(x: np.ndarray):
+    lo, hi = x.min(initial=0.0), x.max(initial=0.0)
+    if hi - lo < 1e-9:
+        return np.zeros_like(x)
+    return (x - lo) / (hi - lo)
+
+
+def _one_hot(rows, vocab: dict):
+    """rows of tag lists -> L2-normalized float32 matrix over `vocab`."""
+    m = np.zeros((len(rows), len(vocab)), dtype=np.float32)
+    for i, tags in enumerate(rows):
+        for t in tags:
+            j = vocab.get(normalize_tag(t))
+            if j is not None:
+                m[i, j] = 1.0
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    np.divide(m, norms, out=m, where=norms > 0)
+    return m
+
+
+class FeatureMatrix:
+    """
+    Precomputed per-org features, one row per candidate org:
+      tech     (n, n_tech)   L2-normalized tech tags, for skill match
+      topics   (n, n_topic)  L2-normalized topic tags, for interest match
+      health, friendliness, history   (n,) each in [0, 1]
+    """
+
+    def __init__(self, rows, current_year: int = None, synced_at=None):
+        self.built_at = time.time()
+        self.synced_at = synced_at
+        self.slugs = np.array([r["org_slug"] for r in rows], dtype=object)
+        self.row_of = {slug: i for i, slug in enumerate(self.slugs)}
+        self.names = [r["name"] for r in rows]
+
+        tech_rows = [r["tech"] for r in rows]
+        topic_rows = [r["topics"] for r in rows]
+        self.tech_vocab = {t: i for i, t in enumerate(sorted({normalize_tag(t) for ts in tech_rows for t in ts}))}
+        self.topic_vocab = {t: i for i, t in enumerate(sorted({normalize_tag(t) for ts in topic_rows for t in ts}))}
+        self.tech = _one_hot(tech_rows, self.tech_vocab)
+        self.topics = _one_hot(topic_rows, self.topic_vocab)
+
+        col = lambda k: np.array([float(r[k]) for r in rows], dtype=np.float32)
+        stars, commits = col("stars"), col("commits_recent")
+        open_issues, closed_issues = col("open_issues"), col("closed_issues")
+        gfi, open_prs, merged_prs = col("good_first_issues"), col("open_prs"), col("merged_prs")
+
+        # repo health: recent activity, popularity, issues getting closed
+        close_ratio = closed_issues / np.maximum(open_issues + closed_issues, 1)
+        self.health = (_minmax(np.log1p(commits)) + _minmax(np.log1p(stars)) + close_ratio) / 3
+        # friendliness: good first issues and PRs actually getting merged
+        merge_ratio = merged_prs / np.maximum(merged_prs + open_prs, 1)
+        self.friendliness = (_minmax(np.log1p(gfi)) + merge_ratio) / 2
+
+        # GSoC history: how often, and whether they were in the latest program
+        years = [r["years"] or [] for r in rows]
+        latest = current_year or max((max(y) for y in years if y), default=0)
+        n_years = np.array([len(y) for y in years], dtype=np.float32)
+        recent = np.array([1.0 if latest in y else 0.0 for y in years], dtype=np.float32)
+        self.history = (_minmax(n_years) + recent) / 2
+
+    def __len__(self):
+        return len(self.slugs)
+
+    def rows_for(self, slugs):
+        """Row indices (sorted int array) of the given org slugs."""
+        return np.array(sorted(self.row_of[s] for s in slugs if s in self.row_of), dtype=np.int64)
+
+    def encode(self, tags, vocab: dict, width: int):
+        """User tags -> L2-normalized vector over an org vocabulary."""
+        v = np.zeros(width, dtype=np.float32)
+        for t in tags or []:
+            j = vocab.get(normalize_tag(t))
+            if j is not None:
+                v[j] = 1.0
+        n = np.linalg.norm(v)
+        return v / n if n > 0 else v
+
+
+def load_candidates():
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(CANDIDATES_SQL)
+            return cur.fetchall()
+
+
+_matrix = None
+_matrix_lock = threading.Lock()
+
+
+def get_feature_matrix(refresh: bool = False):
+    """
+    Process-wide FeatureMatrix, rebuilt after an org sync finished or
+    FEATURE_MATRIX_TTL seconds (repo metrics change without a sync).
+    """
+    global _matrix
+    with _matrix_lock:
+        synced_at = last_org_sync()
+        if (refresh or _matrix is None or synced_at != _matrix.synced_at
+                or time.time() - _matrix.built_at > FEATURE_MATRIX_TTL):
+            _matrix = FeatureMatrix(load_candidates(), synced_at=synced_at)
+        return _matrix
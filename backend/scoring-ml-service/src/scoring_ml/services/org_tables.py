@@ -0,0 +1,226 @@
+# backend/scoring-ml-service/src/scoring_ml/services/org_tables.py
+import threading
+import time
+import traceback
+import numpy as np
+from psycopg.rows import dict_row
+from database.connect import pooled_conn
+from scoring_ml.config import SIMILAR_ORGS_TOP_N, SYNC_CHECK_INTERVAL
+from scoring_ml.services.feature_matrix import FeatureMatrix, load_candidates
+
+# sync_status row recording when the tables were last materialized
+TABLES_STATUS = "org_tables"
+
+# any constant works; it only has to be the same in every worker
+ADVISORY_LOCK_ID = 0x6F72675F74626C73
+
+PROJECT_COUNTS_SQL = "SELECT org_slug, year, count(*) AS n FROM org_projects GROUP BY org_slug, year"
+
+
+def similar_orgs(fm: FeatureMatrix, top_n: int, block: int = 512):
+    """
+    [(org_slug, rank, similar_slug, score)] from cosine similarity of the
+    concatenated tech / topic vectors. Similarities are computed in row
+    blocks so memory stays at block x n.
+    """
+    x = np.hstack([fm.tech, fm.topics])
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    np.divide(x, norms, out=x, where=norms > 0)
+
+    n = len(fm)
+    k = min(top_n, n - 1)
+    out = []
+    if k <= 0:
+        return out
+    for start in range(0, n, block):
+        sims = x[start:start + block] @ x.T
+        rows = np.arange(sims.shape[0])
+        sims[rows, rows + start] = -1.0  # never similar to itself
+        best = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(sims, best, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        best = np.take_along_axis(best, order, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        for i in rows:
+            slug = fm.slugs[start + i]
+            for rank, (j, score) in enumerate(zip(best[i], best_scores[i]), start=1):
+                if score <= 0:
+                    break
+                out.append((slug, rank, fm.slugs[j], float(score)))
+    return out
+
+
+def _streak(years: set, year: int):
+    s = 0
+    while year - s in years:
+        s += 1
+    return s
+
+
+def _return_features(years: set, projects: dict, year: int):
+    """Features of an org as of `year` (only data up to that year)."""
+    recent = sum(1 for y in range(year - 4, year + 1) if y in years) / 5
+    n_now = projects.get(year, 0)
+    n_prev = projects.get(year - 1, 0)
+    return [
+        1.0,                                 # bias
+        min(_streak(years, year), 8) / 8,    # consecutive years up to `year`
+        recent,                              # share of the last five programs
+        1.0 if year in years else 0.0,       # took part this year
+        np.log1p(n_now),                     # projects this year
+        np.log1p(n_now) - np.log1p(n_prev),  # growth in projects
+    ]
+
+
+def _fit_logistic(x: np.ndarray, y: np.ndarray, steps: int = 500, lr: float = 0.5, l2: float = 1e-3):
+    """Plain batch gradient descent; a handful of features needs nothing fancier."""
+    w = np.zeros(x.shape[1])
+    for _ in range(steps):
+        p = 1 / (1 + np.exp(-(x @ w)))
+        w -= lr * (x.T @ (p - y) / len(y) + l2 * w)
+    return w
+
+
+def return_scores(org_years: dict, project_counts: dict):
+    """
+    [(org_slug, probability, streak, years_count, last_year, projects_last_year)].
+    A logistic model is trained on past programs (features as of year Y,
+    label = took part in Y + 1) and applied as of the latest program.
+    """
+    all_years = sorted({y for ys in org_years.values() for y in ys})
+    if not all_years:
+        return []
+    latest = all_years[-1]
+    first = all_years[0]
+
+    x, y = [], []
+    for slug, years in org_years.items():
+        projects = project_counts.get(slug, {})
+        for year in range(first, latest):
+            if not any(py <= year for py in years):
+                continue  # org did not exist yet
+            x.append(_return_features(years, projects, year))
+            y.append(1.0 if year + 1 in years else 0.0)
+
+    out = []
+    if x and 0 < sum(y) < len(y):
+        w = _fit_logistic(np.array(x), np.array(y))
+    else:
+        w = None  # one program only (or one class): fall back to the raw streak share
+    for slug, years in org_years.items():
+        projects = project_counts.get(slug, {})
+        f = np.array(_return_features(years, projects, latest))
+        prob = 1 / (1 + np.exp(-(f @ w))) if w is not None else f[2]
+        out.append((
+            slug, float(prob), _streak(years, latest), len(years),
+            max(years) if years else None, projects.get(latest, 0)
+        ))
+    return out
+
+
+def materialize_org_tables():
+    """
+    Recompute org_similarity and org_return_scores and replace both in one
+    transaction, so readers never see a half-written table. Returns row
+    counts, or None if another worker holds the job lock.
+    """
+    started = time.perf_counter()
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_try_advisory_xact_lock(%s)", (ADVISORY_LOCK_ID,))
+            if not cur.fetchone()[0]:
+                return None
+
+            rows = load_candidates()
+            fm = FeatureMatrix(rows)
+            similar = similar_orgs(fm, SIMILAR_ORGS_TOP_N)
+
+            cur.execute(PROJECT_COUNTS_SQL)
+            project_counts = {}
+            for slug, year, n in cur.fetchall():
+                project_counts.setdefault(slug, {})[year] = n
+            org_years = {r["org_slug"]: set(r["years"] or []) for r in rows}
+            scores = return_scores(org_years, project_counts)
+
+            cur.execute("DELETE FROM org_similarity")
+            cur.executemany(
+                "INSERT INTO org_similarity (org_slug, rank, similar_slug, score) VALUES (%s,%s,%s,%s)",
+                similar
+            )
+            cur.execute("DELETE FROM org_return_scores")
+            cur.executemany(
+                """
+                INSERT INTO org_return_scores
+                (org_slug, probability, streak, years_count, last_year, projects_last_year, computed_at)
+                VALUES (%s,%s,%s,%s,%s,%s,NOW())
+                """,
+                scores
+            )
+            cur.execute(
+                """
+                INSERT INTO sync_status (name, last_synced) VALUES (%s, NOW())
+                ON CONFLICT (name) DO UPDATE SET last_synced = NOW()
+                """,
+                (TABLES_STATUS,)
+            )
+    stats = {
+        "orgs": len(rows),
+        "similarity_rows": len(similar),
+        "return_scores": len(scores),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+    print(f"Org tables materialized: {stats}")
+    return stats
+
+
+def tables_stale():
+    """True when an org sync finished after the tables were last built."""
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT name, last_synced FROM sync_status WHERE name IN ('org_sync', %s)",
+                (TABLES_STATUS,)
+            )
+            status = dict(cur.fetchall())
+    synced, built = status.get("org_sync"), status.get(TABLES_STATUS)
+    return synced is not None and (built is None or built < synced)
+
+
+def _watch(stop: threading.Event):
+    while not stop.wait(SYNC_CHECK_INTERVAL):
+        try:
+            if tables_stale():
+                materialize_org_tables()
+        except Exception:
+            print("Org table job failed.")
+            traceback.print_exc()
+
+
+def start_table_watcher():
+    """Background thread that materializes the tables after each org sync."""
+    stop = threading.Event()
+    threading.Thread(target=_watch, args=(stop,), daemon=True, name="org-tables").start()
+    return stop
+
+
+def get_similar_orgs(slug: str, limit: int):
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                SELECT s.rank, s.similar_slug AS org_slug, o.name, s.score
+                FROM org_similarity s
+                LEFT JOIN orgs o ON o.org_slug = s.similar_slug
+                WHERE s.org_slug = %s AND s.rank <= %s
+                ORDER BY s.rank
+                """,
+                (slug, limit)
+            )
+            return cur.fetchall()
+
+
+def get_return_score(slug: str):
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute("SELECT * FROM org_return_scores WHERE org_slug = %s", (slug,))
+            return cur.fetchone()
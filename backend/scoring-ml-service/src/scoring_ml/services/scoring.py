@@ -0,0 +1,74 @@
+# backend/scoring-ml-service/src/scoring_ml/services/scoring.py
+import numpy as np
+from psycopg.rows import dict_row
+from database.connect import pooled_conn
+from scoring_ml.config import (
+    WEIGHT_SKILL, WEIGHT_INTEREST, WEIGHT_HEALTH, WEIGHT_FRIENDLINESS, WEIGHT_HISTORY
+)
+from scoring_ml.services.feature_matrix import FeatureMatrix
+
+
+def score_all(fm: FeatureMatrix, languages, interests):
+    """
+    Score every candidate in one vectorized pass. Returns a dict of
+    (n,) float32 arrays: the total score and each component.
+    """
+    u_tech = fm.encode(languages, fm.tech_vocab, fm.tech.shape[1])
+    u_topic = fm.encode(interests, fm.topic_vocab, fm.topics.shape[1])
+    # cosine similarity: rows and user vectors are both L2-normalized
+    skill = fm.tech @ u_tech
+    interest = fm.topics @ u_topic
+    total = (WEIGHT_SKILL * skill
+             + WEIGHT_INTEREST * interest
+             + WEIGHT_HEALTH * fm.health
+             + WEIGHT_FRIENDLINESS * fm.friendliness
+             + WEIGHT_HISTORY * fm.history)
+    return {
+        "score": total,
+        "skill_match": skill,
+        "interest_match": interest,
+        "health": fm.health,
+        "friendliness": fm.friendliness,
+        "gsoc_history": fm.history,
+    }
+
+
+def top_k(scores: np.ndarray, k: int, candidates: np.ndarray = None):
+    """
+    Indices of the k best scores, best first. argpartition is O(n); only
+    the k winners get sorted. `candidates` optionally restricts the pick
+    to a subset of row indices.
+    """
+    if candidates is not None:
+        sub = top_k(scores[candidates], k)
+        return candidates[sub]
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.array([], dtype=np.int64)
+    idx = np.argpartition(-scores, k - 1)[:k]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def recommend(fm: FeatureMatrix, languages, interests, k: int = 10, candidates=None):
+    """
+    candidates: optional org slugs (e.g. from the tag index) to pick from;
+    the scoring pass is still vectorized over the whole matrix.
+    """
+    parts = score_all(fm, languages, interests)
+    rows = fm.rows_for(candidates) if candidates is not None else None
+    best = top_k(parts["score"], k, rows)
+    return [
+        {
+            "org_slug": fm.slugs[i],
+            "name": fm.names[i],
+            **{name: round(float(arr[i]), 4) for name, arr in parts.items()},
+        }
+        for i in best
+    ]
+
+
+def get_user_profile(user_id: int):
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute("SELECT id, languages, interests FROM users WHERE id = %s", (user_id,))
+            return cur.fetchone()
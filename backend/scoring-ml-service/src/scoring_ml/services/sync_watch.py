@@ -0,0 +1,28 @@
+# backend/scoring-ml-service/src/scoring_ml/services/sync_watch.py
+import threading
+import time
+from database.connect import pooled_conn
+from scoring_ml.config import SYNC_CHECK_INTERVAL
+
+_lock = threading.Lock()
+_checked_at = 0.0
+_last_synced = None
+
+
+def last_org_sync():
+    """
+    sync_status.last_synced of the org sync, re-read at most every
+    SYNC_CHECK_INTERVAL seconds. In-memory indexes compare it with the
+    value they were built at to know when to rebuild.
+    """
+    global _checked_at, _last_synced
+    with _lock:
+        if time.monotonic() - _checked_at < SYNC_CHECK_INTERVAL:
+            return _last_synced
+        with pooled_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT last_synced FROM sync_status WHERE name = 'org_sync'")
+                row = cur.fetchone()
+        _last_synced = row[0] if row else None
+        _checked_at = time.monotonic()
+        return _last_synced
@@ -0,0 +1,142 @@
+# backend/scoring-ml-service/src/scoring_ml/services/tag_index.py
+import re
+import threading
+import numpy as np
+from psycopg.rows import dict_row
+from database.connect import pooled_conn
+from scoring_ml.services.sync_watch import last_org_sync
+
+# spellings that mean the same technology / topic
+TAG_ALIASES = {
+    "python3": "python",
+    "py": "python",
+    "js": "javascript",
+    "es6": "javascript",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "ts": "typescript",
+    "golang": "go",
+    "cpp": "c++",
+    "c/c++": "c++",
+    "postgres": "postgresql",
+    "k8s": "kubernetes",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+}
+
+# trailing versions written as a separate word: "python 3", "qt 5.15", "java v17"
+VERSION_SUFFIX_RE = re.compile(r"\s+v?\d+(\.\d+)*$")
+
+
+def normalize_tag(tag: str):
+    """'Python 3 ' -> 'python', 'JS' -> 'javascript'."""
+    t = " ".join((tag or "").lower().split())
+    t = VERSION_SUFFIX_RE.sub("", t)
+    return TAG_ALIASES.get(t, t)
+
+
+class TagVocabulary:
+    """Normalized tag <-> dense integer id (ids follow sorted tag order)."""
+
+    def __init__(self, tags):
+        self.names = sorted({normalize_tag(t) for t in tags if t and normalize_tag(t)})
+        self.ids = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    def id_of(self, tag: str):
+        return self.ids.get(normalize_tag(tag))
+
+
+class InvertedIndex:
+    """tag id -> sorted int32 array of item positions, with AND / OR lookups."""
+
+    def __init__(self, item_tags, vocab: TagVocabulary):
+        postings = [[] for _ in range(len(vocab))]
+        for pos, tags in enumerate(item_tags):
+            for tag_id in {vocab.id_of(t) for t in tags or []}:
+                if tag_id is not None:
+                    postings[tag_id].append(pos)
+        # positions are appended in order, so each list is already sorted
+        self.postings = [np.array(p, dtype=np.int32) for p in postings]
+        self.vocab = vocab
+
+    def _lists(self, tags):
+        ids = {self.vocab.id_of(t) for t in tags}
+        return [self.postings[i] if i is not None else np.array([], dtype=np.int32) for i in ids]
+
+    def match_all(self, tags):
+        lists = sorted(self._lists(tags), key=len)  # intersect smallest first
+        if not lists:
+            return np.array([], dtype=np.int32)
+        out = lists[0]
+        for p in lists[1:]:
+            if not len(out):
+                break
+            out = np.intersect1d(out, p, assume_unique=True)
+        return out
+
+    def match_any(self, tags):
+        lists = self._lists(tags)
+        if not lists:
+            return np.array([], dtype=np.int32)
+        return np.unique(np.concatenate(lists))
+
+
+class TagIndex:
+    """Inverted indexes over org tags and project tags, built from the DB."""
+
+    def __init__(self, orgs, projects, synced_at=None):
+        self.synced_at = synced_at
+        self.org_slugs = np.array([o["org_slug"] for o in orgs], dtype=object)
+        self.project_ids = np.array([p["project_id"] for p in projects], dtype=object)
+        self.project_orgs = np.array([p["org_slug"] for p in projects], dtype=object)
+
+        org_tags = [(o["tech"] or []) + (o["topics"] or []) for o in orgs]
+        project_tags = [(p["tech_tags"] or []) + (p["topic_tags"] or []) for p in projects]
+        self.vocab = TagVocabulary(t for tags in org_tags + project_tags for t in tags)
+        self.orgs = InvertedIndex(org_tags, self.vocab)
+        self.projects = InvertedIndex(project_tags, self.vocab)
+
+    def _match(self, index: InvertedIndex, tags, mode: str):
+        return index.match_all(tags) if mode == "all" else index.match_any(tags)
+
+    def org_slugs_for(self, tags, mode: str = "all"):
+        return self.org_slugs[self._match(self.orgs, tags, mode)].tolist()
+
+    def projects_for(self, tags, mode: str = "all"):
+        pos = self._match(self.projects, tags, mode)
+        return [{"project_id": pid, "org_slug": org}
+                for pid, org in zip(self.project_ids[pos], self.project_orgs[pos])]
+
+
+def load_tag_index():
+    synced_at = last_org_sync()
+    with pooled_conn() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                SELECT org_slug,
+                       coalesce(tech_tags, '{}') || coalesce(technologies, '{}') AS tech,
+                       coalesce(topic_tags, '{}') || coalesce(topics, '{}') AS topics
+                FROM orgs ORDER BY org_slug
+                """
+            )
+            orgs = cur.fetchall()
+            cur.execute("SELECT project_id, org_slug, tech_tags, topic_tags FROM org_projects ORDER BY project_id")
+            projects = cur.fetchall()
+    return TagIndex(orgs, projects, synced_at)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_tag_index(refresh: bool = False):
+    """Process-wide TagIndex, rebuilt whenever an org sync finished since it was built."""
+    global _index
+    with _index_lock:
+        if refresh or _index is None or last_org_sync() != _index.synced_at:
+            _index = load_tag_index()
+        return _index
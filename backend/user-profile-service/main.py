@@ -1,7 +1,17 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from backend.database.connect import get_async_pool, close_async_pool
 from .routes.users import router as user_router
 
-app = FastAPI(title="User Profile Service")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await get_async_pool()  # open the pool before the first request
+    yield
+    await close_async_pool()
+
+
+app = FastAPI(title="User Profile Service", lifespan=lifespan)
 
 app.include_router(user_router)
 
@@ -1,61 +1,140 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Header
-from src.schemas import UserCreate, UserOut, UserLogin, TokenResponse
-from services.users_db_ops import create_user, get_user_by_id, get_user_by_username, update_user
-import bcrypt
+import os
+import json
+from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+from src.schemas import UserCreate, UserOut, UserLogin, TokenResponse, UserBatchRequest
+from services.users_db_ops import (
+    create_user, get_user_by_id, get_user_by_username, update_user, DuplicateUser,
+    stream_users_by_ids, find_users_by_skill
+)
+from services.passwords import (
+    hash_password, verify_password, password_pool_stats, PasswordQueueFull, PASSWORD_RETRY_AFTER
+)
+from services.token_cache import token_cache
+from services.auth_deps import current_user
 from auth import create_access_token, decode_token
 
 router = APIRouter(prefix="/user", tags=["User Profile"])
 
-@router.post("/create", response_model=UserOut)
-def register_user(payload: UserCreate):
-    # check if username already exists
-    existing = get_user_by_username(payload.username)
-    if existing:
-        raise HTTPException(status_code=400, detail="username already exists")
-    user = create_user(
-        username=payload.username,
-        email=payload.email,
-        password=payload.password,
-        github_username=payload.github_username,
-        languages=payload.languages,
-        experience_level=payload.experience_level,
-        interests=payload.interests
+# most ids accepted by one POST /user/batch
+USER_BATCH_LIMIT = int(os.getenv("USER_BATCH_LIMIT", "10000"))
+
+
+def _shed():
+    # password pool is saturated: ask the client to back off instead of queueing
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="too many password requests, retry shortly",
+        headers={"Retry-After": str(PASSWORD_RETRY_AFTER)}
     )
+
+
+@router.post("/create", response_model=UserOut)
+async def register_user(payload: UserCreate):
+    try:
+        password_hash = await hash_password(payload.password)
+    except PasswordQueueFull:
+        raise _shed()
+    # the unique constraints reject a taken username / email in the insert itself
+    try:
+        user = await create_user(
+            username=payload.username,
+            email=payload.email,
+            password_hash=password_hash,
+            github_username=payload.github_username,
+            languages=payload.languages,
+            experience_level=payload.experience_level,
+            interests=payload.interests
+        )
+    except DuplicateUser as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not user:
         raise HTTPException(status_code=500, detail="failed to create user")
     return user
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: UserLogin):
-    user = get_user_by_username(payload.username)
+async def login(payload: UserLogin):
+    user = await get_user_by_username(payload.username)
     if not user:
         raise HTTPException(status_code=401, detail="invalid credentials")
-    password_hash = user.get("password_hash")
-    if not password_hash or not bcrypt.checkpw(payload.password.encode('utf-8'), password_hash.encode('utf-8')):
+    try:
+        ok = await verify_password(payload.password, user.get("password_hash"))
+    except PasswordQueueFull:
+        raise _shed()
+    if not ok:
         raise HTTPException(status_code=401, detail="invalid credentials")
     token = create_access_token({"sub": str(user["id"]), "username": user["username"]})
     return {"access_token": token, "token_type": "bearer"}
 
 
+# declared before /{user_id} so the paths aren't parsed as an id
+@router.get("/password-pool/stats")
+def password_pool():
+    return password_pool_stats()
+
+
+@router.get("/auth-cache/stats")
+def auth_cache():
+    return token_cache.stats()
+
+
+@router.post("/batch")
+async def get_users_batch(payload: UserBatchRequest):
+    """Profiles of many users in one query, streamed as NDJSON (one user per line)."""
+    ids = sorted(set(payload.ids))
+    if len(ids) > USER_BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"at most {USER_BATCH_LIMIT} ids per batch")
+
+    async def lines():
+        async for row in stream_users_by_ids(ids):
+            yield json.dumps(row, default=str) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/search", response_model=List[UserOut])
+async def search_users(
+    languages: List[str] = Query(None),
+    interests: List[str] = Query(None),
+    match: str = Query("any", pattern="^(any|all)$"),
+    limit: int = Query(100, ge=1, le=1000),
+    after_id: int = Query(0, ge=0)
+):
+    if not languages and not interests:
+        raise HTTPException(status_code=400, detail="give languages and/or interests")
+    return await find_users_by_skill(languages, interests, match, limit, after_id)
+
+
+@router.get("/me", response_model=UserOut)
+async def get_me(user: dict = Depends(current_user)):
+    return user
+
+
 @router.get("/{user_id}", response_model=UserOut)
-def get_user(user_id: int, authorization: str = Header(None)):
+async def get_user(user_id: int, authorization: str = Header(None)):
     # optional: verify token header "Authorization: Bearer <token>"
     # For now, we allow public read; add token checks if you want protected endpoints
-    user = get_user_by_id(user_id)
+    user = await get_user_by_id(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="user not found")
     return user
 
 
 @router.patch("/{user_id}", response_model=UserOut)
-def patch_user(user_id: int, payload: dict):
+async def patch_user(user_id: int, payload: dict, user: dict = Depends(current_user)):
+    if user["id"] != user_id:
+        raise HTTPException(status_code=403, detail="can only update your own profile")
     # payload is a dict with allowed keys; you can validate with pydantic if desired
     allowed = {"email", "github_username", "languages", "experience_level", "interests"}
     updates = {k: v for k, v in payload.items() if k in allowed}
     if not updates:
         raise HTTPException(status_code=400, detail="no valid fields to update")
-    user = update_user(user_id, **updates)
+    try:
+        user = await update_user(user_id, **updates)
+    except DuplicateUser as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not user:
         raise HTTPException(status_code=404, detail="user not found or not updated")
     return user
\ No newline at end of file
@@ -0,0 +1,40 @@
+# services/auth_deps.py
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from auth import decode_token
+from services.token_cache import token_cache
+from services.users_db_ops import get_user_by_id
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def _unauthorized(detail: str):
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+async def current_user(credentials: HTTPAuthorizationCredentials = Depends(_bearer)):
+    """
+    Dependency returning the user row of a valid bearer token.
+    Cached tokens are answered from memory; otherwise the signature and
+    exp are verified and the user is loaded once, then cached.
+    """
+    if credentials is None:
+        raise _unauthorized("missing bearer token")
+    token = credentials.credentials
+
+    user = token_cache.get(token)
+    if user is not None:
+        return user
+
+    claims = decode_token(token)
+    if not claims or "sub" not in claims or "exp" not in claims:
+        raise _unauthorized("invalid or expired token")
+    user = await get_user_by_id(int(claims["sub"]))
+    if not user:
+        raise _unauthorized("user no longer exists")
+    token_cache.put(token, user, claims["exp"])
+    return user
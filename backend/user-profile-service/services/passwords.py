@@ -0,0 +1,106 @@
+# services/passwords.py
+import os
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+import bcrypt
+
+load_dotenv()
+
+# bcrypt cost factor: each +1 doubles the CPU time of a hash / check
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# threads doing password work (bcrypt releases the GIL while hashing)
+PASSWORD_WORKERS = int(os.getenv("PASSWORD_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+# running + queued password jobs allowed before new ones are shed
+PASSWORD_QUEUE_LIMIT = int(os.getenv("PASSWORD_QUEUE_LIMIT", "64"))
+# Retry-After (seconds) sent with a shed request
+PASSWORD_RETRY_AFTER = int(os.getenv("PASSWORD_RETRY_AFTER", "2"))
+
+# separate from the default threadpool, so a login spike can't starve
+# the sync routes (and DB calls) that FastAPI runs there
+_executor = ThreadPoolExecutor(max_workers=PASSWORD_WORKERS, thread_name_prefix="bcrypt")
+_lock = threading.Lock()
+_stats = {
+    "in_flight": 0,
+    "max_in_flight": 0,
+    "submitted": 0,
+    "completed": 0,
+    "rejected": 0,
+    "wait_seconds_total": 0.0,
+    "run_seconds_total": 0.0,
+}
+
+
+class PasswordQueueFull(Exception):
+    """Raised instead of queueing when PASSWORD_QUEUE_LIMIT jobs are pending."""
+
+
+def _timed(fn, args, enqueued: float):
+    started = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        done = time.perf_counter()
+        with _lock:
+            _stats["wait_seconds_total"] += started - enqueued
+            _stats["run_seconds_total"] += done - started
+
+
+async def _run(fn, *args):
+    with _lock:
+        if _stats["in_flight"] >= PASSWORD_QUEUE_LIMIT:
+            _stats["rejected"] += 1
+            raise PasswordQueueFull()
+        _stats["in_flight"] += 1
+        _stats["submitted"] += 1
+        _stats["max_in_flight"] = max(_stats["max_in_flight"], _stats["in_flight"])
+    try:
+        future = _executor.submit(_timed, fn, args, time.perf_counter())
+        return await asyncio.wrap_future(future)
+    finally:
+        with _lock:
+            _stats["in_flight"] -= 1
+            _stats["completed"] += 1
+
+
+def _secret(password: str):
+    # bcrypt only uses the first 72 bytes; bcrypt>=5 raises instead of
+    # truncating, so cut explicitly to keep existing hashes verifiable
+    return password.encode("utf-8")[:72]
+
+
+def _hash(password: str):
+    return bcrypt.hashpw(_secret(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
+
+
+def _check(password: str, password_hash: str):
+    return bcrypt.checkpw(_secret(password), password_hash.encode("utf-8"))
+
+
+async def hash_password(password: str):
+    """bcrypt hash of `password`, computed on the password pool."""
+    return await _run(_hash, password)
+
+
+async def verify_password(password: str, password_hash: str):
+    """Check `password` against a stored bcrypt hash on the password pool."""
+    if not password_hash:
+        return False
+    return await _run(_check, password, password_hash)
+
+
+def password_pool_stats():
+    with _lock:
+        stats = dict(_stats)
+    done = max(stats["completed"], 1)
+    return {
+        **stats,
+        "workers": PASSWORD_WORKERS,
+        "queue_limit": PASSWORD_QUEUE_LIMIT,
+        "bcrypt_rounds": BCRYPT_ROUNDS,
+        "queued": max(stats["in_flight"] - PASSWORD_WORKERS, 0),
+        "avg_wait_ms": round(1000 * stats["wait_seconds_total"] / done, 2),
+        "avg_run_ms": round(1000 * stats["run_seconds_total"] / done, 2),
+    }
@@ -0,0 +1,82 @@
+# services/token_cache.py
+import os
+import threading
+import time
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# verified tokens kept in memory (least recently used evicted first)
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "10000"))
+# upper bound on how long a cached user row is served; other workers don't
+# see this worker's invalidations, so rows can't live until token expiry
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "300"))
+
+
+class TokenCache:
+    """
+    Bounded LRU of bearer token -> user row, kept until the token's exp
+    (or AUTH_CACHE_TTL, whichever is first). A hit skips both the JWT
+    signature check and the user query.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()   # token -> (user, expires_at)
+        self._tokens_by_user = {}       # user id -> {token}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str):
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    self._drop(token)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, token: str, user: dict, exp: float):
+        with self._lock:
+            self._drop(token)
+            self._entries[token] = (user, min(exp, time.time() + self.ttl))
+            self._tokens_by_user.setdefault(user["id"], set()).add(token)
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int):
+        """Forget every cached token of a user (their row changed)."""
+        with self._lock:
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._drop(token)
+
+    def _drop(self, token: str):
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        tokens = self._tokens_by_user.get(entry[0]["id"])
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[entry[0]["id"]]
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else None,
+            }
+
+
+token_cache = TokenCache(AUTH_CACHE_SIZE, AUTH_CACHE_TTL)
@@ -1,82 +1,136 @@
 # services/user_db_ops.py
-from backend.database.connect import get_conn
+from backend.database.connect import async_pooled_conn
+from psycopg import errors
 from psycopg.rows import dict_row
-import bcrypt  # or use passlib if preferred
-import json
+from services.token_cache import token_cache
 
-# NOTE: use bcrypt.hashpw/ checkpw (bcrypt library) OR use passlib for convenience.
-# Example below uses bcrypt (sync).
+# NOTE: passwords are hashed by the caller (services/passwords.py runs
+# bcrypt on its own pool); only the hash ever reaches this module.
 
-def create_user(username: str, email: str, password: str, github_username: str = None,
-                languages: list = None, experience_level: str = None, interests: list = None):
-    pw_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+USER_COLUMNS = "id, username, email, github_username, languages, experience_level, interests, created_at"
+
+# columns update_user may set, in the fixed order they appear in the
+# statement: the same set of fields always yields the same SQL text, so
+# the connection's prepared statement is reused
+UPDATABLE_COLUMNS = ("email", "github_username", "languages", "experience_level", "interests")
+
+
+class DuplicateUser(Exception):
+    """The username or email is already taken (field says which)."""
+
+    def __init__(self, field: str):
+        super().__init__(f"{field} already exists")
+        self.field = field
+
+
+def _duplicate_field(e: errors.UniqueViolation):
+    constraint = e.diag.constraint_name or ""
+    return "email" if "email" in constraint else "username"
+
+
+async def create_user(username: str, email: str, password_hash: str, github_username: str = None,
+                      languages: list = None, experience_level: str = None, interests: list = None):
+    """
+    Insert a user. The unique constraints do the duplicate check, so this
+    is a single round trip; a taken username / email raises DuplicateUser.
+    """
     languages_arr = languages or []
     interests_arr = interests or []
 
-    conn = get_conn()
     try:
-        with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(
-                """
-                INSERT INTO users
-                (username, email, password_hash, github_username, languages, experience_level, interests)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                RETURNING id, username, email, github_username, languages, experience_level, interests, created_at;
-                """,
-                (username, email, pw_hash, github_username, languages_arr, experience_level, interests_arr)
-            )
-            user = cur.fetchone()
-            conn.commit()
-            return user
-    finally:
-        conn.close()
+        async with async_pooled_conn() as conn:
+            async with conn.cursor(row_factory=dict_row) as cur:
+                await cur.execute(
+                    f"""
+                    INSERT INTO users
+                    (username, email, password_hash, github_username, languages, experience_level, interests)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    RETURNING {USER_COLUMNS};
+                    """,
+                    (username, email, password_hash, github_username, languages_arr, experience_level, interests_arr)
+                )
+                return await cur.fetchone()
+    except errors.UniqueViolation as e:
+        raise DuplicateUser(_duplicate_field(e)) from e
 
 
-def get_user_by_id(user_id: int):
-    conn = get_conn()
-    try:
-        with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(
-                "SELECT id, username, email, github_username, languages, experience_level, interests, created_at FROM users WHERE id = %s",
-                (user_id,)
-            )
-            return cur.fetchone()
-    finally:
-        conn.close()
+async def get_user_by_id(user_id: int):
+    async with async_pooled_conn() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(f"SELECT {USER_COLUMNS} FROM users WHERE id = %s", (user_id,), prepare=True)
+            return await cur.fetchone()
 
 
-def get_user_by_username(username: str):
-    conn = get_conn()
-    try:
-        with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(
+async def get_user_by_username(username: str):
+    async with async_pooled_conn() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(
                 "SELECT id, username, email, password_hash FROM users WHERE username = %s",
-                (username,)
+                (username,),
+                prepare=True
+            )
+            return await cur.fetchone()
+
+
+async def stream_users_by_ids(ids):
+    """
+    Async generator over the profiles of `ids` (ordered by id), fetched
+    with one `= ANY` query and streamed row by row, so a large batch isn't
+    buffered in memory. Unknown ids are simply absent.
+    """
+    async with async_pooled_conn() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            async for row in cur.stream(
+                f"SELECT {USER_COLUMNS} FROM users WHERE id = ANY(%s) ORDER BY id",
+                (list(ids),)
+            ):
+                yield row
+
+
+async def find_users_by_skill(languages: list = None, interests: list = None,
+                              match: str = "any", limit: int = 100, after_id: int = 0):
+    """
+    Users whose languages / interests overlap (match='any', &&) or contain
+    (match='all', @>) the given lists. Both operators use the GIN indexes;
+    pages are keyed on id.
+    """
+    op = "@>" if match == "all" else "&&"
+    where = ["id > %s"]
+    params = [after_id]
+    if languages:
+        where.append(f"languages {op} %s::text[]")
+        params.append(languages)
+    if interests:
+        where.append(f"interests {op} %s::text[]")
+        params.append(interests)
+    params.append(limit)
+    async with async_pooled_conn() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(
+                f"SELECT {USER_COLUMNS} FROM users WHERE {' AND '.join(where)} ORDER BY id LIMIT %s",
+                params
             )
-            return cur.fetchone()
-    finally:
-        conn.close()
+            return await cur.fetchall()
 
 
-def update_user(user_id: int, **fields):
+async def update_user(user_id: int, **fields):
     # fields may include: email, github_username, languages (list), experience_level, interests (list)
-    allowed = {"email", "github_username", "languages", "experience_level", "interests"}
-    set_parts = []
-    values = []
-    for k, v in fields.items():
-        if k in allowed:
-            set_parts.append(f"{k} = %s")
-            values.append(v)
-    if not set_parts:
+    columns = [k for k in UPDATABLE_COLUMNS if k in fields]
+    if not columns:
         return None
-    values.append(user_id)
-    query = f"UPDATE users SET {', '.join(set_parts)}, updated_at = NOW() WHERE id = %s RETURNING id, username, email, github_username, languages, experience_level, interests, updated_at"
-    conn = get_conn()
+    set_parts = ", ".join(f"{k} = %s" for k in columns)
+    values = [fields[k] for k in columns] + [user_id]
+    query = (
+        f"UPDATE users SET {set_parts}, updated_at = NOW() WHERE id = %s "
+        "RETURNING id, username, email, github_username, languages, experience_level, interests, updated_at"
+    )
     try:
-        with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(query, tuple(values))
-            user = cur.fetchone()
-            conn.commit()
-            return user
-    finally:
-        conn.close()
+        async with async_pooled_conn() as conn:
+            async with conn.cursor(row_factory=dict_row) as cur:
+                await cur.execute(query, values, prepare=True)
+                user = await cur.fetchone()
+    except errors.UniqueViolation as e:
+        raise DuplicateUser(_duplicate_field(e)) from e
+    # cached auth lookups hold the old row
+    token_cache.invalidate_user(user_id)
+    return user
@@ -1,8 +1,18 @@
 # main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from backend.database.connect import get_async_pool, close_async_pool
 from routes.users import router as users_router
 
-app = FastAPI(title="user-profile-service")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await get_async_pool()  # open the pool before the first request
+    yield
+    await close_async_pool()
+
+
+app = FastAPI(title="user-profile-service", lifespan=lifespan)
 
 app.include_router(users_router)
 
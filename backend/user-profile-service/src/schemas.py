@@ -1,4 +1,5 @@
 # schemas.py
+from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -19,7 +20,7 @@ class UserOut(BaseModel):
     languages: Optional[List[str]] = []
     experience_level: Optional[str] = None
     interests: Optional[List[str]] = []
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
 
 class UserLogin(BaseModel):
     username: str
@@ -28,3 +29,6 @@ class UserLogin(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
+
+class UserBatchRequest(BaseModel):
+    ids: List[int]